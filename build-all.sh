@@ -5,6 +5,7 @@
 # Options:
 #   --quick    Skip Airtable sync (faster for local testing)
 #   --test     Run visual regression tests after build
+#   --parallel Run independent build steps concurrently (scripts/build/orchestrate.py)
 #   --help     Show this help message
 
 set -e  # Exit on any error
@@ -12,6 +13,7 @@ set -e  # Exit on any error
 # Parse command line arguments
 SKIP_AIRTABLE=false
 RUN_VISUAL_TESTS=false
+PARALLEL=false
 for arg in "$@"; do
     case $arg in
         --quick)
@@ -22,6 +24,10 @@ for arg in "$@"; do
             RUN_VISUAL_TESTS=true
             shift
             ;;
+        --parallel)
+            PARALLEL=true
+            shift
+            ;;
         --help)
             echo "City of Rivergrove - Master Build Script"
             echo ""
@@ -30,6 +36,7 @@ for arg in "$@"; do
             echo "Options:"
             echo "  --quick    Skip Airtable sync (faster for local testing)"
             echo "  --test     Run visual regression tests after build"
+            echo "  --parallel Run independent steps concurrently on all CPU cores"
             echo "  --help     Show this help message"
             echo ""
             echo "This script performs a complete rebuild of the mdBook site with all"
@@ -60,6 +67,43 @@ echo "🚀 City of Rivergrove - Complete Build"
 echo "======================================"
 echo ""
 
+# Parallel mode: the orchestrator runs the same steps as below, declared with
+# their inputs/outputs, so independent steps (syncs, validators, CSS) overlap.
+if [ "$PARALLEL" = true ]; then
+    ORCHESTRATE_ARGS=()
+    if [ "$SKIP_AIRTABLE" = true ]; then
+        ORCHESTRATE_ARGS+=(--quick)
+    fi
+    ./scripts/build/orchestrate.py "${ORCHESTRATE_ARGS[@]}" || exit $?
+    echo ""
+fi
+
+# Sequential build (default). Keep these steps in sync with the step
+# declarations in scripts/build/orchestrate.py.
+if [ "$PARALLEL" = false ]; then
+
+# Force sync in CI environment (GitHub Actions)
+if [ -n "$CI" ]; then
+    AIRTABLE_MODE=--force
+else
+    AIRTABLE_MODE=--if-stale
+fi
+
+# STEP 0: Start fetching Airtable metadata in the background. The fetch needs
+# nothing local, so network time overlaps Steps 1-8; Step 9 waits for it and
+# only then matches the records against relationships.json.
+AIRTABLE_FETCH_PID=""
+if [ "$SKIP_AIRTABLE" = false ] && [ -f "scripts/mdbook/sync-airtable-metadata.py" ]; then
+    echo "☁️  Step 0: Fetching Airtable and meetings metadata in the background..."
+    AIRTABLE_FETCH_LOG=$(mktemp)
+    ./scripts/mdbook/sync-airtable-metadata.py --mode=full --include-meetings --fetch-only $AIRTABLE_MODE \
+        > "$AIRTABLE_FETCH_LOG" 2>&1 &
+    AIRTABLE_FETCH_PID=$!
+    # Don't leave the fetch running if a later step aborts the build
+    trap 'kill $AIRTABLE_FETCH_PID 2>/dev/null || true; rm -f "$AIRTABLE_FETCH_LOG"' EXIT
+    echo ""
+fi
+
 # Compile CSS from modular files
 echo "🎨 Compiling CSS from modular components..."
 if ./scripts/build/compile-css.py; then
@@ -82,38 +126,23 @@ if [ -f "scripts/validation/check-src-modifications.sh" ]; then
 fi
 
 # STEP 1: Sync all documents from source to /src
-echo "📁 Step 1: Syncing documents to /src..."
-echo "  • Ordinances..."
-./scripts/preprocessing/sync-ordinances.py
-echo "  • Resolutions..."
-./scripts/preprocessing/sync-resolutions.py
-echo "  • Interpretations..."
-./scripts/preprocessing/sync-interpretations.py
-echo "  • Meeting documents..."
-./scripts/preprocessing/sync-meetings.py
-echo "  • Other documents..."
-./scripts/preprocessing/sync-other.py
+# preprocess-documents.py also does Steps 4-6 (footnotes, auto-link,
+# cross-references) in the same pass, so each src/ file is written once
+echo "📁 Step 1: Syncing and preprocessing documents to /src..."
+./scripts/preprocessing/preprocess-documents.py
 echo "  ✅ All documents synced"
 echo ""
 
-# STEP 2: Validate no HTML in source files
-echo "🚫 Step 2: Checking for HTML in markdown files..."
-./scripts/validation/validate-no-html.py source-documents --quiet || {
-    echo "  ❌ HTML found in source files!"
-    echo "  Run: ./scripts/validation/validate-no-html.py"
+# STEPS 2-3: Validate source files - no HTML, form field syntax
+# lint-markdown.py reads each file once for both rule sets and only re-lints
+# files that changed since the last build
+echo "🔍 Steps 2-3: Checking for HTML and validating form field syntax..."
+./scripts/validation/lint-markdown.py source-documents --quiet || {
+    echo "  ❌ Source file validation failed!"
+    echo "  Run: ./scripts/validation/validate-no-html.py and ./scripts/validation/validate-form-fields.py"
     exit 1
 }
-echo "  ✅ No HTML in source files"
-echo ""
-
-# STEP 3: Validate form field syntax
-echo "🔍 Step 3: Validating form field syntax..."
-./scripts/validation/validate-form-fields.py --quiet || {
-    echo "  ❌ Form field validation failed!"
-    echo "  Run: ./scripts/validation/validate-form-fields.py"
-    exit 1
-}
-echo "  ✅ Form fields validated"
+echo "  ✅ No HTML in source files, form fields validated"
 echo ""
 
 # STEP 3.5: Standardize list formats (NEW - must be before other preprocessing)
@@ -132,22 +161,14 @@ echo ""
 echo "⏭️  Step 3.6: Mixed list format fix temporarily disabled"
 echo ""
 
-# STEP 4: Process footnotes
-echo "📝 Step 4: Processing footnotes..."
-./scripts/preprocessing/footnote-preprocessor.py
-echo "  ✅ Footnotes processed"
-echo ""
-
-# STEP 5: Convert URLs and emails (MUST be before cross-references)
-echo "🔗 Step 5: Converting URLs and emails to links..."
-./scripts/preprocessing/auto-link-converter.py src/ordinances/*.md src/resolutions/*.md src/interpretations/*.md src/other/*.md 2>/dev/null || true
-echo "  ✅ Links converted"
-echo ""
-
-# STEP 6: Add cross-references (MUST be after auto-link)
-echo "🔗 Step 6: Adding cross-references between documents..."
-./scripts/mdbook/add-cross-references.py
-echo "  ✅ Cross-references added"
+# STEPS 4-6: Footnotes, URL/email links and cross-references
+# Done in Step 1 by preprocess-documents.py, in this order: footnotes, then
+# auto-link (MUST be before cross-references), then cross-references.
+# To run a single stage by hand:
+#   ./scripts/preprocessing/footnote-preprocessor.py
+#   ./scripts/preprocessing/auto-link-converter.py src/ordinances/*.md ...
+#   ./scripts/mdbook/add-cross-references.py
+echo "✅ Steps 4-6: Footnotes, links and cross-references applied in Step 1"
 echo ""
 
 # STEP 7: Update document counts
@@ -165,37 +186,32 @@ echo "🔗 Step 8: Generating document relationships..."
 ./scripts/mdbook/generate-relationships.py
 # Copy to book directory for Airtable sync (which looks for book/relationships.json)
 mkdir -p book
-cp src/relationships.json book/relationships.json 2>/dev/null || true
+cmp -s src/relationships.json book/relationships.json || cp src/relationships.json book/relationships.json 2>/dev/null || true
 echo "  ✅ Relationships updated"
 echo ""
 
 # STEP 9: Sync Airtable metadata (needs relationships.json)
 if [ "$SKIP_AIRTABLE" = false ]; then
-    echo "☁️  Step 9: Syncing Airtable metadata..."
+    echo "☁️  Step 9: Syncing Airtable and meetings metadata..."
     if [ -f "scripts/mdbook/sync-airtable-metadata.py" ]; then
-        # Force sync in CI environment (GitHub Actions)
-        if [ -n "$CI" ]; then
-            ./scripts/mdbook/sync-airtable-metadata.py --mode=full --force
-        else
-            ./scripts/mdbook/sync-airtable-metadata.py --mode=full --if-stale
+        # Join the Step 0 fetch (Meetings_Metadata was fetched concurrently
+        # with the governing documents)
+        if ! wait $AIRTABLE_FETCH_PID; then
+            sed 's/^/  /' "$AIRTABLE_FETCH_LOG"
+            echo "  ❌ ERROR: Airtable fetch failed!"
+            exit 1
         fi
-        # Copy metadata to src directory
+        sed 's/^/  /' "$AIRTABLE_FETCH_LOG"
+        ./scripts/mdbook/sync-airtable-metadata.py --mode=full --include-meetings --from-prefetch $AIRTABLE_MODE
+        # Copy metadata to src directory (only if it changed - every write
+        # to src/ makes mdbook serve rebuild)
         if [ -f "book/airtable-metadata.json" ]; then
-            cp book/airtable-metadata.json src/
+            cmp -s book/airtable-metadata.json src/airtable-metadata.json || cp book/airtable-metadata.json src/
         fi
-        echo "  ✅ Airtable metadata synced"
+        echo "  ✅ Airtable and meetings metadata synced"
     else
         echo "  ⏭️  Skipped (script not found)"
     fi
-    
-    # Also sync meetings metadata
-    echo "☁️  Syncing meetings metadata..."
-    if [ -f "scripts/mdbook/sync-meetings-metadata.py" ]; then
-        ./scripts/mdbook/sync-meetings-metadata.py
-        echo "  ✅ Meetings metadata synced"
-    else
-        echo "  ⏭️  Meetings metadata sync skipped (script not found)"
-    fi
 else
     echo "⏭️  Step 9: Skipping Airtable sync (--quick mode)"
 fi
@@ -221,24 +237,32 @@ echo ""
 # CRITICAL: This MUST happen AFTER mdbook build, as mdbook cleans the book/ directory!
 # The theme/ directory contains our modular CSS architecture and must be copied here.
 echo "📂 Step 12: Copying images and data files..."
+# Files are only copied when their content changed, like copy_if_changed()
+# in scripts/utils/build_cache.py (which orchestrate.py uses for this step)
+copy_if_changed() {
+    mkdir -p "$(dirname "$2")"
+    cmp -s "$1" "$2" || cp "$1" "$2"
+}
 # Copy all images to the book directory
 if [ -d "images" ]; then
     echo "  • Copying images directory..."
-    cp -r images book/
+    find images -type f | while IFS= read -r image; do
+        copy_if_changed "$image" "book/$image"
+    done
 fi
 # CSS is now compiled into custom.css which mdBook handles automatically
 # No need to copy theme directory anymore
 # Copy navigation JavaScript
 if [ -f "navigation-standalone.js" ]; then
     echo "  • Copying navigation JavaScript..."
-    cp navigation-standalone.js book/
+    copy_if_changed navigation-standalone.js book/navigation-standalone.js
 fi
 # Copy data files
 if [ -f "src/relationships.json" ]; then
-    cp src/relationships.json book/
+    copy_if_changed src/relationships.json book/relationships.json
 fi
 if [ -f "src/airtable-metadata.json" ]; then
-    cp src/airtable-metadata.json book/
+    copy_if_changed src/airtable-metadata.json book/airtable-metadata.json
 fi
 echo "  ✅ Images and data files copied"
 echo ""
@@ -248,60 +272,34 @@ if [ -f "scripts/build/add-readonly-warnings.sh" ]; then
     ./scripts/build/add-readonly-warnings.sh >/dev/null 2>&1
 fi
 
-# STEP 13: Apply enhanced unified list processing (MUST be after mdBook build)
-echo "🎨 Step 13: Applying enhanced unified list processing..."
-./scripts/postprocessing/unified-list-processor.py >/dev/null 2>&1
-echo "  ✅ Enhanced list processing and Document Notes formatting applied"
-echo ""
-
-# STEP 14: Apply enhanced formatting (if available)
-if [ -f "scripts/postprocessing/enhanced-custom-processor.py" ]; then
-    echo "✨ Step 14: Applying enhanced document formatting..."
-    ./scripts/postprocessing/enhanced-custom-processor.py
-    echo "  ✅ Enhanced formatting applied"
-else
-    echo "⏭️  Step 14: Enhanced formatting not available"
-fi
-echo ""
-
-# STEP 14.5: Apply document-specific fixes for Ord #54
-echo "🔧 Step 14.5: Applying Ord #54-specific fixes..."
-# Existing processors that handle Ord #54
-./scripts/postprocessing/fix-complex-lists.py book/ordinances/1989-Ord-54-89C-Land-Development.html >/dev/null 2>&1
-./scripts/postprocessing/fix-empty-list-items.py book/ordinances/1989-Ord-54-89C-Land-Development.html >/dev/null 2>&1
-# Additional fixes
-if [ -f "scripts/postprocessing/fix-ord54-specific.py" ]; then
-    ./scripts/postprocessing/fix-ord54-specific.py >/dev/null 2>&1
+# STEP 13-14.5: Apply all HTML postprocessing (MUST be after mdBook build)
+# run-postprocessing.py parses each page once and runs, in order:
+#   unified-list-processor -> enhanced-custom-processor -> Ord #54 fixes
+#   (fix-complex-lists, fix-empty-list-items, fix-ord54-specific)
+echo "🎨 Step 13: Applying list processing and enhanced document formatting..."
+if ! ./scripts/postprocessing/run-postprocessing.py >/dev/null; then
+    echo "  ❌ Postprocessing failed for the pages listed above"
+    exit 1
 fi
-echo "  ✅ Ord #54 formatting applied"
+echo "  ✅ List processing, Document Notes, enhanced formatting and Ord #54 fixes applied"
 echo ""
 
-# STEP 15: Validate CSS health
-if [ -f "scripts/validation/check-styles-health.py" ]; then
-    echo "🔍 Step 15: Checking CSS and HTML health..."
-    if ./scripts/validation/check-styles-health.py > /dev/null 2>&1; then
-        echo "  ✅ Style checks passed"
+# STEPS 15-16: Validate CSS health and list formatting (one parse per page)
+if [ -f "scripts/validation/run-html-checks.py" ]; then
+    echo "🔍 Steps 15-16: Checking CSS, HTML and list formatting health..."
+    if ./scripts/validation/run-html-checks.py --check styles --check list-formatting > /dev/null 2>&1; then
+        echo "  ✅ Style and list formatting checks passed"
     else
-        echo "  ⚠️  Style issues detected - run './scripts/fix-styles.sh' if needed"
+        echo "  ⚠️  Style or list formatting issues detected - may include false positives"
+        echo "     Run: ./scripts/validation/run-html-checks.py --check styles --check list-formatting"
+        echo "     Style issues: run './scripts/fix-styles.sh' if needed"
     fi
 else
-    echo "⏭️  Step 15: Style health check not available"
+    echo "⏭️  Steps 15-16: Post-build checks not available"
 fi
 echo ""
 
-# STEP 16: Validate list formatting
-if [ -f "scripts/validation/validate-list-formatting.py" ]; then
-    echo "📋 Step 16: Checking list formatting..."
-    if ./scripts/validation/validate-list-formatting.py > /dev/null 2>&1; then
-        echo "  ✅ List formatting looks good"
-    else
-        echo "  ⚠️  List formatting issues detected - may include false positives"
-        echo "     Run: ./scripts/validation/validate-list-formatting.py"
-    fi
-else
-    echo "⏭️  Step 16: List formatting check not available"
-fi
-echo ""
+fi  # end of sequential build steps
 
 # Done!
 echo "======================================"
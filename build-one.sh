@@ -45,27 +45,27 @@ echo "🔄 Step 1: Syncing file to /src..."
 
 if [[ "$SOURCE_FILE" == source-documents/Ordinances/* ]]; then
     echo "  Type: Ordinance"
-    /usr/bin/python3 scripts/preprocessing/sync-ordinances.py
+    /usr/bin/python3 scripts/preprocessing/sync-documents.py --only "$SOURCE_FILE"
     DEST_DIR="src/ordinances"
     
 elif [[ "$SOURCE_FILE" == source-documents/Resolutions/* ]]; then
     echo "  Type: Resolution"
-    /usr/bin/python3 scripts/preprocessing/sync-resolutions.py
+    /usr/bin/python3 scripts/preprocessing/sync-documents.py --only "$SOURCE_FILE"
     DEST_DIR="src/resolutions"
     
 elif [[ "$SOURCE_FILE" == source-documents/Interpretations/* ]]; then
     echo "  Type: Interpretation"
-    /usr/bin/python3 scripts/preprocessing/sync-interpretations.py
+    /usr/bin/python3 scripts/preprocessing/sync-documents.py --only "$SOURCE_FILE"
     DEST_DIR="src/interpretations"
     
 elif [[ "$SOURCE_FILE" == source-documents/Other/* ]]; then
     echo "  Type: Other Document"
-    /usr/bin/python3 scripts/preprocessing/sync-other.py
+    /usr/bin/python3 scripts/preprocessing/sync-documents.py --only "$SOURCE_FILE"
     DEST_DIR="src/other"
     
 elif [[ "$SOURCE_FILE" == source-documents/Meetings/* ]]; then
     echo "  Type: Meeting Document"
-    /usr/bin/python3 scripts/preprocessing/sync-meetings.py
+    /usr/bin/python3 scripts/preprocessing/sync-documents.py --only "$SOURCE_FILE"
     
     # Determine specific type for destination
     if [[ "$FILENAME" == *Agenda* ]]; then
@@ -128,9 +128,10 @@ if [ -f "$DEST_FILE" ]; then
     echo -e "${GREEN}✓${NC}"
 fi
 
-# Cross-references (needs to scan all files)
+# Cross-references (relinks this file, plus any file whose link targets
+# appeared or disappeared, using the saved reference index)
 echo -n "  • Cross-references... "
-/usr/bin/python3 scripts/mdbook/add-cross-references.py >/dev/null 2>&1
+/usr/bin/python3 scripts/mdbook/add-cross-references.py "$DEST_FILE" >/dev/null 2>&1
 echo -e "${GREEN}✓${NC}"
 
 echo ""
@@ -145,7 +146,7 @@ echo -e "${GREEN}✓${NC}"
 echo -n "  • Relationships... "
 /usr/bin/python3 scripts/mdbook/generate-relationships.py >/dev/null 2>&1
 # Copy to book directory for navigation to use
-cp src/relationships.json book/relationships.json 2>/dev/null || true
+cmp -s src/relationships.json book/relationships.json || cp src/relationships.json book/relationships.json 2>/dev/null || true
 echo -e "${GREEN}✓${NC}"
 
 # Check if this is a meeting document
@@ -154,7 +155,7 @@ if [[ "$SOURCE_FILE" == source-documents/Meetings/* ]]; then
         echo -n "  • Meeting metadata... "
         /usr/bin/python3 scripts/mdbook/sync-meetings-metadata.py >/dev/null 2>&1
         if [ -f "book/meetings-metadata.json" ]; then
-            cp book/meetings-metadata.json src/ 2>/dev/null
+            cmp -s book/meetings-metadata.json src/meetings-metadata.json || cp book/meetings-metadata.json src/ 2>/dev/null
         fi
         echo -e "${GREEN}✓${NC}"
     fi
@@ -164,7 +165,7 @@ else
         echo -n "  • Airtable metadata... "
         if /usr/bin/python3 scripts/mdbook/sync-airtable-metadata.py --mode=single --file="$FILENAME" --create-if-missing >/dev/null 2>&1; then
             if [ -f "book/airtable-metadata.json" ]; then
-                cp book/airtable-metadata.json src/ 2>/dev/null
+                cmp -s book/airtable-metadata.json src/airtable-metadata.json || cp book/airtable-metadata.json src/ 2>/dev/null
             fi
             echo -e "${GREEN}✓${NC}"
         else
@@ -19,7 +19,8 @@ stop_all_mdbook_servers
 # Track if we're currently processing to avoid loops
 PROCESSING=false
 
-# Function to process a changed file
+# Function to process a changed file (fallback when scripts/build/dev-daemon.py
+# can't run - the daemon does the same work without relaunching each script)
 process_file_change() {
     local file="$1"
     local filename=$(basename "$file")
@@ -47,30 +48,19 @@ process_file_change() {
     # Determine document type and run appropriate sync
     if [[ "$file" == *source-documents/Ordinances/* ]]; then
         echo "  Syncing ordinances..."
-        ./scripts/preprocessing/sync-ordinances.py >/dev/null 2>&1
+        ./scripts/preprocessing/sync-documents.py --only "$file" >/dev/null 2>&1
     elif [[ "$file" == *source-documents/Resolutions/* ]]; then
         echo "  Syncing resolutions..."
-        ./scripts/preprocessing/sync-resolutions.py >/dev/null 2>&1
+        ./scripts/preprocessing/sync-documents.py --only "$file" >/dev/null 2>&1
     elif [[ "$file" == *source-documents/Interpretations/* ]]; then
         echo "  Syncing interpretations..."
-        ./scripts/preprocessing/sync-interpretations.py >/dev/null 2>&1
+        ./scripts/preprocessing/sync-documents.py --only "$file" >/dev/null 2>&1
     elif [[ "$file" == *source-documents/Other/* ]]; then
         echo "  Syncing other documents..."
-        ./scripts/preprocessing/sync-other.py >/dev/null 2>&1
+        ./scripts/preprocessing/sync-documents.py --only "$file" >/dev/null 2>&1
     elif [[ "$file" == *source-documents/Meetings/* ]]; then
         echo "  Syncing meeting documents..."
-        # Just copy meeting files
-        local dest_filename=$(echo "$filename" | sed 's/#//g')
-        if [[ "$file" == *Agenda* ]]; then
-            mkdir -p src/agendas
-            cp "$file" "src/agendas/$dest_filename"
-        elif [[ "$file" == *Minutes* ]]; then
-            mkdir -p src/minutes
-            cp "$file" "src/minutes/$dest_filename"
-        elif [[ "$file" == *Transcript* ]]; then
-            mkdir -p src/transcripts
-            cp "$file" "src/transcripts/$dest_filename"
-        fi
+        ./scripts/preprocessing/sync-documents.py --only "$file" >/dev/null 2>&1
     else
         echo -e "${YELLOW}  Skipping (not a recognized document type)${NC}"
         PROCESSING=false
@@ -106,16 +96,17 @@ process_file_change() {
         ./scripts/preprocessing/auto-link-converter.py "$dest_file" >/dev/null 2>&1 || true
     fi
     
-    # Always update cross-references (they scan all files)
+    # Update cross-references for this file and any file whose link targets
+    # appeared or disappeared (everything, if there's no governing dest_file)
     echo "  Updating cross-references..."
-    ./scripts/mdbook/add-cross-references.py >/dev/null 2>&1
+    ./scripts/mdbook/add-cross-references.py ${dest_file:+"$dest_file"} >/dev/null 2>&1
     
     # Regenerate SUMMARY.md and relationships
     echo "  Updating indexes..."
     ./scripts/mdbook/generate-summary-with-airtable.py >/dev/null 2>&1
     ./scripts/mdbook/generate-relationships.py >/dev/null 2>&1
     # Copy relationships to book directory for navigation to use
-    cp src/relationships.json book/relationships.json 2>/dev/null || true
+    cmp -s src/relationships.json book/relationships.json || cp src/relationships.json book/relationships.json 2>/dev/null || true
     
     # Wait for mdBook to detect changes and start rebuilding
     # Increased from 2 to 3 seconds to ensure mdBook has time to start
@@ -291,8 +282,16 @@ cleanup() {
 # Set up signal handlers
 trap cleanup INT TERM
 
-# Start the source watcher in background
-watch_source_documents &
+# Start the source watcher in background. The build daemon keeps the pipeline
+# loaded between saves and postprocesses pages as soon as mdBook rewrites them;
+# without watchdog, fall back to running the scripts on each change
+if python3 -c "import watchdog" 2>/dev/null; then
+    ./scripts/build/dev-daemon.py &
+else
+    echo -e "${YELLOW}💡 Tip: Install watchdog for sub-second rebuilds${NC}"
+    echo "   pip3 install --break-system-packages watchdog"
+    watch_source_documents &
+fi
 SOURCE_WATCHER_PID=$!
 
 # Start the postprocess watcher to handle mdBook rebuilds
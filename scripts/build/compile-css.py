@@ -9,6 +9,9 @@ import os
 import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from utils.build_cache import write_if_changed
+
 def compile_css():
     """Compile all modular CSS files into a single custom.css file."""
     
@@ -104,17 +107,10 @@ def compile_css():
     # Write the compiled CSS
     output_content = '\n'.join(compiled_css)
     
-    # Check if output would be different from existing
-    if output_file.exists():
-        with open(output_file, 'r', encoding='utf-8') as f:
-            existing_content = f.read()
-        if existing_content == output_content:
-            print("✅ CSS already up to date")
-            return True
-    
-    # Write the new compiled CSS
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(output_content)
+    # Write the new compiled CSS, unless the existing file already matches
+    if not write_if_changed(output_file, output_content):
+        print("✅ CSS already up to date")
+        return True
     
     print(f"✅ Compiled CSS written to {output_file}")
     
@@ -122,16 +118,12 @@ def compile_css():
     if (repo_root / "book").exists():
         # Copy to book root for backwards compatibility
         book_css = repo_root / "book" / "custom.css"
-        with open(book_css, 'w', encoding='utf-8') as f:
-            f.write(output_content)
+        write_if_changed(book_css, output_content)
         print(f"✅ Copied to {book_css}")
         
         # Copy to book/theme/css/ where mdBook actually looks for custom.css
-        book_theme_css_dir = repo_root / "book" / "theme" / "css"
-        book_theme_css_dir.mkdir(parents=True, exist_ok=True)
-        book_theme_css = book_theme_css_dir / "custom.css"
-        with open(book_theme_css, 'w', encoding='utf-8') as f:
-            f.write(output_content)
+        book_theme_css = repo_root / "book" / "theme" / "css" / "custom.css"
+        write_if_changed(book_theme_css, output_content)
         print(f"✅ Copied to {book_theme_css} (mdBook location)")
     
     return True
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Long-lived build daemon for dev-server.sh.
+
+Replaces the per-save chain of ~10 script launches in process_file_change().
+The daemon imports every pipeline module once and keeps the cross-reference
+index in memory, then reacts to two kinds of change:
+
+1. Saves in source-documents/ (coalesced with a settle timer):
+   validate form fields → preprocess only the edited documents plus any
+   document whose cross-reference targets appeared or disappeared
+   (preprocess-documents.py) → SUMMARY.md and relationships.json
+2. Pages mdBook rewrote in book/ after `mdbook serve` picks up the src/
+   change: run the fused postprocessors (run-postprocessing.py) on just those
+   pages, then the Ord 54 list tests and the style health check
+
+Waiting for the rebuild is event-driven, so there is no fixed sleep. Pages the
+daemon wrote itself are recognised by content hash and never reprocessed,
+which keeps postprocessing from retriggering itself.
+
+Usage:
+    ./scripts/build/dev-daemon.py                # started by dev-server.sh
+    ./scripts/build/dev-daemon.py --settle 0.5   # wait longer for bursts to end
+"""
+
+import io
+import os
+import sys
+import time
+import queue
+import argparse
+from contextlib import redirect_stdout
+from pathlib import Path
+
+from watchdog.observers import Observer
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from utils.build_cache import copy_if_changed, hash_text
+from utils.change_watcher import SettlingHandler
+from utils.script_loader import load_script
+
+# Colors for output
+RED = '\033[0;31m'
+GREEN = '\033[0;32m'
+YELLOW = '\033[1;33m'
+BLUE = '\033[0;34m'
+NC = '\033[0m'  # No Color
+
+REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+SOURCE_DIR = Path('source-documents')
+BOOK_DIR = Path('book')
+ORD54_PAGE = 'book/ordinances/1989-Ord-54-89C-Land-Development.html'
+
+
+class DevDaemon:
+    """Warm pipeline that processes batches of source and book/ changes."""
+
+    def __init__(self, settle=0.3):
+        self.settle = settle
+        self.events = queue.Queue()
+
+        self.preprocess = load_script('preprocessing/preprocess-documents.py')
+        self.cross_references = self.preprocess.cross_references
+        self.form_fields = load_script('validation/validate-form-fields.py')
+        self.summary = load_script('mdbook/generate-summary-with-airtable.py')
+        self.relationships = load_script('mdbook/generate-relationships.py')
+        self.postprocess = load_script('postprocessing/run-postprocessing.py')
+        self.list_tests = load_script('tests/test-list-formatting.py')
+        self.styles = load_script('validation/check-styles-health.py')
+
+        self.reference_index = self.cross_references.ReferenceIndex.load()
+        # book/ page -> hash of the HTML the daemon last wrote there
+        self.written = {}
+
+    def relative(self, path):
+        path = Path(path).resolve()
+        try:
+            return path.relative_to(REPO_ROOT)
+        except ValueError:
+            return path
+
+    # ---- source-documents/ -------------------------------------------------
+
+    def validate(self, sources):
+        """Validate form fields in the changed sources; print errors and return False if any."""
+        validator = self.form_fields.FormFieldValidator()
+        for source in sources:
+            if source.exists():
+                validator.validate_file(source)
+        if validator.errors:
+            print(f"{RED}  ✗ Form field errors detected!{NC}")
+            validator.print_report()
+            print(f"{YELLOW}  Fix the errors above and save again{NC}")
+            return False
+        return True
+
+    def process_sources(self, sources):
+        names = ', '.join(source.name for source in sources)
+        print(f"\n{BLUE}📝 Detected change: {names}{NC}")
+        start = time.perf_counter()
+
+        if not self.validate(sources):
+            return
+
+        documents, managed_dirs = self.preprocess.plan_documents()
+        doc_map = self.cross_references.build_document_map([doc.dest for doc in documents])
+
+        changed = {source.resolve() for source in sources}
+        edited = [doc.dest for doc in documents if doc.source.resolve() in changed]
+        existing = [doc.dest for doc in documents if doc.dest.exists()]
+        targets = set(self.reference_index.affected_files(edited, existing, doc_map))
+        selected = [doc for doc in documents if doc.dest in targets or not doc.dest.exists()]
+
+        cache = self.preprocess.cache_for_stages()
+        updated, footnote_warnings = self.preprocess.write_documents(
+            selected, doc_map, cache, self.reference_index)
+        removed = self.preprocess.remove_orphans(documents, managed_dirs)
+        cache.save()
+        self.reference_index.save(doc_map)
+
+        for dest, warnings in footnote_warnings:
+            print(f"  📄 {dest}")
+            for warning in warnings:
+                print(warning)
+
+        written = [dest for files in updated.values() for dest in files]
+        if not written and not removed:
+            print(f"{GREEN}  ✓ No changes to src/ ({time.perf_counter() - start:.2f}s){NC}")
+            return
+
+        with redirect_stdout(io.StringIO()):
+            self.summary.generate_summary()
+            self.relationships.main()
+        # Copy relationships to book directory for navigation to use
+        if BOOK_DIR.exists():
+            copy_if_changed('src/relationships.json', BOOK_DIR / 'relationships.json')
+
+        print(f"  Preprocessed {len(selected)} of {len(documents)} document(s): "
+              f"{len(written)} written, {len(removed)} removed")
+        print(f"{GREEN}  ✓ src/ updated in {time.perf_counter() - start:.2f}s - "
+              f"postprocessing runs when mdBook finishes rebuilding{NC}")
+
+    # ---- book/ ---------------------------------------------------------------
+
+    def rewritten_by_mdbook(self, pages):
+        """The pages whose content isn't what the daemon itself last wrote."""
+        rewritten = []
+        for page in pages:
+            if not page.exists():
+                continue
+            content = page.read_text(encoding='utf-8')
+            if self.written.get(str(page)) != hash_text(content):
+                rewritten.append(page)
+        return rewritten
+
+    def process_book(self, pages):
+        pages = self.rewritten_by_mdbook(pages)
+        if not pages:
+            return
+        start = time.perf_counter()
+
+        with redirect_stdout(io.StringIO()):
+            written, errors = self.postprocess.postprocess_files(pages)
+        for page, html in written.items():
+            self.written[str(page)] = hash_text(html)
+        for page, error in errors:
+            print(f"{RED}  ✗ Error postprocessing {page}: {error}{NC}")
+
+        if any(str(page) == ORD54_PAGE for page in pages):
+            tester = self.list_tests.ListFormattingTester()
+            with redirect_stdout(io.StringIO()):
+                tester.test_file(ORD54_PAGE)
+                passed = tester.print_summary()
+            if not passed:
+                print(f"{YELLOW}    ⚠️  Some list formatting tests failed - run ./scripts/validation/test-list-changes.sh for details{NC}")
+
+        # Quick style health check (shows specific issues if found)
+        self.styles.run_checks(verbose=True)
+
+        print(f"{GREEN}  ✓ Postprocessed {len(written)} page(s) in {time.perf_counter() - start:.2f}s{NC}")
+
+    # ---- event loop ----------------------------------------------------------
+
+    def run(self):
+        observer = Observer()
+        observer.schedule(
+            SettlingHandler(lambda paths: self.events.put(('source', paths)), self.settle, suffixes=('.md',)),
+            str(SOURCE_DIR), recursive=True)
+        BOOK_DIR.mkdir(exist_ok=True)
+        observer.schedule(
+            SettlingHandler(lambda paths: self.events.put(('book', paths)), self.settle, suffixes=('.html',)),
+            str(BOOK_DIR), recursive=True)
+        observer.start()
+
+        print(f"📁 Watching {SOURCE_DIR}/ and {BOOK_DIR}/ for changes (settle {self.settle}s)...", flush=True)
+        try:
+            while True:
+                kind, paths = self.events.get()
+                paths = [self.relative(path) for path in paths]
+                try:
+                    if kind == 'source':
+                        self.process_sources(paths)
+                    else:
+                        self.process_book(paths)
+                except Exception as e:
+                    # Keep serving - the next save gets a fresh attempt
+                    print(f"{RED}  ❌ Error processing {kind} change: {type(e).__name__}: {e}{NC}")
+                sys.stdout.flush()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            observer.stop()
+            observer.join()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Keep the build pipeline warm and rebuild on every save')
+    parser.add_argument('--settle', type=float, default=0.3,
+                        help='Seconds without changes before a burst of saves is processed (default: 0.3)')
+    args = parser.parse_args()
+
+    os.chdir(REPO_ROOT)
+    DevDaemon(args.settle).run()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
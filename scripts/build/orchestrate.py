@@ -0,0 +1,390 @@
+#!/usr/bin/env python3
+"""
+Parallel build orchestrator for the City of Rivergrove mdBook site.
+
+Runs the same steps as build-all.sh, but declares each step with the paths it
+reads (inputs) and writes (outputs) and runs independent steps concurrently.
+
+Ordering is derived from the declarations instead of being hardcoded: a step
+waits for every EARLIER step that writes something it reads, reads something
+it writes, or writes the same path. Because steps are declared in the same
+order as build-all.sh, all of the existing ordering rules still hold:
+- Auto-link MUST be before cross-references (preprocess-documents.py runs
+  them in order on each document)
+- Relationships MUST be before Airtable sync (book/relationships.json)
+- The Airtable fetch reads nothing local, so it starts with the first wave
+  and only the matching step waits for relationships.json
+- Postprocessors MUST be after mdBook build (book/)
+
+Steps with no overlap run at the same time - e.g. document preprocessing,
+source linting (lint-markdown.py) and CSS compilation.
+
+Usage:
+    ./scripts/build/orchestrate.py            # Full build using all CPU cores
+    ./scripts/build/orchestrate.py --quick    # Skip Airtable sync
+    ./scripts/build/orchestrate.py --plan     # Show the step graph and exit
+    ./scripts/build/orchestrate.py --jobs 2   # Limit concurrent steps
+"""
+
+import os
+import sys
+import shutil
+import subprocess
+import time
+import argparse
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from utils.build_cache import copy_if_changed
+
+# Colors for output
+RED = '\033[0;31m'
+GREEN = '\033[0;32m'
+YELLOW = '\033[1;33m'
+BLUE = '\033[0;34m'
+NC = '\033[0m'  # No Color
+
+# Written by sync-airtable-metadata.py --fetch-only, consumed by --from-prefetch
+AIRTABLE_PREFETCH = '.build-cache/airtable/prefetch.json'
+
+
+class BuildStep:
+    """A single build step with the paths it reads and writes."""
+
+    def __init__(self, name: str, description: str, command: Optional[List[str]] = None,
+                 action: Optional[Callable[[], None]] = None, inputs=(), outputs=(),
+                 after=(), required: bool = True, enabled: bool = True):
+        self.name = name
+        self.description = description
+        self.command = command
+        self.action = action
+        self.inputs = [p.rstrip('/') for p in inputs]
+        self.outputs = [p.rstrip('/') for p in outputs]
+        # Explicit ordering for dependencies that aren't visible as paths
+        self.after = list(after)
+        # Required steps abort the build on failure; others only warn
+        self.required = required
+        self.enabled = enabled
+        self.depends_on = set()
+
+        # Results
+        self.returncode = None
+        self.output = ''
+        self.duration = 0.0
+
+    def display_command(self) -> str:
+        """The command as a user would type it from the repository root."""
+        if not self.command:
+            return self.name
+        args = self.command[1:] if self.command[0] == sys.executable else self.command
+        if args and not args[0].startswith(('./', '/')) and Path(args[0]).exists():
+            args = ['./' + args[0]] + args[1:]
+        return ' '.join(args)
+
+    def run(self) -> int:
+        """Run the step, capturing its output."""
+        start = time.time()
+        try:
+            if self.action:
+                self.action()
+                self.returncode = 0
+            else:
+                result = subprocess.run(self.command, capture_output=True, text=True)
+                self.output = result.stdout + result.stderr
+                self.returncode = result.returncode
+        except Exception as e:
+            self.output += f"{e}\n"
+            self.returncode = 1
+        self.duration = time.time() - start
+        return self.returncode
+
+
+def paths_overlap(a: str, b: str) -> bool:
+    """True if one path is the same as, or inside, the other."""
+    return a == b or a.startswith(b + '/') or b.startswith(a + '/')
+
+
+def any_overlap(paths_a: List[str], paths_b: List[str]) -> bool:
+    return any(paths_overlap(a, b) for a in paths_a for b in paths_b)
+
+
+def resolve_dependencies(steps: List[BuildStep]):
+    """
+    Derive each step's dependencies from declaration order and read/write sets.
+
+    A step depends on an earlier step when:
+    - the earlier step writes something this step reads (read-after-write)
+    - the earlier step reads something this step writes (write-after-read)
+    - both steps write the same path (write-after-write)
+    """
+    by_name = {step.name: step for step in steps}
+    for i, step in enumerate(steps):
+        for earlier in steps[:i]:
+            if (any_overlap(earlier.outputs, step.inputs) or
+                    any_overlap(earlier.inputs, step.outputs) or
+                    any_overlap(earlier.outputs, step.outputs)):
+                step.depends_on.add(earlier.name)
+        for name in step.after:
+            if name not in by_name:
+                raise ValueError(f"Step '{step.name}' runs after unknown step '{name}'")
+            step.depends_on.add(name)
+
+
+def copy_file(source: str, dest: str):
+    """Copy a single file if it exists (like `cp src dest 2>/dev/null || true`), unless dest already matches."""
+    if Path(source).exists():
+        copy_if_changed(source, dest)
+
+
+def copy_book_assets():
+    """Step 12: copy images, navigation and data files into book/."""
+    if Path('images').is_dir():
+        shutil.copytree('images', 'book/images', dirs_exist_ok=True, copy_function=copy_if_changed)
+    copy_file('navigation-standalone.js', 'book/navigation-standalone.js')
+    copy_file('src/relationships.json', 'book/relationships.json')
+    copy_file('src/airtable-metadata.json', 'book/airtable-metadata.json')
+
+
+def build_steps(quick: bool = False) -> List[BuildStep]:
+    """
+    Declare every build step, in the same order as build-all.sh.
+
+    Declaration order matters: it decides which of two conflicting steps runs
+    first. Keep it in sync with build-all.sh.
+    """
+    python = sys.executable
+    in_ci = bool(os.environ.get('CI'))
+    airtable_mode = ['--force'] if in_ci else ['--if-stale']
+    airtable_enabled = not quick and Path('scripts/mdbook/sync-airtable-metadata.py').exists()
+
+    if quick or not Path('scripts/mdbook/generate-summary-with-airtable.py').exists():
+        summary_script = 'scripts/mdbook/generate-summary.py'
+    else:
+        summary_script = 'scripts/mdbook/generate-summary-with-airtable.py'
+
+    steps = [
+        # STEP 0: Fetch Airtable records ahead of the local steps (network-bound).
+        # The delta fetch reads the previous cache (or its committed copy in
+        # src/, which preprocessing never writes - not declared, so it doesn't
+        # order this step after everything that writes src/)
+        BuildStep('airtable-fetch', "Fetching Airtable and meetings metadata",
+                  [python, 'scripts/mdbook/sync-airtable-metadata.py', '--mode=full',
+                   '--include-meetings', '--fetch-only'] + airtable_mode,
+                  inputs=['book/airtable-metadata.json'],
+                  outputs=[AIRTABLE_PREFETCH],
+                  enabled=airtable_enabled),
+
+        BuildStep('compile-css', "Compiling CSS from modular components",
+                  [python, 'scripts/build/compile-css.py'],
+                  inputs=['theme/css'], outputs=['custom.css', 'book/custom.css', 'book/theme']),
+        BuildStep('check-src', "Checking for direct /src modifications",
+                  ['scripts/validation/check-src-modifications.sh'],
+                  inputs=['src'],
+                  enabled=Path('scripts/validation/check-src-modifications.sh').exists()),
+
+        # STEP 1: Sync all documents from source to /src, with Steps 4-6
+        # (footnotes, auto-link, cross-references) applied in the same pass
+        BuildStep('preprocess', "Syncing and preprocessing documents",
+                  [python, 'scripts/preprocessing/preprocess-documents.py'],
+                  inputs=['source-documents', 'src'], outputs=['src']),
+
+        # STEP 2-3: Validate source files (read-only)
+        # (HTML and form field rules in one pass over each file)
+        BuildStep('lint-markdown', "Checking markdown files for HTML and form field syntax",
+                  [python, 'scripts/validation/lint-markdown.py', 'source-documents', '--quiet'],
+                  inputs=['source-documents']),
+
+        # STEP 7: Update document counts
+        BuildStep('document-counts', "Updating document counts",
+                  [python, 'scripts/preprocessing/update-document-counts.py'],
+                  inputs=['src'], outputs=['src/introduction.md'],
+                  enabled=Path('scripts/preprocessing/update-document-counts.py').exists()),
+
+        # STEP 8: Generate relationships (MUST be first for Airtable sync to work)
+        BuildStep('relationships', "Generating document relationships",
+                  [python, 'scripts/mdbook/generate-relationships.py'],
+                  inputs=['src', 'book/meetings-metadata.json'], outputs=['src/relationships.json']),
+        BuildStep('copy-relationships', "Copying relationships to book/",
+                  action=lambda: copy_file('src/relationships.json', 'book/relationships.json'),
+                  inputs=['src/relationships.json'], outputs=['book/relationships.json']),
+
+        # STEP 9: Match the fetched Airtable records (needs relationships.json)
+        BuildStep('airtable-metadata', "Syncing Airtable and meetings metadata",
+                  [python, 'scripts/mdbook/sync-airtable-metadata.py', '--mode=full',
+                   '--include-meetings', '--from-prefetch'] + airtable_mode,
+                  inputs=['book/relationships.json', AIRTABLE_PREFETCH],
+                  outputs=['book/airtable-metadata.json', 'book/meetings-metadata.json', AIRTABLE_PREFETCH],
+                  after=['relationships'],
+                  enabled=airtable_enabled),
+        BuildStep('copy-airtable-metadata', "Copying Airtable metadata to src/",
+                  action=lambda: copy_file('book/airtable-metadata.json', 'src/airtable-metadata.json'),
+                  inputs=['book/airtable-metadata.json'], outputs=['src/airtable-metadata.json'],
+                  enabled=not quick),
+
+        # STEP 10: Generate SUMMARY.md (AFTER relationships AND Airtable sync)
+        BuildStep('summary', "Generating table of contents",
+                  [python, summary_script],
+                  inputs=['src', 'book/airtable-metadata.json'], outputs=['src/SUMMARY.md']),
+
+        # STEP 11: Build mdBook
+        BuildStep('mdbook', "Building mdBook",
+                  ['mdbook', 'build'],
+                  inputs=['src', 'book.toml', 'custom.css', 'theme'], outputs=['book']),
+
+        # STEP 12: Copy images and data files (MUST be after mdbook build - it cleans book/)
+        BuildStep('copy-assets', "Copying images and data files",
+                  action=copy_book_assets,
+                  inputs=['images', 'navigation-standalone.js', 'src/relationships.json',
+                          'src/airtable-metadata.json'],
+                  outputs=['book/images', 'book/navigation-standalone.js',
+                           'book/relationships.json', 'book/airtable-metadata.json']),
+        BuildStep('readonly-warnings', "Adding readonly warnings to generated CSS",
+                  ['scripts/build/add-readonly-warnings.sh'],
+                  inputs=['book/theme'], outputs=['book/theme'], required=False,
+                  enabled=Path('scripts/build/add-readonly-warnings.sh').exists()),
+
+        # STEP 13-14.5: Postprocessors (MUST be after mdBook build). One parse per
+        # page; the transform order lives in run-postprocessing.py
+        BuildStep('postprocess', "Applying list processing, enhanced formatting and Ord #54 fixes",
+                  [python, 'scripts/postprocessing/run-postprocessing.py'],
+                  inputs=['book'], outputs=['book']),
+
+        # STEP 15-16: Post-build validation (warnings only, read-only), one
+        # parse per page for both checks
+        BuildStep('html-checks', "Checking CSS, HTML and list formatting health",
+                  [python, 'scripts/validation/run-html-checks.py', '--check', 'styles', '--check', 'list-formatting'],
+                  inputs=['book', 'theme/css'], required=False,
+                  enabled=Path('scripts/validation/run-html-checks.py').exists()),
+    ]
+
+    steps = [step for step in steps if step.enabled]
+    # Drop explicit orderings on steps that were disabled (e.g. --quick)
+    names = {step.name for step in steps}
+    for step in steps:
+        step.after = [name for name in step.after if name in names]
+
+    resolve_dependencies(steps)
+    return steps
+
+
+def compute_waves(steps: List[BuildStep]) -> List[List[BuildStep]]:
+    """Group steps into waves where every step only depends on earlier waves."""
+    level: Dict[str, int] = {}
+    for step in steps:
+        level[step.name] = max((level[dep] + 1 for dep in step.depends_on), default=0)
+    waves = [[] for _ in range(max(level.values(), default=-1) + 1)]
+    for step in steps:
+        waves[level[step.name]].append(step)
+    return waves
+
+
+def print_plan(steps: List[BuildStep]):
+    """Print the step graph grouped into waves of concurrent steps."""
+    # Collect every step's transitive dependencies so only direct ones are shown
+    ancestors: Dict[str, set] = {}
+    for step in steps:
+        ancestors[step.name] = set(step.depends_on)
+        for dep in step.depends_on:
+            ancestors[step.name] |= ancestors[dep]
+
+    print(f"{BLUE}📋 Build plan ({len(steps)} steps){NC}")
+    for i, wave in enumerate(compute_waves(steps), 1):
+        print(f"\n  Wave {i}:")
+        for step in wave:
+            direct = [dep for dep in step.depends_on
+                      if not any(dep in ancestors[other] for other in step.depends_on)]
+            deps = ', '.join(sorted(direct)) or '-'
+            print(f"    • {step.name:<28} after: {deps}")
+
+
+def run_build(steps: List[BuildStep], jobs: int, verbose: bool = False) -> int:
+    """Run steps concurrently as their dependencies complete. Returns an exit code."""
+    pending = {step.name: step for step in steps}
+    done = set()
+    running = {}
+    failed = None
+    warnings = []
+    start = time.time()
+
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        while pending or running:
+            # Start every step whose dependencies have all finished
+            if failed is None:
+                for name, step in list(pending.items()):
+                    if step.depends_on <= done:
+                        del pending[name]
+                        running[executor.submit(step.run)] = step
+
+            if not running:
+                break
+
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                step = running.pop(future)
+                future.result()
+                done.add(step.name)
+
+                if verbose and step.output.strip():
+                    print(step.output.rstrip())
+
+                if step.returncode == 0:
+                    print(f"  {GREEN}✅{NC} {step.description} ({step.duration:.1f}s)", flush=True)
+                elif step.required:
+                    print(f"  {RED}❌ {step.description} failed (exit {step.returncode}){NC}", flush=True)
+                    if failed is None:
+                        failed = step
+                else:
+                    print(f"  {YELLOW}⚠️  {step.description} reported issues{NC}", flush=True)
+                    warnings.append(step)
+
+    elapsed = time.time() - start
+    step_time = sum(step.duration for step in steps if step.returncode is not None)
+
+    if failed:
+        print()
+        print(f"{RED}❌ Build failed at step '{failed.name}'{NC}")
+        if failed.output.strip():
+            print(failed.output.rstrip())
+        if pending:
+            print(f"   Skipped {len(pending)} step(s): {', '.join(pending)}")
+        return failed.returncode or 1
+
+    print()
+    for step in warnings:
+        print(f"{YELLOW}⚠️  {step.name}: run '{step.display_command()}' for details{NC}")
+    print(f"⏱️  {len(steps)} steps in {elapsed:.1f}s "
+          f"({step_time:.1f}s of step time across {jobs} worker(s))")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run the build steps with independent steps in parallel')
+    parser.add_argument('--quick', action='store_true',
+                        help='Skip Airtable sync (faster for local testing)')
+    parser.add_argument('--jobs', '-j', type=int, default=os.cpu_count() or 1,
+                        help='Maximum number of steps to run at once (default: CPU count)')
+    parser.add_argument('--plan', action='store_true',
+                        help='Print the step graph and exit without building')
+    parser.add_argument('--verbose', '-v', action='store_true',
+                        help='Show the output of every step')
+    args = parser.parse_args()
+
+    # Run from the repository root (two levels up from scripts/build/)
+    os.chdir(Path(__file__).resolve().parent.parent.parent)
+
+    steps = build_steps(quick=args.quick)
+
+    if args.plan:
+        print_plan(steps)
+        return 0
+
+    jobs = max(1, args.jobs)
+    print(f"{BLUE}🚀 Running {len(steps)} build steps on up to {jobs} worker(s)...{NC}")
+    print()
+    return run_build(steps, jobs, verbose=args.verbose)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -2,22 +2,49 @@
 """
 Script to add cross-reference links between documents in the src directory.
 Run this before building with mdBook.
+
+Usage:
+    python3 scripts/mdbook/add-cross-references.py              # relink every file
+    python3 scripts/mdbook/add-cross-references.py src/x.md     # relink after editing x.md
+
+With file arguments only those files are relinked, plus any file that
+mentions a reference whose target was added, renamed or removed (looked up in
+the reference index saved by the previous run).
 """
 
 import re
+import sys
+import json
+from bisect import bisect_right
 from pathlib import Path
 import os
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from utils.build_cache import DEFAULT_CACHE_DIR, BuildCache, atomic_write_text, cache_enabled, write_if_changed
+
 # Build document map from actual files
-def build_document_map():
-    """Build a map of references to file paths from the actual files in src."""
+def document_files(src_dir, subdir, files=None):
+    """Markdown files in src/<subdir>, sorted, from disk or from a planned file list."""
+    if files is not None:
+        return sorted(Path(f) for f in files if Path(f).parent.name == subdir)
+    directory = src_dir / subdir
+    return sorted(directory.glob("*.md")) if directory.exists() else []
+
+def build_document_map(files=None):
+    """
+    Build a map of references to file paths from the actual files in src.
+    
+    Args:
+        files: Optional list of src/ paths to build the map from instead of
+            globbing src/ (used when the files haven't been written yet)
+    """
     doc_map = {}
     src_dir = Path("src")
     
     # Process ordinances
-    ord_dir = src_dir / "ordinances"
-    if ord_dir.exists():
-        for file in ord_dir.glob("*.md"):
+    ord_files = document_files(src_dir, "ordinances", files)
+    if ord_files:
+        for file in ord_files:
             # Extract ordinance number from filename
             filename = file.stem
             
@@ -68,9 +95,9 @@ def build_document_map():
                             doc_map[f"ordinance no. {without_letter}"] = f"../ordinances/{filename}.md"
     
     # Process resolutions
-    res_dir = src_dir / "resolutions"
-    if res_dir.exists():
-        for file in res_dir.glob("*.md"):
+    res_files = document_files(src_dir, "resolutions", files)
+    if res_files:
+        for file in res_files:
             filename = file.stem
             
             # Parse resolution filename
@@ -89,15 +116,103 @@ def build_document_map():
     
     return doc_map
 
+def _trie_pattern(keys):
+    """
+    Compile reference keys into a single trie-shaped regex alternation.
+
+    Keys that share a prefix share one branch, so at each position the regex
+    only follows the one path that can still match instead of retrying all
+    ~300 keys. Within a branch longer continuations are tried first, so the
+    longest matching key wins - the same result as the old longest-first
+    alternation.
+    """
+    trie = {}
+    for key in keys:
+        node = trie
+        for char in key:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def emit(node):
+        ends_here = '' in node
+        branches = [re.escape(char) + emit(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        if len(branches) == 1 and not ends_here:
+            return branches[0]
+        group = '(?:' + '|'.join(branches) + ')'
+        return group + '?' if ends_here else group
+
+    return emit(trie)
+
+class ReferenceLinker:
+    """Reference matcher for one document map, compiled once and reused for every file."""
+    
+    def __init__(self, doc_map):
+        self.doc_map = dict(doc_map)
+        # Include optional year suffix (like -2018) as part of the match
+        pattern = r'\b(' + _trie_pattern(self.doc_map) + r')(?:-\d{4})?(?:\s*\(\d{4}\))?'
+        self.regex = re.compile(pattern, re.IGNORECASE)
+
+_linker = None
+
+def get_linker(doc_map):
+    """Return the compiled linker for doc_map, rebuilding it only when the map changes."""
+    global _linker
+    if _linker is None or _linker.doc_map != doc_map:
+        _linker = ReferenceLinker(doc_map)
+    return _linker
+
+class LineIndex:
+    """
+    Per-line facts about a document, computed in one pass so each reference
+    can be checked in O(log n) instead of rescanning everything before it.
+    """
+    
+    def __init__(self, content):
+        self.starts = []
+        self.headings = []
+        self.fence_at = []      # offset of a ``` that opens the line, or None
+        self.in_code = []       # inside a code block at the start of the line
+        
+        in_code = False
+        offset = 0
+        for line in content.split('\n'):
+            stripped = line.lstrip()
+            indent = len(line) - len(stripped)
+            is_fence = stripped.startswith('```')
+            
+            self.starts.append(offset)
+            self.headings.append(stripped.startswith('#'))
+            self.fence_at.append(offset + indent if is_fence else None)
+            self.in_code.append(in_code)
+            
+            if is_fence:
+                in_code = not in_code
+            offset += len(line) + 1
+    
+    def line_of(self, pos):
+        return bisect_right(self.starts, pos) - 1
+    
+    def is_heading(self, pos):
+        return self.headings[self.line_of(pos)]
+    
+    def is_code(self, pos):
+        """Whether pos is in a code block, counting a fence earlier on its own line."""
+        line = self.line_of(pos)
+        in_code = self.in_code[line]
+        fence = self.fence_at[line]
+        if fence is not None and fence + 3 <= pos:
+            in_code = not in_code
+        return in_code
+
 def add_cross_references(content, doc_map, current_file):
     """Add cross-reference links to the content."""
+    if not doc_map:
+        return content
     
-    # Build regex pattern from document map
-    patterns = sorted(doc_map.keys(), key=len, reverse=True)
-    escaped_patterns = [re.escape(p) for p in patterns]
-    # Include optional year suffix (like -2018) as part of the match
-    pattern = r'\b(' + '|'.join(escaped_patterns) + r')(?:-\d{4})?(?:\s*\(\d{4}\))?'
-    regex = re.compile(pattern, re.IGNORECASE)
+    regex = get_linker(doc_map).regex
+    lines = LineIndex(content)
     
     def replace_reference(match):
         """Replace a reference with a markdown link."""
@@ -121,21 +236,11 @@ def add_cross_references(content, doc_map, current_file):
                 return full_match
 
             # Check if we're in a heading line (starts with #)
-            line_start = content.rfind('\n', 0, start_pos) + 1
-            line_end = content.find('\n', start_pos)
-            if line_end == -1:
-                line_end = len(content)
-            current_line = content[line_start:line_end].strip()
-            if current_line.startswith('#'):
+            if lines.is_heading(start_pos):
                 return full_match
             
             # Check if we're in a code block
-            lines_before = content[:start_pos].split('\n')
-            in_code = False
-            for line in lines_before:
-                if line.strip().startswith('```'):
-                    in_code = not in_code
-            if in_code:
+            if lines.is_code(start_pos):
                 return full_match
             
             # Create markdown link
@@ -145,32 +250,151 @@ def add_cross_references(content, doc_map, current_file):
     
     return regex.sub(replace_reference, content)
 
-def process_markdown_files():
-    """Process all markdown files in src directory."""
+def reference_keys(content, doc_map):
+    """The document map keys mentioned anywhere in content, linked or not."""
+    if not doc_map:
+        return []
+    regex = get_linker(doc_map).regex
+    return sorted({match.group(1).lower() for match in regex.finditer(content)})
+
+def unlink_stale_references(content, old_map, doc_map):
+    """
+    Unwrap links this script generated whose key no longer points at the same
+    file, so add_cross_references() can relink them to the current target.
+    """
+    stale_paths = {path for key, path in old_map.items() if doc_map.get(key) != path}
+    if not stale_paths:
+        return content
+    old_regex = ReferenceLinker(old_map).regex
+    
+    def unwrap(match):
+        text, path = match.group(1), match.group(2)
+        if path not in stale_paths:
+            return match.group(0)
+        reference = old_regex.fullmatch(text)
+        if reference and doc_map.get(reference.group(1).lower()) != path:
+            return text
+        return match.group(0)
+    
+    return re.sub(r'\[([^\[\]]+)\]\(([^)\s]+)\)', unwrap, content)
+
+class ReferenceIndex:
+    """
+    Persisted document map plus the reference keys each src/ page mentions.
+
+    With it, relinking after an edit only touches the edited pages and the
+    pages that mention a reference whose target appeared, moved or
+    disappeared, instead of every file in src/.
+    """
+    
+    INDEX_FILE = DEFAULT_CACHE_DIR / 'index' / 'cross-references.json'
+    
+    def __init__(self, doc_map=None, documents=None):
+        self.doc_map = doc_map
+        self.documents = documents or {}
+    
+    @classmethod
+    def load(cls):
+        """The saved index, or an empty one (forcing a full run) if there is none."""
+        if not cache_enabled() or not cls.INDEX_FILE.exists():
+            return cls()
+        try:
+            with open(cls.INDEX_FILE, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return cls(data['doc_map'], data['documents'])
+        except (OSError, ValueError, KeyError):
+            # A corrupt index only costs a full relink
+            return cls()
+    
+    def changed_keys(self, doc_map):
+        """Keys that were added, removed or now point at a different file."""
+        old_map = self.doc_map or {}
+        return {key for key in old_map.keys() | doc_map.keys() if old_map.get(key) != doc_map.get(key)}
+    
+    def affected_files(self, edited, all_files, doc_map):
+        """The files a relink has to touch after editing (or adding/removing) `edited`."""
+        changed = self.changed_keys(doc_map)
+        targets = {Path(f) for f in edited if Path(f).exists()}
+        
+        for md_file in all_files:
+            keys = self.documents.get(md_file.as_posix())
+            # Pages that were never indexed, or mention a key whose target changed
+            if keys is None or changed.intersection(keys):
+                targets.add(md_file)
+        
+        # Keys that are new since the last run can't be in the index yet
+        added = {key: doc_map[key] for key in changed if key in doc_map and key not in (self.doc_map or {})}
+        if added:
+            added_regex = ReferenceLinker(added).regex
+            for md_file in all_files:
+                if md_file not in targets and added_regex.search(md_file.read_text(encoding='utf-8')):
+                    targets.add(md_file)
+        
+        return sorted(targets)
+    
+    def record(self, md_file, content, doc_map):
+        self.documents[Path(md_file).as_posix()] = reference_keys(content, doc_map)
+    
+    def save(self, doc_map):
+        """Write the index, dropping pages that no longer exist."""
+        if not cache_enabled():
+            return
+        self.doc_map = doc_map
+        self.documents = {path: keys for path, keys in self.documents.items() if Path(path).exists()}
+        data = {'doc_map': self.doc_map, 'documents': self.documents}
+        atomic_write_text(self.INDEX_FILE, json.dumps(data, indent=2, sort_keys=True))
+
+def markdown_files(src_dir):
+    return sorted(f for f in src_dir.rglob("*.md") if f.name != "SUMMARY.md")
+
+def process_markdown_files(edited=None):
+    """
+    Process markdown files in the src directory.
+    
+    Args:
+        edited: Optional list of src/ files that changed. Only these, plus
+            files affected by references that appeared, moved or disappeared,
+            are relinked. Without it (or without a saved index) every file is.
+    """
     src_dir = Path("src")
     doc_map = build_document_map()
     
     print(f"Built document map with {len(doc_map)} reference patterns")
     
+    index = ReferenceIndex.load()
+    old_map = index.doc_map or {}
+    all_files = markdown_files(src_dir)
+    if edited is None or index.doc_map is None:
+        targets = all_files
+    else:
+        targets = index.affected_files(edited, all_files, doc_map)
+        print(f"Relinking {len(targets)} of {len(all_files)} files")
+    
+    # Every document's links depend on the full map, so it is part of the cache key
+    cache = BuildCache('cross-references', [__file__])
+    doc_map_key = json.dumps(doc_map, sort_keys=True)
+    
     processed_count = 0
     link_count = 0
     
-    # Process all .md files recursively
-    for md_file in src_dir.rglob("*.md"):
-        # Skip SUMMARY.md
-        if md_file.name == "SUMMARY.md":
-            continue
-        
+    for md_file in targets:
         # Read file content
-        content = md_file.read_text(encoding='utf-8')
-        original_content = content
+        original_content = md_file.read_text(encoding='utf-8')
+        content = unlink_stale_references(original_content, old_map, doc_map)
         
-        # Add cross-references
-        content = add_cross_references(content, doc_map, md_file)
+        # Add cross-references (or reuse the result from an earlier build)
+        cached = cache.get(md_file, content, doc_map_key)
+        if cached is not None:
+            linked = cached
+        else:
+            linked = add_cross_references(content, doc_map, md_file)
+            cache.put(md_file, content, linked, doc_map_key)
+        content = linked
+        index.record(md_file, content, doc_map)
         
         # Only write if content changed
         if content != original_content:
-            md_file.write_text(content, encoding='utf-8')
+            write_if_changed(md_file, content)
             
             # Count links added
             links_added = content.count('](../') - original_content.count('](../')
@@ -179,12 +403,21 @@ def process_markdown_files():
             print(f"  Processed {md_file.relative_to(src_dir)} - added {links_added} links")
             processed_count += 1
     
+    cache.save()
+    index.save(doc_map)
+    
     print(f"\nProcessed {processed_count} files, added {link_count} total cross-reference links")
 
 if __name__ == "__main__":
+    # Paths are given relative to where the script was run from
+    edited = [Path(arg).resolve() for arg in sys.argv[1:]] or None
+    
     # Change to repository root (two levels up from scripts/mdbook/)
     script_dir = Path(__file__).parent
-    repo_root = script_dir.parent.parent
+    repo_root = script_dir.parent.parent.resolve()
     os.chdir(repo_root)
     
-    process_markdown_files()
\ No newline at end of file
+    if edited is not None:
+        edited = [path.relative_to(repo_root) if path.is_relative_to(repo_root) else path for path in edited]
+    
+    process_markdown_files(edited)
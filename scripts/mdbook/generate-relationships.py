@@ -9,10 +9,14 @@ This creates a comprehensive mapping of document relationships including:
 """
 
 import re
+import sys
 import json
 from pathlib import Path
 from typing import Dict, List, Set
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from utils.build_cache import write_if_changed
+
 def extract_document_references(content: str) -> Dict[str, Set[str]]:
     """Extract all document references from markdown content."""
     references = {
@@ -312,10 +316,7 @@ def main():
     
     # Write to JSON file
     output_path = Path('src/relationships.json')
-    output_path.parent.mkdir(exist_ok=True)
-    
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(relationships, f, indent=2, ensure_ascii=False, sort_keys=True)
+    write_if_changed(output_path, json.dumps(relationships, indent=2, ensure_ascii=False, sort_keys=True))
     
     print(f"✅ Generated relationships.json with {relationships['metadata']['total_documents']} documents")
     print(f"   Found {relationships['metadata']['total_relationships']} documents with relationships")
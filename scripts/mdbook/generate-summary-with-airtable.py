@@ -12,6 +12,7 @@ from datetime import datetime
 
 # Add the scripts directory to the path so we can import utils
 sys.path.insert(0, str(Path(__file__).parent.parent))
+from utils.build_cache import write_if_changed
 from utils.title_resolver import TitleResolver
 
 def load_airtable_metadata():
@@ -537,7 +538,7 @@ def generate_summary():
     
     # Write the SUMMARY.md file
     summary_file = src_dir / "SUMMARY.md"
-    summary_file.write_text(''.join(summary), encoding='utf-8')
+    write_if_changed(summary_file, ''.join(summary))
     print(f"Generated SUMMARY.md with {len(summary)} lines using Airtable metadata")
 
 if __name__ == "__main__":
@@ -5,9 +5,13 @@ This script automatically creates the table of contents based on existing files.
 """
 
 import re
+import sys
 from pathlib import Path
 from datetime import datetime
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from utils.build_cache import write_if_changed
+
 def extract_title_from_file(filepath):
     """Extract a clean, concise title from the markdown file or filename."""
     # First try to get a short title from the filename
@@ -368,7 +372,7 @@ def generate_summary():
     
     # Write the SUMMARY.md file
     summary_file = src_dir / "SUMMARY.md"
-    summary_file.write_text(''.join(summary), encoding='utf-8')
+    write_if_changed(summary_file, ''.join(summary))
     print(f"Generated SUMMARY.md with {len(summary)} lines")
 
 if __name__ == "__main__":
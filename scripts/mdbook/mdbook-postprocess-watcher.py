@@ -5,32 +5,38 @@ Smart watcher for mdBook rebuilds that automatically runs post-processors.
 This solves the issue where mdBook's internal rebuild bypasses our custom processors,
 causing form fields to lose styling and cross-references to disappear.
 
-Instead of a fixed wait time, this watches for actual file changes in the book/ 
-directory and runs post-processors when mdBook finishes rebuilding.
+Instead of a fixed wait time, this listens for file system events in the book/
+directory and runs post-processors when mdBook finishes rebuilding - only on the
+pages mdBook actually rewrote.
 """
 
-import os
 import sys
 import time
 import subprocess
-import hashlib
+import threading
 from pathlib import Path
 from datetime import datetime
-import json
+
+from watchdog.observers import Observer
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from utils.build_cache import hash_file
+from utils.change_watcher import SettlingHandler
 
 class MdBookWatcher:
     def __init__(self, book_dir="book", verbose=False):
         self.book_dir = Path(book_dir)
         self.verbose = verbose
-        self.html_files = {}
         self.last_rebuild = None
-        self.rebuild_in_progress = False
         self.rebuild_complete_threshold = 0.5  # seconds of no changes to consider rebuild done
+        # Page -> hash of what the post-processors left there, so their own
+        # writes aren't mistaken for another rebuild
+        self.processed = {}
+        self.lock = threading.Lock()
         
-        # Post-processors to run after rebuild
+        # Post-processors to run after rebuild; each is passed the changed pages
         self.postprocessors = [
-            "scripts/postprocessing/custom-list-processor.py",
-            "scripts/postprocessing/enhanced-custom-processor.py"
+            "scripts/postprocessing/run-postprocessing.py"
         ]
         
     def log(self, message):
@@ -39,83 +45,64 @@ class MdBookWatcher:
             timestamp = datetime.now().strftime("%H:%M:%S")
             print(f"[{timestamp}] {message}")
     
-    def get_html_files(self):
-        """Get all HTML files in book directory."""
-        html_files = {}
-        for html_file in self.book_dir.glob("**/*.html"):
-            # Skip print.html and 404.html as they're special
-            if html_file.name in ["print.html", "404.html"]:
+    def rewritten_pages(self, paths):
+        """The changed pages that mdBook wrote, leaving out the post-processors' own writes."""
+        pages = []
+        for path in paths:
+            if not path.exists():
+                self.log(f"Deleted: {path.name}")
                 continue
-            html_files[str(html_file)] = self.get_file_hash(html_file)
-        return html_files
-    
-    def get_file_hash(self, filepath):
-        """Get a quick hash of file content (first 1KB for speed)."""
-        try:
-            with open(filepath, 'rb') as f:
-                # Only read first 1KB for speed
-                content = f.read(1024)
-                return hashlib.md5(content).hexdigest()
-        except:
-            return None
-    
-    def detect_changes(self):
-        """Check if any HTML files have changed."""
-        current_files = self.get_html_files()
-        
-        if not self.html_files:
-            # First run - initialize
-            self.html_files = current_files
-            return False
-        
-        # Check for changes
-        changed = False
-        for filepath, file_hash in current_files.items():
-            if filepath not in self.html_files or self.html_files[filepath] != file_hash:
-                changed = True
-                self.log(f"Changed: {Path(filepath).name}")
-        
-        # Check for deleted files
-        for filepath in self.html_files:
-            if filepath not in current_files:
-                changed = True
-                self.log(f"Deleted: {Path(filepath).name}")
-        
-        self.html_files = current_files
-        return changed
+            if self.processed.get(path) == hash_file(path):
+                continue
+            self.log(f"Changed: {path.name}")
+            pages.append(path)
+        return pages
     
-    def run_postprocessors(self):
-        """Run all post-processing scripts."""
-        print("🎨 Running post-processors to restore custom formatting...", flush=True)
+    def run_postprocessors(self, pages):
+        """Run all post-processing scripts on the given pages."""
+        print(f"🎨 Running post-processors on {len(pages)} page(s) to restore custom formatting...", flush=True)
         
         for script in self.postprocessors:
             if Path(script).exists():
                 try:
                     self.log(f"Running {script}")
                     result = subprocess.run(
-                        ["python3", script],
+                        ["python3", script] + [str(page) for page in pages],
                         capture_output=True,
                         text=True,
                         timeout=30
                     )
-                    if result.returncode != 0 and self.verbose:
+                    if result.returncode != 0:
                         print(f"  ⚠️  {script} had issues: {result.stderr}", flush=True)
                 except subprocess.TimeoutExpired:
                     print(f"  ⚠️  {script} timed out", flush=True)
                 except Exception as e:
                     print(f"  ❌ Error running {script}: {e}", flush=True)
         
+        for page in pages:
+            self.processed[page] = hash_file(page)
+        
         print("✅ Post-processing complete - custom formatting restored", flush=True)
     
-    def watch(self, check_interval=0.1):
+    def on_rebuild(self, paths):
+        """Called once a burst of book/ changes has settled."""
+        with self.lock:
+            pages = self.rewritten_pages(paths)
+            if not pages:
+                return
+            self.last_rebuild = time.time()
+            print(f"\n🔄 mdBook rebuild detected at {datetime.now().strftime('%H:%M:%S')}", flush=True)
+            self.run_postprocessors(pages)
+            print(flush=True)
+    
+    def watch(self):
         """
         Watch for mdBook rebuilds and run post-processors when complete.
         
         Strategy:
-        1. Check for HTML file changes frequently
-        2. When changes detected, mark rebuild as in progress
-        3. When no changes for threshold time, consider rebuild complete
-        4. Run post-processors once after rebuild completes
+        1. Collect changed HTML pages from file system events (no polling)
+        2. Treat the rebuild as complete once no page has changed for the threshold
+        3. Run post-processors once, on just the pages mdBook rewrote
         """
         print("👁️  Watching for mdBook rebuilds...", flush=True)
         print(f"   • Monitoring: {self.book_dir}", flush=True)
@@ -124,36 +111,19 @@ class MdBookWatcher:
             print("   • Run with --verbose for detailed logging", flush=True)
         print(flush=True)
         
-        last_change_time = None
+        handler = SettlingHandler(self.on_rebuild, self.rebuild_complete_threshold, suffixes=('.html',))
+        observer = Observer()
+        observer.schedule(handler, str(self.book_dir), recursive=True)
+        observer.start()
         
         try:
-            while True:
-                if self.detect_changes():
-                    # Changes detected
-                    last_change_time = time.time()
-                    
-                    if not self.rebuild_in_progress:
-                        self.rebuild_in_progress = True
-                        self.log("mdBook rebuild detected...")
-                
-                elif self.rebuild_in_progress and last_change_time:
-                    # Check if rebuild is complete (no changes for threshold time)
-                    time_since_change = time.time() - last_change_time
-                    
-                    if time_since_change >= self.rebuild_complete_threshold:
-                        # Rebuild appears complete
-                        self.rebuild_in_progress = False
-                        self.last_rebuild = time.time()
-                        
-                        print(f"\n🔄 mdBook rebuild detected at {datetime.now().strftime('%H:%M:%S')}", flush=True)
-                        self.run_postprocessors()
-                        print(flush=True)
-                
-                time.sleep(check_interval)
-                
+            while observer.is_alive():
+                observer.join(1)
         except KeyboardInterrupt:
             print("\n\n🛑 Watcher stopped")
-            sys.exit(0)
+        finally:
+            observer.stop()
+            observer.join()
 
 def main():
     import argparse
@@ -161,8 +131,6 @@ def main():
     parser = argparse.ArgumentParser(description='Watch for mdBook rebuilds and run post-processors')
     parser.add_argument('--book-dir', default='book', help='Path to book directory (default: book)')
     parser.add_argument('--verbose', action='store_true', help='Enable verbose logging')
-    parser.add_argument('--interval', type=float, default=0.1, 
-                       help='Check interval in seconds (default: 0.1)')
     parser.add_argument('--threshold', type=float, default=0.5,
                        help='Seconds of no changes to consider rebuild complete (default: 0.5)')
     
@@ -181,7 +149,7 @@ def main():
     
     watcher = MdBookWatcher(args.book_dir, args.verbose)
     watcher.rebuild_complete_threshold = args.threshold
-    watcher.watch(args.interval)
+    watcher.watch()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -3,6 +3,11 @@
 Sync Airtable Public Metadata with local document repository.
 Handles both full sync and incremental updates with smart caching.
 Reports mismatches between Airtable and local files for correction.
+
+The fetch doesn't depend on local files, so build-all.sh runs it in the
+background at the start of the build (--fetch-only, which saves the records to
+.build-cache/airtable/prefetch.json) and matches them once relationships.json
+exists (--from-prefetch).
 """
 
 import os
@@ -11,7 +16,7 @@ import json
 import time
 import argparse
 from pathlib import Path
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional, Set
 import re
 
@@ -19,18 +24,154 @@ import re
 from dotenv import load_dotenv
 load_dotenv()
 
-# Initialize Airtable API
-from pyairtable import Api
-api = Api(os.environ['AIRTABLE_API_KEY'])
-base = api.base(os.environ['AIRTABLE_BASE_ID'])
-table = base.table(os.environ.get('AIRTABLE_TABLE_NAME', 'Governing_Metadata'))
+# Initialize Airtable API (rate-limited, retrying client shared by every fetch)
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from utils.airtable_client import SNAPSHOT_DIR, AirtableClient, AirtableError
+from utils.build_cache import atomic_write_text
+from utils.metadata_store import MetadataStore
+from utils.script_loader import load_script
+client = AirtableClient.from_env()
+table = client.table(os.environ.get('AIRTABLE_TABLE_NAME', 'Governing_Metadata'))
+
+# Records fetched by --fetch-only, waiting for --from-prefetch
+PREFETCH_FILE = SNAPSHOT_DIR / 'prefetch.json'
+
+def save_prefetch(fetched: Dict):
+    atomic_write_text(PREFETCH_FILE, json.dumps(fetched, ensure_ascii=False))
+
+def take_prefetch() -> Dict:
+    """The records saved by --fetch-only (removed once read, so they are used once)."""
+    try:
+        with open(PREFETCH_FILE, 'r', encoding='utf-8') as f:
+            fetched = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    PREFETCH_FILE.unlink(missing_ok=True)
+    return fetched
+
+def normalize_doc_number(number) -> str:
+    """Doc number as compared by AirtableSync.match_documents()."""
+    return str(number).replace('#', '').strip().upper()
+
+class LocalDocumentIndex:
+    """
+    Local documents indexed by every key AirtableSync uses to match a record,
+    so each record resolves with a few dictionary lookups instead of a scan
+    of all local documents.
+
+    Where several documents match a record, the first one in load order wins,
+    exactly as with the old linear scans.
+    """
+    
+    def __init__(self, local_docs: Dict[str, Dict]):
+        self.order = {}            # local key -> position in load order
+        self.by_filename = {}      # local filename -> [local keys]
+        self.ord_54_89c = []       # local keys whose filename contains 54-89C
+        self.by_type_year = {}     # (type, year) -> [local keys]
+        self.by_number = {}        # (type, number) -> [local keys]
+        self.by_base = {}          # (type, number before the first '-') -> [keys with '-' in number]
+        self.by_plain_number = {}  # (type, number) -> [keys without '-' in number]
+        self.by_clean = {}         # (type, number without '-') -> [local keys]
+        self.by_clean_alpha = {}   # same, only for numbers ending in a letter
+        self.docs = local_docs
+        
+        for position, (local_key, local_doc) in enumerate(local_docs.items()):
+            self.order[local_key] = position
+            local_file = local_doc['file']
+            self.by_filename.setdefault(local_file, []).append(local_key)
+            if '54-89C' in local_file:
+                self.ord_54_89c.append(local_key)
+            
+            info = local_doc['extracted_info']
+            doc_type = info.get('type')
+            if doc_type in ('other', 'interpretation'):
+                self.by_type_year.setdefault((doc_type, info.get('year')), []).append(local_key)
+            elif doc_type in ('ordinance', 'resolution'):
+                number = normalize_doc_number(info.get('number', ''))
+                clean = number.replace('-', '')
+                self.by_number.setdefault((doc_type, number), []).append(local_key)
+                self.by_clean.setdefault((doc_type, clean), []).append(local_key)
+                if number and number[-1].isalpha():
+                    self.by_clean_alpha.setdefault((doc_type, clean), []).append(local_key)
+                if '-' in number:
+                    self.by_base.setdefault((doc_type, number.split('-')[0]), []).append(local_key)
+                else:
+                    self.by_plain_number.setdefault((doc_type, number), []).append(local_key)
+    
+    def first(self, candidates) -> Optional[Dict]:
+        """The matching local document that comes first in load order."""
+        candidates = [key for keys in candidates for key in keys]
+        if not candidates:
+            return None
+        return self.docs[min(candidates, key=self.order.__getitem__)]
+    
+    def match_by_url(self, airtable_record: Dict) -> Optional[Dict]:
+        """Index equivalent of trying match_documents_by_url() on every local document."""
+        md_url = airtable_record.get('md_url', '')
+        if not md_url:
+            return None
+        
+        # Local filenames end in .md and contain no '/', so any filename that
+        # occurs in the URL is a substring of one path segment ending in .md
+        candidates = []
+        for segment in md_url.split('/'):
+            end = segment.find('.md')
+            while end != -1:
+                end += len('.md')
+                for start in range(end):
+                    keys = self.by_filename.get(segment[start:end])
+                    if keys:
+                        candidates.append(keys)
+                end = segment.find('.md', end - 2)
+        if '54-89-C' in md_url:
+            candidates.append(self.ord_54_89c)
+        airtable_filename = airtable_record.get('filename')
+        if airtable_filename:
+            candidates.append(self.by_filename.get(airtable_filename, []))
+        return self.first(candidates)
+    
+    def match(self, airtable_record: Dict) -> Optional[Dict]:
+        """Index equivalent of trying match_documents() on every local document."""
+        doc_type = airtable_record.get('type')
+        if doc_type in ('other', 'interpretation'):
+            return self.first([self.by_type_year.get((doc_type, airtable_record.get('year')), [])])
+        if doc_type not in ('ordinance', 'resolution'):
+            return None
+        
+        number = normalize_doc_number(airtable_record.get('doc_number', ''))
+        clean = number.replace('-', '')
+        candidates = [
+            self.by_number.get((doc_type, number), []),
+            # 54-89C matching 54-89-C, when either side ends with a letter
+            self.by_clean_alpha.get((doc_type, clean), []),
+        ]
+        if number and number[-1].isalpha():
+            candidates.append(self.by_clean.get((doc_type, clean), []))
+        # Year in doc number on one side only
+        if '-' in number:
+            candidates.append(self.by_plain_number.get((doc_type, number.split('-')[0]), []))
+        else:
+            candidates.append(self.by_base.get((doc_type, number), []))
+        return self.first(candidates)
 
 class AirtableSync:
     def __init__(self, cache_file='book/airtable-metadata.json', 
                  relationships_file='book/relationships.json'):
         self.cache_file = Path(cache_file)
+        # Per-record store the cache file is exported from
+        self.store = MetadataStore.for_export(self.cache_file)
         self.relationships_file = Path(relationships_file)
         self.cache_max_age_hours = 24
+        # Committed copy of the cache, used as the delta base when book/ is
+        # empty (e.g. a fresh CI checkout)
+        self.seed_file = Path('src/airtable-metadata.json')
+        # Re-fetch records modified shortly before the last high-water mark,
+        # in case Airtable's clock is ahead of ours
+        self.delta_overlap = timedelta(minutes=5)
+        # LAST_MODIFIED_TIME() doesn't change when a lookup field does
+        # (governing_doc_type, digitized, passed_date), so refetch everything
+        # once the last full fetch is this old
+        self.full_sync_max_age = timedelta(days=7)
         self.mismatches = {
             'missing_in_airtable': [],
             'missing_locally': [],
@@ -182,26 +323,21 @@ class AirtableSync:
     def fetch_airtable_records(self, filter_formula: Optional[str] = None) -> List[Dict]:
         """
         Fetch records from Airtable Public Metadata table.
+        
+        Raises AirtableError if the fetch fails (after retries) - an empty
+        result would otherwise overwrite the cache and show every local doc
+        as "missing in Airtable".
         """
-        try:
-            print("  ☁️  Fetching from Airtable API...")
-            
-            if filter_formula:
-                print(f"    Using filter: {filter_formula}")
-                records = table.all(formula=filter_formula)
-            else:
-                records = table.all()
-            
-            print(f"  ✓ Retrieved {len(records)} records from Airtable")
-            return [self.process_airtable_record(r) for r in records]
-            
-        except Exception as e:
-            print(f"  ❌ Error fetching from Airtable: {e}")
-            print("  📝 Check your API credentials and table name")
-            
-            # Return empty list to allow script to continue
-            # This will show all local docs as "missing in Airtable"
-            return []
+        print("  ☁️  Fetching from Airtable API...")
+        
+        if filter_formula:
+            print(f"    Using filter: {filter_formula}")
+            records = table.all(formula=filter_formula)
+        else:
+            records = table.all()
+        
+        print(f"  ✓ Retrieved {len(records)} records from Airtable")
+        return [self.process_airtable_record(r) for r in records]
     
     def process_airtable_record(self, record: Dict) -> Dict:
         """Process raw Airtable record into our cache format."""
@@ -256,6 +392,78 @@ class AirtableSync:
             'last_updated': fields.get('last_updated', datetime.now().isoformat())
         }
     
+    def load_delta_base(self) -> Optional[Dict]:
+        """
+        The previous sync result to apply a delta to, or None if only a full
+        fetch will do (no cache, no high-water mark, a cache written before
+        unmatched records were kept, or a last full fetch older than
+        full_sync_max_age).
+        
+        The metadata store keeps the last export even when book/ is gone, so a
+        CI run that restores .build-cache/ still has it. Between the store and
+        the committed seed, the one synced most recently wins.
+        """
+        candidates = [self.store.snapshot()]
+        if self.seed_file.exists():
+            with open(self.seed_file, 'r') as f:
+                candidates.append(json.load(f))
+        
+        bases = [base for base in candidates
+                 if base.get('metadata', {}).get('sync_high_water_mark') and 'unmatched_records' in base]
+        if not bases:
+            return None
+        base = max(bases, key=lambda base: base['metadata']['sync_high_water_mark'])
+        
+        last_full_sync = self.parse_sync_time(base['metadata'].get('last_full_sync'))
+        if last_full_sync is None or datetime.now() - last_full_sync > self.full_sync_max_age:
+            print(f"  ⏰ Last full fetch is older than {self.full_sync_max_age.days} days, refetching everything")
+            return None
+        return base
+    
+    @staticmethod
+    def parse_sync_time(value) -> Optional[datetime]:
+        """A cache timestamp as a naive local datetime (older caches wrote UTC with a Z)."""
+        try:
+            parsed = datetime.fromisoformat(str(value).replace('Z', '+00:00'))
+        except ValueError:
+            return None
+        if parsed.tzinfo:
+            parsed = parsed.astimezone().replace(tzinfo=None)
+        return parsed
+    
+    def fetch_delta_records(self, base: Dict) -> List[Dict]:
+        """
+        Bring the records from a previous sync up to date, fetching only what
+        changed in Airtable since its high-water mark:
+        1. An ID-only listing of the table, to drop deleted records
+        2. Every record modified since the mark (plus any ID we've never seen)
+        """
+        since = base['metadata']['sync_high_water_mark']
+        
+        known = {}
+        for record in list(base.get('documents', {}).values()) + list(base['unmatched_records'].values()):
+            if record.get('airtable_id') and not record.get('provisional'):
+                known.setdefault(record['airtable_id'], record)
+        
+        print(f"  ☁️  Listing record IDs...")
+        current_ids = [r['id'] for r in table.all(fields=['display_name'])]
+        deleted = set(known) - set(current_ids)
+        
+        formula = f"IS_AFTER(LAST_MODIFIED_TIME(), DATETIME_PARSE('{since}'))"
+        unseen = [record_id for record_id in current_ids if record_id not in known]
+        if unseen:
+            formula = "OR(" + ", ".join([formula] + [f"RECORD_ID()='{record_id}'" for record_id in unseen]) + ")"
+        print(f"  ☁️  Fetching records modified since {since}...")
+        changed = [self.process_airtable_record(r) for r in table.all(formula=formula)]
+        
+        print(f"  ✓ Delta: {len(changed)} changed, {len(deleted)} deleted, "
+              f"{len(current_ids) - len(changed)} unchanged")
+        
+        records = {record_id: known[record_id] for record_id in current_ids if record_id in known}
+        for record in changed:
+            records[record['airtable_id']] = record
+        return [records[record_id] for record_id in current_ids if record_id in records]
+    
     def should_refresh_cache(self, force: bool = False) -> bool:
         """Check if cache needs refreshing."""
         if force:
@@ -278,7 +486,7 @@ class AirtableSync:
         return False
     
     def load_cache(self) -> Dict:
-        """Load existing cache file."""
+        """Load existing cache (from the store, which mirrors the cache file)."""
         if not self.cache_file.exists():
             return {
                 'metadata': {
@@ -288,8 +496,7 @@ class AirtableSync:
                 'documents': {}
             }
             
-        with open(self.cache_file, 'r') as f:
-            return json.load(f)
+        return self.store.snapshot()
     
     def validate_cache_data(self, data: Dict) -> bool:
         """Validate cache data before saving to prevent partial overwrites."""
@@ -303,8 +510,7 @@ class AirtableSync:
             
             # Check if we have an existing cache with more data
             if self.cache_file.exists():
-                existing_cache = self.load_cache()
-                existing_count = len(existing_cache.get('documents', {}))
+                existing_count = self.store.count('documents')
                 if existing_count > total_records:
                     print(f"     Existing cache has {existing_count} documents - preventing overwrite")
                     print(f"     Use --force flag to override this protection")
@@ -316,10 +522,7 @@ class AirtableSync:
         return True
     
     def save_cache(self, data: Dict, force_save: bool = False):
-        """Save cache file with validation."""
-        # Ensure directory exists
-        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
-        
+        """Save a whole cache (full sync) with validation."""
         # Validate before saving unless forced
         if not force_save and not self.validate_cache_data(data):
             print("  ❌ Cache save aborted due to validation failure")
@@ -330,13 +533,41 @@ class AirtableSync:
         data['metadata']['last_updated'] = datetime.now().isoformat()
         data['metadata']['total_records'] = len(data['documents'])
         
-        with open(self.cache_file, 'w') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        self.store.replace(data)
+        self.store.export()
         
         return True
     
-    def full_sync(self, force: bool = False):
-        """Perform full sync of all documents."""
+    def fetch_for_sync(self, full: bool = False) -> Dict:
+        """
+        The Airtable side of a full sync - only what changed, when a previous
+        sync allows it. Needs no local files, so it can run ahead of matching.
+        
+        Returns {'sync_started', 'delta', 'records'}; raises AirtableError.
+        """
+        sync_started = datetime.now(timezone.utc)
+        base = None if full else self.load_delta_base()
+        airtable_records = None
+        if base:
+            try:
+                airtable_records = self.fetch_delta_records(base)
+            except Exception as e:
+                print(f"  ⚠️  Delta sync failed ({e}), falling back to a full fetch")
+        if airtable_records is None:
+            base = None
+            airtable_records = self.fetch_airtable_records()
+        return {'sync_started': sync_started.isoformat(), 'delta': base is not None,
+                'records': airtable_records}
+    
+    def full_sync(self, force: bool = False, full: bool = False, fetched: Optional[Dict] = None):
+        """
+        Perform full sync of all documents.
+        
+        Args:
+            force: Sync even if the cache is fresh
+            full: Refetch every record instead of applying a delta to the cache
+            fetched: Result of an earlier fetch_for_sync() (--from-prefetch)
+        """
         print("\n📊 Full Airtable Sync")
         print("=" * 50)
         
@@ -349,19 +580,33 @@ class AirtableSync:
         local_docs = self.load_local_documents()
         print(f"  ✓ Found {len(local_docs)} local documents")
         
-        # Fetch from Airtable
-        print("\n☁️  Fetching from Airtable...")
-        airtable_records = self.fetch_airtable_records()
+        if fetched is None:
+            print("\n☁️  Fetching from Airtable...")
+            fetched = self.fetch_for_sync(full)
+        else:
+            print(f"\n☁️  Using records fetched at {fetched['sync_started']}")
+        sync_started = datetime.fromisoformat(fetched['sync_started'])
+        base = self.load_delta_base() if fetched['delta'] else None
+        airtable_records = fetched['records']
         print(f"  ✓ Found {len(airtable_records)} Airtable records")
         
         # Process and match records
+        now = datetime.now().isoformat()
+        high_water_mark = (sync_started - self.delta_overlap).strftime('%Y-%m-%dT%H:%M:%SZ')
         cache_data = {
             'metadata': {
                 'cache_version': '1.1',
-                'last_full_sync': datetime.now().isoformat()
+                'last_full_sync': base['metadata'].get('last_full_sync', now) if base else now,
+                'sync_high_water_mark': high_water_mark,
+                'sync_mode': 'delta' if base else 'full'
             },
-            'documents': {}
+            'documents': {},
+            # Records with no local file; kept so a delta sync can re-match
+            # them when the file is added
+            'unmatched_records': {}
         }
+        if base:
+            cache_data['metadata']['last_delta_sync'] = now
         
         # Track what we've matched
         matched_local = set()
@@ -369,31 +614,27 @@ class AirtableSync:
         
         # Match Airtable records to local files
         print("\n🔍 Attempting to match records...")
+        index = LocalDocumentIndex(local_docs)
         for record in airtable_records:
-            # Try to find matching local document
-            local_match = None
-            
             # First try URL-based matching (most accurate)
-            if record.get('md_url'):
-                for local_key, local_doc in local_docs.items():
-                    if self.match_documents_by_url(record, local_doc['file']):
-                        local_match = local_doc
-                        matched_local.add(local_key)
-                        print(f"  ✅ Matched by URL: {record['display_name']} → {local_match['file']}")
-                        break
-            
-            # If no URL match, fall back to legacy matching
-            if not local_match:
-                for local_key, local_doc in local_docs.items():
-                    if self.match_documents(record, local_doc['extracted_info']):
-                        local_match = local_doc
-                        matched_local.add(local_key)
-                        print(f"  ✅ Matched by pattern: {record['display_name']} → {local_match['file']}")
-                        break
+            local_match = index.match_by_url(record)
+            if local_match:
+                print(f"  ✅ Matched by URL: {record['display_name']} → {local_match['file']}")
+            else:
+                # If no URL match, fall back to legacy matching
+                local_match = index.match(record)
+                if local_match:
+                    print(f"  ✅ Matched by pattern: {record['display_name']} → {local_match['file']}")
             
             if local_match:
+                matched_local.add(local_match['key'])
                 # Store with local filename as key for consistency
                 cache_key = local_match['file'].replace('.md', '')
+                displaced = cache_data['documents'].get(cache_key)
+                if displaced and displaced['airtable_id'] != record['airtable_id']:
+                    # Keep the record this one replaces, so the next delta sync
+                    # still knows it instead of refetching it every time
+                    cache_data['unmatched_records'][displaced['airtable_id']] = displaced
                 cache_data['documents'][cache_key] = record
                 matched_airtable.add(record['airtable_id'])
             else:
@@ -402,6 +643,7 @@ class AirtableSync:
                     print(f"  ❓ No match: {record['display_name']} (URL: {record.get('md_url')})")
                 else:
                     print(f"  ❓ No match: {record['display_name']} (Type: {record['type']}, Year: {record['year']}, Num: {record.get('doc_number')})")
+                cache_data['unmatched_records'][record['airtable_id']] = record
                 self.mismatches['missing_locally'].append({
                     'airtable_id': record['airtable_id'],
                     'display_name': record['display_name'],
@@ -434,13 +676,16 @@ class AirtableSync:
         )
     
     def incremental_update(self, filename: str, create_if_missing: bool = False):
-        """Update cache for a single document."""
+        """
+        Update cache for a single document.
+        
+        Upserts the one record in the store and re-exports the cache file;
+        the existing cache is never loaded, and an upsert can't lose
+        documents, so there is nothing to validate.
+        """
         print(f"\n📄 Incremental Update: {filename}")
         print("=" * 50)
         
-        # Load existing cache
-        cache = self.load_cache()
-        
         # Extract document info from filename
         doc_info = self.extract_document_info(filename)
         
@@ -454,51 +699,39 @@ class AirtableSync:
             if self.match_documents(r, doc_info)
         ]
         
+        cache_key = filename.replace('.md', '')
+        now = datetime.now().isoformat()
+        if not self.store.metadata():
+            # First entry of a new cache
+            self.store.update_metadata(cache_version='1.1')
+        
         if matching_records:
             record = matching_records[0]
             print(f"  ✓ Found in Airtable: {record['display_name']}")
             
-            # Update cache
-            cache_key = filename.replace('.md', '')
-            cache['documents'][cache_key] = record
-            cache['metadata']['last_partial_update'] = datetime.now().isoformat()
-            
-            # Track incremental updates
-            if 'incremental_updates' not in cache['metadata']:
-                cache['metadata']['incremental_updates'] = []
-            cache['metadata']['incremental_updates'].append({
-                'filename': filename,
-                'updated_at': datetime.now().isoformat()
-            })
-            
-            # Keep only last 50 incremental updates
-            cache['metadata']['incremental_updates'] = \
-                cache['metadata']['incremental_updates'][-50:]
-            
-            # Save with validation (incremental updates should not reduce total count)
-            if self.save_cache(cache):
-                print("  ✓ Cache updated")
-            else:
-                print("  ⚠️  Cache update failed validation")
+            # Update cache, tracking incremental updates (the store keeps the last 50)
+            self.store.upsert('documents', cache_key, record)
+            self.store.log_update(filename, now)
+            self.store.update_metadata(last_updated=now, total_records=self.store.count('documents'),
+                                       last_partial_update=now)
+            self.store.export()
+            print("  ✓ Cache updated")
             
         elif create_if_missing:
             print(f"  ⚠️  Not found in Airtable")
             print(f"     Creating provisional entry")
             
             # Create provisional entry
-            cache_key = filename.replace('.md', '')
-            cache['documents'][cache_key] = {
+            self.store.upsert('documents', cache_key, {
                 'filename': filename,
                 'display_name': self.generate_display_name(filename),
                 'status': 'Draft',
                 'provisional': True,
-                'created_at': datetime.now().isoformat()
-            }
-            
-            if self.save_cache(cache):
-                print("  ✓ Provisional entry created")
-            else:
-                print("  ⚠️  Failed to save provisional entry")
+                'created_at': now
+            })
+            self.store.update_metadata(last_updated=now, total_records=self.store.count('documents'))
+            self.store.export()
+            print("  ✓ Provisional entry created")
             
         else:
             print(f"  ❌ Not found in Airtable and --create-if-missing not set")
@@ -599,7 +832,7 @@ class AirtableSync:
         print("=" * 50)
         
         # Force a full sync to get fresh data
-        self.full_sync(force=True)
+        self.full_sync(force=True, full=True)
         
         # Load cache to check for provisional entries
         cache = self.load_cache()
@@ -627,6 +860,8 @@ def main():
     parser.add_argument('--file', help='Filename for single document update')
     parser.add_argument('--force', action='store_true', 
                        help='Force refresh even if cache is fresh')
+    parser.add_argument('--full', action='store_true',
+                       help='Refetch every record instead of only those modified since the last sync')
     parser.add_argument('--if-stale', action='store_true',
                        help='Only sync if cache is stale')
     parser.add_argument('--create-if-missing', action='store_true',
@@ -635,6 +870,16 @@ def main():
                        help='Run reconciliation report')
     parser.add_argument('--cache-file', default='book/airtable-metadata.json',
                        help='Path to cache file')
+    parser.add_argument('--include-meetings', action='store_true',
+                       help='Also sync Meetings_Metadata, fetched concurrently with the governing documents')
+    parser.add_argument('--meetings-cache-file', default='book/meetings-metadata.json',
+                       help='Path to meetings cache file (with --include-meetings)')
+    parser.add_argument('--fetch-only', action='store_true',
+                       help=f'Fetch the records a full sync needs into {PREFETCH_FILE.name} and stop '
+                            '(run ahead of the local build steps)')
+    parser.add_argument('--from-prefetch', action='store_true',
+                       help='Match the records saved by --fetch-only instead of fetching them '
+                            '(fetches as usual if there are none)')
     
     args = parser.parse_args()
     
@@ -646,18 +891,64 @@ def main():
         syncer.reconcile()
         return
     
-    # Handle sync modes
-    if args.mode == 'single':
-        if not args.file:
-            print("Error: --file required for single mode")
-            sys.exit(1)
-        syncer.incremental_update(args.file, args.create_if_missing)
-    else:
-        # Full sync
-        if args.if_stale and not syncer.should_refresh_cache():
+    if args.mode == 'single' and not args.file:
+        print("Error: --file required for single mode")
+        sys.exit(1)
+    
+    if args.fetch_only and args.mode == 'single':
+        print("Error: --fetch-only only applies to full mode")
+        sys.exit(1)
+    
+    prefetched = take_prefetch() if args.from_prefetch else {}
+    
+    def sync_governing():
+        # Handle sync modes
+        if args.mode == 'single':
+            syncer.incremental_update(args.file, args.create_if_missing)
+        elif args.if_stale and not syncer.should_refresh_cache():
             print("Cache is fresh, skipping sync")
-            return
-        syncer.full_sync(force=args.force)
+        else:
+            syncer.full_sync(force=args.force, full=args.full, fetched=prefetched.get('governing'))
+    
+    def prefetch_governing():
+        # A fresh cache means the sync will skip, so there is nothing to fetch
+        if syncer.should_refresh_cache(args.force):
+            return syncer.fetch_for_sync(args.full)
+    
+    try:
+        if args.fetch_only:
+            # Remove any earlier prefetch first, so a failed fetch leaves none behind
+            PREFETCH_FILE.unlink(missing_ok=True)
+            jobs = {'governing': prefetch_governing}
+            if args.include_meetings:
+                meetings = load_script('mdbook/sync-meetings-metadata.py')
+                jobs['meetings'] = client.table(meetings.MEETINGS_TABLE).all
+            fetched = {name: result for name, result in client.run_concurrently(jobs).items()
+                       if result is not None}
+            save_prefetch(fetched)
+            print(f"✓ Prefetched {', '.join(fetched) or 'nothing (cache is fresh)'}")
+        elif args.include_meetings:
+            # Both tables share the client's token bucket, so fetching them
+            # at once stays within Airtable's per-base rate limit
+            meetings = load_script('mdbook/sync-meetings-metadata.py')
+            meetings_sync = meetings.MeetingsSync(args.meetings_cache_file,
+                                                  table=client.table(meetings.MEETINGS_TABLE))
+            if 'meetings' in prefetched:
+                sync_governing()
+                meetings_sync.sync(prefetched['meetings'])
+            else:
+                results = client.run_concurrently({
+                    'governing': sync_governing,
+                    'meetings': meetings_sync.fetch_records,
+                })
+                meetings_sync.sync(results['meetings'])
+        else:
+            sync_governing()
+    except AirtableError as e:
+        # Fail loudly: the existing cache is left untouched
+        print(f"\n❌ Error fetching from Airtable: {e}")
+        print("  📝 Check your API credentials and table name")
+        sys.exit(1)
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
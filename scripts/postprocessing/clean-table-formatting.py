@@ -9,6 +9,9 @@ import re
 import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from utils.build_cache import write_if_changed
+
 def title_case_preserve_acronyms(text):
     """Convert to title case while preserving common acronyms."""
     # Common acronyms and Roman numerals to preserve in uppercase
@@ -141,7 +144,7 @@ def process_file(filepath, dry_run=False):
     if changed:
         new_content = '\n'.join(result_lines)
         if not dry_run:
-            path.write_text(new_content)
+            write_if_changed(path, new_content)
         return {'file': str(filepath), 'changed': True}
     return None
 
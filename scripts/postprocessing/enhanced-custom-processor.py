@@ -6,6 +6,7 @@ Handles special formatting (NOT lists - see unified-list-processor.py):
 - WHEREAS clauses
 - Complex nested structures
 - Document-specific formatting rules
+- Document Notes sections (the only Document Notes transform)
 
 NOTE: All list processing has been moved to unified-list-processor.py
 to prevent conflicts and maintain single responsibility.
@@ -14,9 +15,30 @@ to prevent conflicts and maintain single responsibility.
 import re
 import sys
 from pathlib import Path
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, NavigableString
 import json
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from utils.build_cache import BuildCache, write_if_changed
+from utils import document_types, html_parser
+from utils.html_parser import parse_html
+
+# h2 headers that start a Document Notes section (partial match)
+NOTE_SECTION_HEADERS = [
+    'Document Notes',
+    'Digitization Notes',
+    'Source Document Notes',
+    'Historical Notes',
+    'Handwritten notations',
+    'Handwritten Notations'
+]
+
+# h2 headers that label a note inside a section rather than end it
+NOTE_TYPE_HEADERS = ['handwritten note', 'stamp', 'digitization note',
+                     'editor note', 'historical note', 'source note']
+
+PAGE_REF_PATTERN = re.compile(r'(\[page \d+\])')
+
 class DocumentProcessor:
     def __init__(self):
         # Document-specific rules can be defined here
@@ -28,21 +50,8 @@ class DocumentProcessor:
         }
     
     def identify_document_type(self, filepath):
-        """Identify document type from filename"""
-        filename = filepath.name.lower()
-
-        if 'sign' in filename or '81-2011' in filename:
-            return 'sign'
-        elif 'fee' in filename or '259' in filename or '300' in filename:
-            return 'fee'
-        elif 'wqra' in filename or '70-2001' in filename:
-            return 'wqra'
-        elif 'land-development' in filename or '54-89' in filename or '59-97' in filename:
-            return 'land-development'
-        elif '65-99' in filename or 'sewer-services' in filename:
-            return 'ord-65-99'
-        else:
-            return 'standard'
+        """Identify document type from filename (see utils/document_types.py)"""
+        return document_types.identify_document_type(filepath)
     
     # LIST PROCESSING REMOVED - See unified-list-processor.py
     # All list processing (numbered, letter, roman) has been moved to
@@ -276,262 +285,278 @@ class DocumentProcessor:
         return soup
     
     def process_document_notes(self, soup):
-        """Process document notes sections with special styling"""
-        
-        # Find all h2 elements that might be note sections
-        note_headers = [
-            'Document Notes',
-            'Digitization Notes', 
-            'Source Document Notes',
-            'Historical Notes',
-            'Handwritten notations',
-            'Handwritten Notations'
-        ]
-        
-        # Process h2 elements - need to collect them first to avoid modifying during iteration
-        h2_elements = list(soup.find_all('h2'))
-        
-        for h2 in h2_elements:
-            # Skip if already processed (inside document-note div)
-            if h2.parent and 'document-note' in h2.parent.get('class', []):
-                continue
-                
-            header_text = h2.get_text().strip()
-            
-            # Check if this is a notes section (partial match allowed)
-            is_notes_section = False
-            for note_header in note_headers:
-                if note_header.lower() in header_text.lower() or \
-                   ('handwritten' in header_text.lower() and 'notation' in header_text.lower()):
-                    is_notes_section = True
-                    break
-            
-            if is_notes_section:
-                # Create a new div with document-note class
-                note_div = soup.new_tag('div', attrs={'class': 'document-note'})
-                
-                # Create a new h2 with standardized text
-                new_h2 = soup.new_tag('h2')
-                new_h2.string = 'Document Notes'
-                note_div.append(new_h2)
-                
-                # Collect all following siblings until we find an h2 that's NOT a note type
-                current = h2.next_sibling
-                elements_to_move = []
-                
-                # List of headers that are note type labels (not section breaks)
-                note_type_headers = ['handwritten note', 'stamp', 'digitization note', 
-                                   'editor note', 'historical note', 'source note']
-                
-                while current:
-                    next_sibling = current.next_sibling
-                    
-                    # Check if this is an h2
-                    if hasattr(current, 'name'):
-                        if current.name == 'h2':
-                            # Check if it's a note type header (should be included)
-                            h2_text = current.get_text().strip().lower().rstrip(':')
-                            is_note_type = any(note_type in h2_text for note_type in note_type_headers)
-                            
-                            if not is_note_type:
-                                # This is a different section, stop here
-                                break
-                        elif current.name == 'hr':
-                            break
-                        
-                        if current.name:  # Collect the element
-                            elements_to_move.append(current.extract())
-                    
-                    current = next_sibling
-                
-                # Move all collected elements into the note div
-                for elem in elements_to_move:
-                    note_div.append(elem)
-                
-                # Process H3 headers within the note div as note type labels
-                import re
-                for h3 in note_div.find_all('h3'):
-                    # Get the header text and check for page reference
-                    h3_text = h3.get_text().strip()
-                    page_ref = None
-                    
-                    # Check if the header itself contains a page reference
-                    page_match = re.search(r'\[page (\d+)\]', h3_text)
-                    if page_match:
-                        page_ref = page_match.group(1)
-                        # Remove the page reference from the label text
-                        label_text = re.sub(r'\s*\[page \d+\]\s*', '', h3_text).strip().rstrip(':')
-                    else:
-                        label_text = h3_text.rstrip(':')
-                    
-                    # Create a new structure with label
-                    note_item = soup.new_tag('div', attrs={'class': 'note-item'})
-                    
-                    # Create content div for following content
-                    content_div = soup.new_tag('div', attrs={'class': 'note-content'})
-                    
-                    # Collect content between this h3 and the next h3/h2 or end
-                    current = h3.next_sibling
-                    
-                    while current and (not hasattr(current, 'name') or (current.name != 'h3' and current.name != 'h2')):
-                        next_sib = current.next_sibling
-                        if hasattr(current, 'name') and current.name:
-                            content_div.append(current.extract())
-                        current = next_sib
-                    
-                    # Create the label span with page reference if found
-                    label_span = soup.new_tag('span', attrs={'class': 'note-type-label'})
-                    if page_ref:
-                        # Add the label text as a text node
-                        label_span.append(label_text)
-                        # Add separator
-                        separator = soup.new_tag('span', attrs={'class': 'label-separator'})
-                        separator.string = ' · '
-                        label_span.append(separator)
-                        # Add page reference
-                        page_span = soup.new_tag('span', attrs={'class': 'label-page-ref'})
-                        page_span.string = f'PAGE {page_ref}'
-                        label_span.append(page_span)
-                    else:
-                        label_span.string = label_text
-                    
-                    note_item.append(label_span)
-                    note_item.append(content_div)
-                    
-                    # Replace the h3 with the note item
-                    h3.replace_with(note_item)
-                
-                # Process paragraphs to wrap page references in spans
-                import re
-                for p in note_div.find_all('p'):
-                    # Get the current HTML content of the paragraph
-                    p_html = str(p)
-                    
-                    # Skip if already processed (has note-item class)
-                    if p.parent and 'note-item' in p.parent.get('class', []):
-                        continue
-                        
-                    # Check if this paragraph starts with a bold label (e.g., **Handwritten Notes:**)
-                    if '<strong>' in p_html and '</strong>:' in p_html:
-                        # Extract the label and content - handle both inline and multi-line
-                        # Match pattern: <p><strong>Label</strong>:\nContent</p>
-                        label_match = re.match(r'^<p><strong>([^<]+)</strong>:\s*(.*?)</p>$', p_html, re.DOTALL)
-                        if label_match:
-                            label_text = label_match.group(1)
-                            content_text = label_match.group(2)
-                            
-                            # Create a new structure with label and content
-                            new_p = soup.new_tag('div', attrs={'class': 'note-item'})
-                            
-                            # Create the label span
-                            label_span = soup.new_tag('span', attrs={'class': 'note-type-label'})
-                            label_span.string = label_text
-                            new_p.append(label_span)
-                            
-                            # Create the content div
-                            content_div = soup.new_tag('div', attrs={'class': 'note-content'})
-                            # Parse the content HTML to preserve any formatting
-                            content_soup = BeautifulSoup(content_text, 'html.parser')
-                            for elem in content_soup:
-                                if hasattr(elem, 'name'):
-                                    content_div.append(elem)
-                                else:
-                                    content_div.append(str(elem))
-                            new_p.append(content_div)
-                            
-                            # Replace the original paragraph
-                            p.replace_with(new_p)
-                            p = new_p  # Update reference for page ref processing below
-                    
-                    # Process page references (skip if already processed)
-                    if hasattr(p, 'find_all'):
-                        p_html = str(p)
-                        new_p_html = p_html  # Default to no change
-                        # Only wrap if not already wrapped
-                        if 'page-ref' not in p_html:
-                            # Replace [page X] patterns with wrapped versions
-                            new_p_html = re.sub(
-                                r'(\[page \d+\])',
-                                r'<span class="page-ref">\1</span>',
-                                p_html
-                            )
-                        # If we made changes, replace the element
-                        if new_p_html != p_html:
-                            if p.name == 'div':
-                                new_p = BeautifulSoup(new_p_html, 'html.parser').div
-                            else:
-                                new_p = BeautifulSoup(new_p_html, 'html.parser').p
-                            if new_p:
-                                p.replace_with(new_p)
-                
-                # Replace the original h2 with the note div
-                h2.replace_with(note_div)
-        
-        # Also process any existing document-note divs to add page-ref spans and style labels
-        import re
-        for note_div in soup.find_all('div', class_='document-note'):
+        """
+        Process document notes sections with special styling.
+
+        This is the only Document Notes transform in the pipeline. One pass
+        over the page finds the note headers and existing document-note divs;
+        replacement nodes are built in place rather than reparsed from HTML.
+        """
+        # A plain walk of the tree is cheaper than find_all() with a filter function
+        candidates = [node for node in soup.descendants if self.is_note_candidate(node)]
+
+        # Stamp/handwritten/margin note headers with a {{page:N}} reference get badges
+        for h3 in candidates:
+            if h3.name == 'h3':
+                self.add_note_badge(h3, soup)
+
+        # Wrap each notes section in a document-note div, keeping existing ones
+        note_divs = []
+        for element in candidates:
+            if element.name == 'div':
+                note_divs.append(element)
+            elif element.name == 'h2':
+                note_div = self.build_note_section(element, soup)
+                if note_div is not None:
+                    note_divs.append(note_div)
+
+        # Then add page-ref spans and style labels in every note section
+        for note_div in note_divs:
             for p in note_div.find_all('p'):
-                # Get the current HTML content of the paragraph
-                p_html = str(p)
-                
                 # Skip if already processed (has note-item class)
-                if 'note-item' in p.parent.get('class', []):
+                if p.parent and 'note-item' in p.parent.get('class', []):
                     continue
-                    
-                # Check if this paragraph starts with a bold label (e.g., **Handwritten Notes:**)
-                if '<strong>' in p_html and '</strong>' in p_html:
-                    # Extract the label and content - handle both inline and multi-line
-                    label_match = re.search(r'<strong>([^<]+)</strong>:\s*(.*)', p_html, re.DOTALL)
-                    if label_match:
-                        label_text = label_match.group(1)
-                        content_text = label_match.group(2)
-                        
-                        # Create a new structure with label and content
-                        new_p = soup.new_tag('div', attrs={'class': 'note-item'})
-                        
-                        # Create the label span
-                        label_span = soup.new_tag('span', attrs={'class': 'note-type-label'})
-                        label_span.string = label_text
-                        new_p.append(label_span)
-                        
-                        # Create the content div
-                        content_div = soup.new_tag('div', attrs={'class': 'note-content'})
-                        # Parse the content HTML to preserve any formatting
-                        content_soup = BeautifulSoup(content_text, 'html.parser')
-                        for elem in content_soup:
-                            if hasattr(elem, 'name'):
-                                content_div.append(elem)
-                            else:
-                                content_div.append(str(elem))
-                        new_p.append(content_div)
-                        
-                        # Replace the original paragraph
-                        p.replace_with(new_p)
-                        p = new_p  # Update reference for page ref processing below
-                
-                # Process page references (skip if already processed)
-                if hasattr(p, 'find_all'):
-                    p_html = str(p)
-                    new_p_html = p_html  # Default to no change
-                    # Only wrap if not already wrapped
-                    if 'page-ref' not in p_html:
-                        # Replace [page X] patterns with wrapped versions
-                        new_p_html = re.sub(
-                            r'(\[page \d+\])',
-                            r'<span class="page-ref">\1</span>',
-                            p_html
-                        )
-                    # If we made changes, replace the element
-                    if new_p_html != p_html:
-                        if p.name == 'div':
-                            new_p = BeautifulSoup(new_p_html, 'html.parser').div
-                        else:
-                            new_p = BeautifulSoup(new_p_html, 'html.parser').p
-                        if new_p:
-                            p.replace_with(new_p)
-        
+                p = self.split_note_label(p, soup, at_start=False) or p
+                self.wrap_page_refs(p, soup)
+
         return soup
-    
+
+    @staticmethod
+    def is_note_candidate(node):
+        """Headers that may start or label a notes section, and existing document-note divs"""
+        return node.name in ('h2', 'h3') or (node.name == 'div' and 'document-note' in node.get('class', []))
+
+    def add_note_badge(self, h3, soup):
+        """Turn a 'Stamp {{page:2}}' style header into a badge plus page reference"""
+        h3_text = h3.get_text()
+
+        # Check if this is a document note header
+        if any(marker in h3_text for marker in ['Stamp', 'Handwritten', 'Margin note']):
+            # Extract page reference if present
+            page_match = re.search(r'\{\{page:(\d+)\}\}', h3_text)
+            if page_match:
+                page_num = page_match.group(1)
+                # Remove the page reference from the text
+                h3_text = re.sub(r'\s*\{\{page:\d+\}\}', '', h3_text).strip()
+
+                # Determine badge type
+                badge_class = 'note-badge'
+                if 'Stamp' in h3_text:
+                    badge_class += ' stamp'
+                elif 'Handwritten' in h3_text:
+                    badge_class += ' handwritten'
+                elif 'Margin note' in h3_text:
+                    badge_class += ' margin-note'
+
+                # Clear and rebuild h3
+                h3.clear()
+                h3['class'] = ['document-note-header']
+
+                # Add badge
+                badge = soup.new_tag('span')
+                badge['class'] = [badge_class]
+                badge.string = h3_text
+                h3.append(badge)
+
+                # Add page reference
+                if page_num:
+                    page_span = soup.new_tag('span')
+                    page_span['class'] = ['page-reference']
+                    page_span.string = f' (page {page_num})'
+                    h3.append(page_span)
+
+    def build_note_section(self, h2, soup):
+        """
+        Wrap a notes h2 and the content after it in a document-note div.
+        Returns the div, or None if h2 doesn't start a notes section.
+        """
+        # Skip if already processed (inside document-note div)
+        if h2.parent and 'document-note' in h2.parent.get('class', []):
+            return None
+
+        header_text = h2.get_text().strip()
+
+        # Check if this is a notes section (partial match allowed)
+        is_notes_section = False
+        for note_header in NOTE_SECTION_HEADERS:
+            if note_header.lower() in header_text.lower() or \
+               ('handwritten' in header_text.lower() and 'notation' in header_text.lower()):
+                is_notes_section = True
+                break
+
+        if not is_notes_section:
+            return None
+
+        # Create a new div with document-note class
+        note_div = soup.new_tag('div', attrs={'class': 'document-note'})
+
+        # Create a new h2 with standardized text
+        new_h2 = soup.new_tag('h2')
+        new_h2.string = 'Document Notes'
+        note_div.append(new_h2)
+
+        # Collect all following siblings until we find an h2 that's NOT a note type
+        current = h2.next_sibling
+        elements_to_move = []
+
+        while current:
+            next_sibling = current.next_sibling
+
+            # Check if this is an h2
+            if hasattr(current, 'name'):
+                if current.name == 'h2':
+                    # Check if it's a note type header (should be included)
+                    h2_text = current.get_text().strip().lower().rstrip(':')
+                    is_note_type = any(note_type in h2_text for note_type in NOTE_TYPE_HEADERS)
+
+                    if not is_note_type:
+                        # This is a different section, stop here
+                        break
+                elif current.name == 'hr':
+                    break
+
+                if current.name:  # Collect the element
+                    elements_to_move.append(current.extract())
+
+            current = next_sibling
+
+        # Move all collected elements into the note div
+        for elem in elements_to_move:
+            note_div.append(elem)
+
+        # Process H3 headers within the note div as note type labels
+        for h3 in note_div.find_all('h3'):
+            # Get the header text and check for page reference
+            h3_text = h3.get_text().strip()
+            page_ref = None
+
+            # Check if the header itself contains a page reference
+            page_match = re.search(r'\[page (\d+)\]', h3_text)
+            if page_match:
+                page_ref = page_match.group(1)
+                # Remove the page reference from the label text
+                label_text = re.sub(r'\s*\[page \d+\]\s*', '', h3_text).strip().rstrip(':')
+            else:
+                label_text = h3_text.rstrip(':')
+
+            # Create a new structure with label
+            note_item = soup.new_tag('div', attrs={'class': 'note-item'})
+
+            # Create content div for following content
+            content_div = soup.new_tag('div', attrs={'class': 'note-content'})
+
+            # Collect content between this h3 and the next h3/h2 or end
+            current = h3.next_sibling
+
+            while current and (not hasattr(current, 'name') or (current.name != 'h3' and current.name != 'h2')):
+                next_sib = current.next_sibling
+                if hasattr(current, 'name') and current.name:
+                    content_div.append(current.extract())
+                current = next_sib
+
+            # Create the label span with page reference if found
+            label_span = soup.new_tag('span', attrs={'class': 'note-type-label'})
+            if page_ref:
+                # Add the label text as a text node
+                label_span.append(label_text)
+                # Add separator
+                separator = soup.new_tag('span', attrs={'class': 'label-separator'})
+                separator.string = ' · '
+                label_span.append(separator)
+                # Add page reference
+                page_span = soup.new_tag('span', attrs={'class': 'label-page-ref'})
+                page_span.string = f'PAGE {page_ref}'
+                label_span.append(page_span)
+            else:
+                label_span.string = label_text
+
+            note_item.append(label_span)
+            note_item.append(content_div)
+
+            # Replace the h3 with the note item
+            h3.replace_with(note_item)
+
+        # Process paragraphs to wrap page references in spans
+        for p in note_div.find_all('p'):
+            # Skip if already processed (has note-item class)
+            if p.parent and 'note-item' in p.parent.get('class', []):
+                continue
+            p = self.split_note_label(p, soup, at_start=True) or p
+            self.wrap_page_refs(p, soup)
+
+        # Replace the original h2 with the note div
+        h2.replace_with(note_div)
+        return note_div
+
+    @staticmethod
+    def is_note_label(node):
+        """A plain <strong>Label</strong> followed directly by a colon"""
+        return (getattr(node, 'name', None) == 'strong' and not node.attrs
+                and len(node.contents) == 1 and type(node.contents[0]) is NavigableString
+                and type(node.next_sibling) is NavigableString and node.next_sibling.startswith(':'))
+
+    def split_note_label(self, p, soup, at_start):
+        """
+        Turn a paragraph with a bold label (e.g., **Handwritten Notes:**) into a
+        note-item div: the label in a note-type-label span, everything after
+        the colon in a note-content div. With at_start the label must open the
+        paragraph; otherwise the first label in it is used and anything before
+        it is dropped. Returns the new div, or None if there's no label.
+        """
+        if at_start:
+            label = p.contents[0] if p.contents and not p.attrs else None
+            if not self.is_note_label(label):
+                return None
+        else:
+            label = next((strong for strong in p.find_all('strong') if self.is_note_label(strong)), None)
+            if label is None:
+                return None
+
+        # Create a new structure with label and content
+        new_p = soup.new_tag('div', attrs={'class': 'note-item'})
+
+        # Create the label span
+        label_span = soup.new_tag('span', attrs={'class': 'note-type-label'})
+        label_span.string = label.string
+        new_p.append(label_span)
+
+        # Create the content div from the nodes after the colon, keeping their formatting
+        content_div = soup.new_tag('div', attrs={'class': 'note-content'})
+        colon = label.next_sibling
+        content = colon[1:].lstrip()
+        following = list(colon.next_siblings)
+        for ancestor in label.parents:
+            if ancestor is p:
+                break
+            following.extend(ancestor.next_siblings)
+        if content:
+            content_div.append(content)
+        for elem in following:
+            content_div.append(elem.extract())
+        new_p.append(content_div)
+
+        # Replace the original paragraph
+        p.replace_with(new_p)
+        return new_p
+
+    def wrap_page_refs(self, element, soup):
+        """Wrap [page X] references in page-ref spans (only if not already wrapped)"""
+        if 'page-ref' in str(element):
+            return
+        element.smooth()
+        for text in element.find_all(string=PAGE_REF_PATTERN):
+            if type(text) is not NavigableString:
+                continue
+            pieces = []
+            for index, piece in enumerate(PAGE_REF_PATTERN.split(text)):
+                if index % 2:
+                    page_ref = soup.new_tag('span', attrs={'class': 'page-ref'})
+                    page_ref.string = piece
+                    pieces.append(page_ref)
+                elif piece:
+                    pieces.append(piece)
+            text.replace_with(*pieces)
+
     def process_form_fields(self, soup):
         """Process form field markers for blank and filled fields"""
         
@@ -850,16 +875,8 @@ class DocumentProcessor:
     # head.append(style)  # Commented out - CSS now in modular files
     """
     
-    def process_html_file(self, filepath):
-        """Process a single HTML file with all enhancements"""
-        
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        soup = BeautifulSoup(content, 'html.parser')
-        
-        # Identify document type
-        doc_type = self.identify_document_type(filepath)
+    def process_soup(self, soup, doc_type):
+        """Apply all enhancements to a parsed page and return the soup"""
         
         # LIST PROCESSING REMOVED - handled by unified-list-processor.py
         # No longer calling process_standard_lists or process_letter_lists
@@ -897,9 +914,31 @@ class DocumentProcessor:
         # Add custom CSS
         soup = self.add_custom_css(soup)
         
-        # Write back
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(str(soup))
+        return soup
+    
+    def process_html(self, content, doc_type):
+        """Apply all enhancements to a page's HTML and return the result"""
+        soup = parse_html(content, for_output=True)
+        return str(self.process_soup(soup, doc_type))
+    
+    def process_html_file(self, filepath, cache=None):
+        """Process a single HTML file with all enhancements"""
+        
+        with open(filepath, 'r', encoding='utf-8') as f:
+            content = f.read()
+        
+        # Identify document type
+        doc_type = self.identify_document_type(filepath)
+        
+        # Pages whose input hasn't changed reuse the previous result
+        processed = cache.get(filepath, content) if cache else None
+        if processed is None:
+            processed = self.process_html(content, doc_type)
+            if cache:
+                cache.put(filepath, content, processed)
+        
+        # Write back (only if the page changed, so its mtime is left alone otherwise)
+        write_if_changed(filepath, processed)
         
         print(f"  ✓ Enhanced processing for {filepath.name} (type: {doc_type})")
         
@@ -914,6 +953,8 @@ def main():
         sys.exit(1)
     
     processor = DocumentProcessor()
+    cache = BuildCache('enhanced-custom-processor', [__file__, document_types.__file__, html_parser.__file__],
+                       settings=[html_parser.get_backend(for_output=True)])
     
     # Process all HTML files
     html_files = list(book_dir.glob("**/*.html"))
@@ -925,13 +966,15 @@ def main():
     
     for filepath in html_files:
         try:
-            doc_type = processor.process_html_file(filepath)
+            doc_type = processor.process_html_file(filepath, cache)
             doc_types[doc_type] = doc_types.get(doc_type, 0) + 1
         except Exception as e:
             print(f"  ✗ Error processing {filepath.name}: {e}")
     
+    cache.save()
+    
     # Summary
-    print(f"\n✅ Enhanced processing complete")
+    print(f"\n✅ Enhanced processing complete ({cache.summary()})")
     print(f"Document types processed:")
     for doc_type, count in sorted(doc_types.items()):
         print(f"  - {doc_type}: {count} files")
@@ -18,6 +18,10 @@ from pathlib import Path
 import re
 import sys
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from utils.build_cache import write_if_changed
+from utils.html_parser import parse_html
+
 def is_list_item_text(text):
     """Check if text starts with a list marker like (a), (1), etc."""
     if not text:
@@ -127,18 +131,8 @@ def create_list_from_orphans(orphans, list_type='alpha'):
 
     return new_list
 
-def fix_document_lists(html_file):
-    """Fix list issues throughout the document"""
-    path = Path(html_file)
-
-    if not path.exists():
-        print(f"File not found: {html_file}")
-        return False
-
-    with open(path, 'r', encoding='utf-8') as f:
-        content = f.read()
-
-    soup = BeautifulSoup(content, 'html.parser')
+def fix_soup_lists(soup):
+    """Fix list issues throughout a parsed document. Returns True if anything changed."""
     changes_made = False
 
     # Find section boundaries
@@ -250,10 +244,25 @@ def fix_document_lists(html_file):
             nest_items_under_parent(current_parent, items_to_nest)
             changes_made = True
 
+    return changes_made
+
+def fix_document_lists(html_file):
+    """Fix list issues throughout the document"""
+    path = Path(html_file)
+
+    if not path.exists():
+        print(f"File not found: {html_file}")
+        return False
+
+    with open(path, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    soup = parse_html(content, for_output=True)
+    changes_made = fix_soup_lists(soup)
+
     # Save if changes were made
     if changes_made:
-        with open(path, 'w', encoding='utf-8') as f:
-            f.write(str(soup))
+        write_if_changed(path, str(soup))
         print(f"✓ Fixed list issues in {path.name}")
         return True
     else:
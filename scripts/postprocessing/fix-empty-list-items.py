@@ -13,6 +13,10 @@ from pathlib import Path
 import re
 import sys
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from utils.build_cache import write_if_changed
+from utils.html_parser import parse_html
+
 def find_and_fix_empty_list_items(soup):
     """Find empty list items and try to recover their content from the source."""
     changes_made = False
@@ -93,11 +97,10 @@ def fix_document(html_file):
     with open(path, 'r', encoding='utf-8') as f:
         content = f.read()
 
-    soup = BeautifulSoup(content, 'html.parser')
+    soup = parse_html(content, for_output=True)
 
     if find_and_fix_empty_list_items(soup):
-        with open(path, 'w', encoding='utf-8') as f:
-            f.write(str(soup))
+        write_if_changed(path, str(soup))
         print(f"✓ Fixed empty list items in {path.name}")
         return True
     else:
@@ -8,6 +8,9 @@ import re
 import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from utils.build_cache import write_if_changed
+
 def fix_numbered_lists(content):
     """Convert (1), (2) style lists to proper markdown format"""
     lines = content.split('\n')
@@ -76,8 +79,7 @@ def process_file(filepath):
     
     # Check if anything changed
     if fixed_content != content:
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(fixed_content)
+        write_if_changed(filepath, fixed_content)
         
         # Count changes
         original_matches = len(re.findall(r'^\(\d+\)', content, re.MULTILINE))
@@ -8,9 +8,13 @@ Handles:
 """
 
 from bs4 import BeautifulSoup, NavigableString
+import sys
 from pathlib import Path
 import re
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from utils.build_cache import write_if_changed
+
 def fix_ord54_lists():
     """Fix list issues in Ordinance 54"""
     html_file = Path('book/ordinances/1989-Ord-54-89C-Land-Development.html')
@@ -186,8 +190,7 @@ def fix_ord54_lists():
 
     # Save if changes were made
     if changes_made:
-        with open(html_file, 'w', encoding='utf-8') as f:
-            f.write(str(soup))
+        write_if_changed(html_file, str(soup))
         print(f"✓ Saved changes to {html_file}")
         return True
     else:
@@ -21,6 +21,10 @@ import sys
 from pathlib import Path
 from bs4 import BeautifulSoup, NavigableString, Tag
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from utils.build_cache import write_if_changed
+from utils.html_parser import parse_html
+
 def is_all_caps_header(text):
     """
     Detect if text is an ALL CAPS section header.
@@ -182,11 +186,8 @@ def style_all_caps_headers(soup):
 
     return changes_made
 
-def process_file(html_file):
-    """Process a single HTML file."""
-    with open(html_file, 'r', encoding='utf-8') as f:
-        soup = BeautifulSoup(f.read(), 'html.parser')
-
+def process_soup(soup):
+    """Apply every Ord #54 fix to a parsed page. Returns the number of changes."""
     # Track changes
     total_changes = 0
 
@@ -206,10 +207,16 @@ def process_file(html_file):
         print(f"  • Styled {changes} ALL CAPS headers")
         total_changes += changes
 
+    return total_changes
+
+def process_file(html_file):
+    """Process a single HTML file."""
+    with open(html_file, 'r', encoding='utf-8') as f:
+        soup = parse_html(f.read(), for_output=True)
+
     # Write back if changes were made
-    if total_changes > 0:
-        with open(html_file, 'w', encoding='utf-8') as f:
-            f.write(str(soup))
+    if process_soup(soup) > 0:
+        write_if_changed(html_file, str(soup))
         return True
 
     return False
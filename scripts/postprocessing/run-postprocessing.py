@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+Single-parse postprocessing runner for City of Rivergrove mdBook output.
+
+Runs every HTML postprocessor from build-all.sh on one in-memory tree per page:
+1. unified-list-processor.py   (all pages)
+2. enhanced-custom-processor.py (all pages)
+3. fix-complex-lists.py         (Ord #54 only)
+4. fix-empty-list-items.py      (Ord #54 only)
+5. fix-ord54-specific.py        (Ord #54 only)
+
+Each page is parsed once, passed through the transforms in that order, and
+written once, instead of one parse/serialize/write cycle per script. The
+individual scripts still work standalone for debugging a single step.
+
+Usage:
+    python3 scripts/postprocessing/run-postprocessing.py             # all of book/
+    python3 scripts/postprocessing/run-postprocessing.py FILE...     # specific pages
+    python3 scripts/postprocessing/run-postprocessing.py --jobs 4 --verbose
+"""
+
+import io
+import os
+import sys
+import time
+import argparse
+from contextlib import redirect_stdout
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from bs4 import NavigableString, Tag
+from bs4.builder import HTMLTreeBuilder
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from utils import document_types, html_parser
+from utils.build_cache import BuildCache, write_if_changed
+from utils.html_parser import parse_html
+from utils.script_loader import load_script
+
+SCRIPT_DIR = Path(__file__).parent
+ORD54_PAGE = Path('book/ordinances/1989-Ord-54-89C-Land-Development.html')
+
+unified = load_script('postprocessing/unified-list-processor.py')
+enhanced = load_script('postprocessing/enhanced-custom-processor.py')
+complex_lists = load_script('postprocessing/fix-complex-lists.py')
+empty_items = load_script('postprocessing/fix-empty-list-items.py')
+ord54 = load_script('postprocessing/fix-ord54-specific.py')
+
+document_processor = enhanced.DocumentProcessor()
+
+
+# Transforms return True if they changed the page. Scripts that only rewrite
+# the file when they changed something are marked skips_unchanged below.
+
+def run_unified(soup, filepath):
+    unified.process_soup(soup, filepath)
+    return True
+
+
+def run_enhanced(soup, filepath):
+    doc_type = document_processor.identify_document_type(filepath)
+    document_processor.process_soup(soup, doc_type)
+    return True
+
+
+def run_complex_lists(soup, filepath):
+    return complex_lists.fix_soup_lists(soup)
+
+
+def run_empty_items(soup, filepath):
+    return empty_items.find_and_fix_empty_list_items(soup)
+
+
+def run_ord54(soup, filepath):
+    return ord54.process_soup(soup) > 0
+
+
+# (name, script, target page or None for every page, skips_unchanged, transform)
+# Order matches build-all.sh Steps 13-14.5 - keep them in sync
+TRANSFORMS = [
+    ('unified-list-processor', 'unified-list-processor.py', None, False, run_unified),
+    ('enhanced-custom-processor', 'enhanced-custom-processor.py', None, False, run_enhanced),
+    ('fix-complex-lists', 'fix-complex-lists.py', ORD54_PAGE, True, run_complex_lists),
+    ('fix-empty-list-items', 'fix-empty-list-items.py', ORD54_PAGE, True, run_empty_items),
+    ('fix-ord54-specific', 'fix-ord54-specific.py', ORD54_PAGE, True, run_ord54),
+]
+
+
+def transforms_for(filepath):
+    """
+    The registered transforms that apply to a page, in order. Targets match
+    on the page's file name, so absolute or ./-prefixed paths still get them.
+    """
+    page_name = Path(filepath).name
+    return [(name, skips_unchanged, transform)
+            for name, _, target, skips_unchanged, transform in TRANSFORMS
+            if target is None or page_name == target.name]
+
+
+ASCII_SPACES = '\x20\x0a\x09\x0c\x0d'
+PRESERVE_WHITESPACE_TAGS = {'pre', 'textarea'}
+# html.parser reads mdBook's '<br><br />' as a <br> holding the next line
+VOID_ELEMENTS = sorted(HTMLTreeBuilder.DEFAULT_EMPTY_ELEMENT_TAGS)
+
+
+def settle_tree(soup, backend=None):
+    """
+    Bring a transformed tree to the state a fresh html.parser parse of its
+    serialization would have, so each transform sees exactly what it saw when
+    it ran as a separate script:
+    - adjacent strings are merged
+    - whitespace-only strings collapse to a single newline or space
+    - class attributes set as plain strings become lists
+    Returns the settled tree. A page with a void element (<br>, <img>, ...)
+    holding content is reparsed instead: whether html.parser closes a <br/>
+    depends on the <br> tags before it, so only a real parse reproduces it.
+    """
+    if any(tag.contents for tag in soup.find_all(VOID_ELEMENTS)):
+        return parse_html(str(soup), for_output=True, backend=backend)
+    soup.smooth()
+    for node in list(soup.descendants):
+        if isinstance(node, Tag):
+            classes = node.attrs.get('class')
+            if isinstance(classes, str):
+                node['class'] = classes.split()
+        elif type(node) is NavigableString and node and not node.strip(ASCII_SPACES):
+            if any(parent.name in PRESERVE_WHITESPACE_TAGS for parent in node.parents):
+                continue
+            collapsed = '\n' if '\n' in node else ' '
+            if node != collapsed:
+                node.replace_with(collapsed)
+    return soup
+
+
+def process_page(filepath, content, backend=None):
+    """
+    Parse a page once and run every applicable transform on the tree.
+    backend overrides the parser (see utils/html_parser.py). Returns (filepath, processed_html, step_timings, log, error) - never raises,
+    so one bad page can't take down the pool.
+    """
+    timings = {}
+    log = io.StringIO()
+    try:
+        with redirect_stdout(log):
+            soup = parse_html(content, for_output=True, backend=backend)
+            # What the standalone scripts would have left on disk, when that
+            # differs from str(soup): a skips_unchanged script that changed
+            # nothing leaves the previous script's (unsettled) output in place
+            on_disk = None
+            for index, (name, skips_unchanged, transform) in enumerate(transforms_for(filepath)):
+                start = time.perf_counter()
+                if index:
+                    if skips_unchanged and on_disk is None:
+                        on_disk = str(soup)
+                    soup = settle_tree(soup, backend)
+                if transform(soup, filepath) or not skips_unchanged:
+                    on_disk = None
+                timings[name] = time.perf_counter() - start
+            processed = on_disk if on_disk is not None else str(soup)
+        return filepath, processed, timings, log.getvalue(), None
+    except Exception as e:
+        return filepath, None, timings, log.getvalue(), f"{type(e).__name__}: {e}"
+
+
+def postprocess_files(html_files, jobs=1, verbose=False):
+    """
+    Postprocess pages in place, restoring cached results where possible.
+    Returns (written, errors): filepath -> the HTML written to it, and
+    (filepath, error) for pages that failed.
+    """
+    cache = BuildCache('postprocess', [__file__, document_types.__file__, html_parser.__file__] +
+                       [SCRIPT_DIR / script for _, script, _, _, _ in TRANSFORMS],
+                       settings=[html_parser.get_backend(for_output=True)])
+
+    # Restore cached pages up front; only the rest go to the workers
+    written = {}
+    pending = []
+    errors = []
+    for filepath in html_files:
+        with open(filepath, 'r', encoding='utf-8') as f:
+            content = f.read()
+        cached = cache.get(filepath, content)
+        if cached is not None:
+            write_if_changed(filepath, cached)
+            written[filepath] = cached
+        else:
+            pending.append((filepath, content))
+
+    step_totals = {name: 0.0 for name, _, _, _, _ in TRANSFORMS}
+
+    def finish(result, content):
+        filepath, processed, timings, log, error = result
+        for name, elapsed in timings.items():
+            step_totals[name] += elapsed
+        if verbose and log.strip():
+            print(f"  {filepath}:")
+            print('\n'.join(f"    {line}" for line in log.rstrip().splitlines()))
+        if error:
+            print(f"  ✗ Error processing {filepath}: {error}")
+            errors.append((filepath, error))
+            return
+        write_if_changed(filepath, processed)
+        written[filepath] = processed
+        cache.put(filepath, content, processed)
+
+    jobs = max(1, min(jobs, len(pending)))
+    start = time.perf_counter()
+    if jobs > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            futures = {executor.submit(process_page, filepath, content): content
+                       for filepath, content in pending}
+            for future in as_completed(futures):
+                finish(future.result(), futures[future])
+    else:
+        for filepath, content in pending:
+            finish(process_page(filepath, content), content)
+    wall_time = time.perf_counter() - start
+
+    cache.save()
+
+    if pending:
+        print(f"  Transform time ({wall_time:.2f}s wall, {jobs} worker(s)):")
+        for name, total in step_totals.items():
+            print(f"    {total:6.2f}s  {name}")
+
+    if errors:
+        # stderr, so build-all.sh (which discards stdout) still shows which pages failed
+        print(f"\n✗ {len(errors)} file(s) failed:", file=sys.stderr)
+        for filepath, error in errors:
+            print(f"    {filepath}: {error}", file=sys.stderr)
+
+    print(f"✅ Postprocessed {len(html_files) - len(errors)} files ({cache.summary()})")
+    return written, errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run all HTML postprocessors with one parse per page')
+    parser.add_argument('files', nargs='*', type=Path,
+                        help='HTML files to process (default: every book/**/*.html)')
+    parser.add_argument('--jobs', '-j', type=int, default=os.cpu_count() or 1,
+                        help='Number of worker processes (default: CPU count)')
+    parser.add_argument('--verbose', '-v', action='store_true',
+                        help="Show each transform's output for every page")
+    args = parser.parse_args()
+
+    if args.files:
+        html_files = [f for f in args.files if f.exists()]
+    else:
+        book_dir = Path('book')
+        if not book_dir.exists():
+            print("Error: book directory not found. Run mdbook build first.")
+            return 1
+        html_files = list(book_dir.glob('**/*.html'))
+
+    if not html_files:
+        print("No HTML files found in book directory")
+        return 1
+
+    print(f"🎨 Postprocessing {len(html_files)} HTML files ({len(TRANSFORMS)} transforms, one parse per page)...")
+    _, errors = postprocess_files(html_files, args.jobs, args.verbose)
+    return 1 if errors else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -8,17 +8,27 @@ It handles:
 2. Detecting list types (alpha, numeric, roman)
 3. Adding semantic CSS classes
 4. Wrapping markers in styled spans
-5. Processing Document Notes sections
+
+Document Notes sections are formatted by enhanced-custom-processor.py.
 
 Author: Claude
 Date: 2024
 """
 
+import os
 import re
 import sys
+import time
+import argparse
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from bs4 import BeautifulSoup, NavigableString
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from utils import document_types, html_parser
+from utils.build_cache import BuildCache, write_if_changed
+from utils.html_parser import parse_html
+
 def detect_list_type(text, prev_type=None, prev_char=None):
     """
     Detect the type of list based on the marker pattern.
@@ -369,49 +379,6 @@ def process_li_markers(li, soup):
         li.append(marker_span)
         li.append(' ' + remaining)
 
-def process_document_notes(soup):
-    """
-    Process Document Notes sections to add badges and special formatting.
-    """
-    # Find all h3 elements that might be document notes
-    for h3 in soup.find_all('h3'):
-        h3_text = h3.get_text()
-        
-        # Check if this is a document note header
-        if any(marker in h3_text for marker in ['Stamp', 'Handwritten', 'Margin note']):
-            # Extract page reference if present
-            page_match = re.search(r'\{\{page:(\d+)\}\}', h3_text)
-            if page_match:
-                page_num = page_match.group(1)
-                # Remove the page reference from the text
-                h3_text = re.sub(r'\s*\{\{page:\d+\}\}', '', h3_text).strip()
-                
-                # Determine badge type
-                badge_class = 'note-badge'
-                if 'Stamp' in h3_text:
-                    badge_class += ' stamp'
-                elif 'Handwritten' in h3_text:
-                    badge_class += ' handwritten'
-                elif 'Margin note' in h3_text:
-                    badge_class += ' margin-note'
-                
-                # Clear and rebuild h3
-                h3.clear()
-                h3['class'] = ['document-note-header']
-                
-                # Add badge
-                badge = soup.new_tag('span')
-                badge['class'] = [badge_class]
-                badge.string = h3_text
-                h3.append(badge)
-                
-                # Add page reference
-                if page_num:
-                    page_span = soup.new_tag('span')
-                    page_span['class'] = ['page-reference']
-                    page_span.string = f' (page {page_num})'
-                    h3.append(page_span)
-
 def convert_consecutive_paragraph_lists(soup):
     """
     Convert consecutive <p> tags that start with list markers into lists.
@@ -1911,15 +1878,34 @@ def fix_section_5120_home_occupations(soup):
                 print(f"  Fixed: restructured items into proper alpha-list with nested content")
                 return
 
-def process_file(filepath):
-    """Process a single HTML file"""
-    print(f"  Processing lists in {filepath.name}...")
-
-    with open(filepath, 'r', encoding='utf-8') as f:
-        content = f.read()
-
-    soup = BeautifulSoup(content, 'html.parser')
-
+ORD54_DOCUMENT = '1989-Ord-54-89C-Land-Development.html'
+
+# Document-specific fixes (see docs/one-off-fixes-inventory.md), in the order
+# they run after the general passes: (description, page file name or document
+# type they were written for, fix). Each page is classified once by
+# utils/document_types.py, and pages outside a fix's target skip its scan.
+DOCUMENT_FIXES = [
+    ('Section 2.080 single-item list', ORD54_DOCUMENT, fix_section_2080_single_item),
+    ('Section 4.120 item (d)', ORD54_DOCUMENT, fix_section_4120_item_d),
+    ('Section 5.080 setback formatting', ORD54_DOCUMENT, fix_section_5080_setback_formatting),
+    ('Section 5.100 Tree Cutting', ORD54_DOCUMENT, fix_section_5100_consistent_formatting),
+    ('Section 5.110 Houses Moved Into City (c/d misclassified as roman)', ORD54_DOCUMENT,
+     fix_section_5110_list_classification),
+    ('Section 5.120 Home Occupations (a/b with nested lists)', ORD54_DOCUMENT, fix_section_5120_home_occupations),
+]
+
+def document_fixes_for(filepath):
+    """The registered document-specific fixes for a page, in order (all of them if the page is unknown)"""
+    if filepath is None:
+        return [fix for _, _, fix in DOCUMENT_FIXES]
+    scope = document_types.PageScope(filepath)
+    return [fix for _, target, fix in DOCUMENT_FIXES if scope.includes(target)]
+
+def process_soup(soup, filepath=None):
+    """
+    Run every list processing pass over a parsed page, in place. filepath
+    selects the document-specific fixes; without it they all run.
+    """
     # Process in order:
     # 1. Convert paragraph lists to proper lists (multi-line in same <p>)
     convert_paragraph_lists(soup)
@@ -1942,56 +1928,84 @@ def process_file(filepath):
     # 7. Process lists in table cells
     process_lists_in_tables(soup)
 
-    # 8. Process Document Notes
-    process_document_notes(soup)
-
-    # 9. Fix concatenated numeric items (from V2)
+    # 8. Fix concatenated numeric items (from V2)
     fix_concatenated_numeric_items(soup)
 
-    # 10. Fix orphaned paragraphs after lists (from V2)
+    # 9. Fix orphaned paragraphs after lists (from V2)
     fix_orphaned_paragraphs(soup)
 
-    # 11. Fix orphaned ordered lists (from V2)
+    # 10. Fix orphaned ordered lists (from V2)
     fix_orphaned_ordered_lists(soup)
 
-    # 12. Fix orphaned code blocks that should be nested lists
+    # 11. Fix orphaned code blocks that should be nested lists
     fix_orphaned_code_blocks(soup)
 
-    # 13. Fix Section 2.080 single-item list (specific targeted fix)
-    fix_section_2080_single_item(soup)
+    # 12-17. Document-specific fixes, only on the pages they target (DOCUMENT_FIXES)
+    for fix in document_fixes_for(filepath):
+        fix(soup)
 
-    # 14. Fix Section 4.120 item (d) (specific targeted fix)
-    fix_section_4120_item_d(soup)
+    return soup
 
-    # 15. Fix Section 5.080 setback formatting (specific targeted fix)
-    fix_section_5080_setback_formatting(soup)
+def process_html(content, filepath=None):
+    """Run every list processing pass over a page's HTML and return the result"""
+    soup = parse_html(content, for_output=True)
+    process_soup(soup, filepath)
+    return str(soup)
 
-    # 16. Fix Section 5.100 Tree Cutting (specific targeted fix)
-    fix_section_5100_consistent_formatting(soup)
+def process_file(filepath, cache=None):
+    """Process a single HTML file"""
+    print(f"  Processing lists in {filepath.name}...")
 
-    # 17. Fix Section 5.110 Houses Moved Into City (c/d misclassified as roman)
-    fix_section_5110_list_classification(soup)
+    with open(filepath, 'r', encoding='utf-8') as f:
+        content = f.read()
 
-    # 18. Fix Section 5.120 Home Occupations (a/b with nested lists)
-    fix_section_5120_home_occupations(soup)
+    # Pages whose mdBook output hasn't changed reuse the previous result
+    processed = cache.get(filepath, content) if cache else None
+    if processed is None:
+        processed = process_html(content, filepath)
+        if cache:
+            cache.put(filepath, content, processed)
 
-    # Write back
-    content = str(soup)
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write(content)
+    # Write back (only if the page changed, so its mtime is left alone otherwise)
+    write_if_changed(filepath, processed)
 
     return True
 
+def process_timed(filepath, content):
+    """
+    Worker for the process pool: run all passes over one page.
+    Returns (filepath, processed_html, seconds, error) - never raises, so one
+    bad page can't take down the pool.
+    """
+    start = time.perf_counter()
+    try:
+        processed = process_html(content, filepath)
+        return filepath, processed, time.perf_counter() - start, None
+    except Exception as e:
+        return filepath, None, time.perf_counter() - start, f"{type(e).__name__}: {e}"
+
 def main():
     """Process all HTML files in the book directory"""
+    parser = argparse.ArgumentParser(description='Apply unified list processing to mdBook HTML output')
+    parser.add_argument('files', nargs='*', type=Path,
+                        help='HTML files to process (default: every book/**/*.html)')
+    parser.add_argument('--jobs', '-j', type=int, default=os.cpu_count() or 1,
+                        help='Number of worker processes (default: CPU count)')
+    parser.add_argument('--timings', action='store_true',
+                        help='Show the processing time of every file, not just the slowest')
+    args = parser.parse_args()
+
     book_dir = Path('book')
     
-    if not book_dir.exists():
-        print("Error: book directory not found. Run mdbook build first.")
-        sys.exit(1)
-    
-    # Process all HTML files
-    html_files = list(book_dir.glob('**/*.html'))
+    if args.files:
+        html_files = [f for f in args.files if f.exists()]
+    else:
+        if not book_dir.exists():
+            print("Error: book directory not found. Run mdbook build first.")
+            sys.exit(1)
+        
+        # Process all HTML files
+        html_files = list(book_dir.glob('**/*.html'))
     
     if not html_files:
         print("No HTML files found in book directory")
@@ -1999,14 +2013,68 @@ def main():
     
     print(f"Processing {len(html_files)} HTML files...")
     
+    cache = BuildCache('unified-list-processor', [__file__, document_types.__file__, html_parser.__file__],
+                       settings=[html_parser.get_backend(for_output=True)])
+    
+    # Restore cached pages up front; only the rest go to the workers
+    pending = []
+    errors = []
+    timings = []
     for filepath in html_files:
         try:
-            process_file(filepath)
+            with open(filepath, 'r', encoding='utf-8') as f:
+                content = f.read()
         except Exception as e:
-            print(f"  Error processing {filepath.name}: {e}")
+            errors.append((filepath, str(e)))
             continue
+        
+        cached = cache.get(filepath, content)
+        if cached is not None:
+            write_if_changed(filepath, cached)
+        else:
+            pending.append((filepath, content))
+    
+    def finish(result, content):
+        filepath, processed, elapsed, error = result
+        timings.append((elapsed, filepath))
+        if error:
+            print(f"  Error processing {filepath.name}: {error}")
+            errors.append((filepath, error))
+            return
+        write_if_changed(filepath, processed)
+        cache.put(filepath, content, processed)
+    
+    jobs = max(1, min(args.jobs, len(pending)))
+    start = time.perf_counter()
+    if jobs > 1:
+        print(f"  Using {jobs} worker processes for {len(pending)} file(s)")
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            futures = {executor.submit(process_timed, filepath, content): content
+                       for filepath, content in pending}
+            for future in as_completed(futures):
+                finish(future.result(), futures[future])
+    else:
+        for filepath, content in pending:
+            print(f"  Processing lists in {filepath.name}...")
+            finish(process_timed(filepath, content), content)
+    wall_time = time.perf_counter() - start
+    
+    cache.save()
+    
+    # Timing report: slowest files first
+    timings.sort(key=lambda t: t[0], reverse=True)
+    shown = timings if args.timings else timings[:5]
+    if shown:
+        print(f"\n  Processing time ({sum(t for t, _ in timings):.2f}s CPU, {wall_time:.2f}s wall):")
+        for elapsed, filepath in shown:
+            print(f"    {elapsed:6.2f}s  {filepath}")
+    
+    if errors:
+        print(f"\n✗ {len(errors)} file(s) failed:")
+        for filepath, error in errors:
+            print(f"    {filepath}: {error}")
     
-    print(f"✓ Processed {len(html_files)} files")
+    print(f"✓ Processed {len(html_files) - len(errors)} files ({cache.summary()})")
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
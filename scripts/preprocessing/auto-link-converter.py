@@ -8,6 +8,9 @@ import re
 import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from utils.build_cache import BuildCache, write_if_changed
+
 def convert_urls_to_links(content):
     """
     Convert plain URLs to markdown links.
@@ -81,7 +84,7 @@ def convert_emails_to_links(content):
     
     return content
 
-def process_file(file_path):
+def process_file(file_path, cache=None):
     """Process a single file to convert URLs and emails to links."""
     path = Path(file_path)
     
@@ -98,15 +101,22 @@ def process_file(file_path):
         content = path.read_text(encoding='utf-8')
         original_content = content
         
-        # Convert URLs to links
-        content = convert_urls_to_links(content)
-        
-        # Convert emails to links
-        content = convert_emails_to_links(content)
+        cached = cache.get(path, original_content) if cache else None
+        if cached is not None:
+            content = cached
+        else:
+            # Convert URLs to links
+            content = convert_urls_to_links(content)
+            
+            # Convert emails to links
+            content = convert_emails_to_links(content)
+            
+            if cache:
+                cache.put(path, original_content, content)
         
         # Only write if changes were made
         if content != original_content:
-            path.write_text(content, encoding='utf-8')
+            write_if_changed(path, content)
             print(f"✓ Converted links in: {path.name}")
             
             # Show what was converted for verification
@@ -135,6 +145,7 @@ def main():
     
     success_count = 0
     total_files = len(sys.argv) - 1
+    cache = BuildCache('auto-link', [__file__])
     
     for file_path in sys.argv[1:]:
         # Handle glob patterns
@@ -145,13 +156,15 @@ def main():
             pattern = path.name
             for file in parent.glob(pattern):
                 if file.suffix == '.md':
-                    if process_file(file):
+                    if process_file(file, cache):
                         success_count += 1
         else:
             # Single file
-            if process_file(file_path):
+            if process_file(file_path, cache):
                 success_count += 1
     
+    cache.save()
+    
     if success_count > 0:
         print(f"\n✅ Converted links in {success_count} file(s)")
 
@@ -20,6 +20,9 @@ import re
 import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from utils.build_cache import write_if_changed
+
 class ListSection:
     """Represents a section of list items with metadata"""
     def __init__(self, start_line, heading_before=None):
@@ -278,7 +281,7 @@ def process_file(file_path):
             backup_path.write_text(original_content, encoding='utf-8')
 
             # Write processed content
-            path.write_text(content, encoding='utf-8')
+            write_if_changed(path, content)
             print(f"✓ Processed complex lists in: {path.name}")
 
             # Count the number of list sections processed
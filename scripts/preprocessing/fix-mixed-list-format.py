@@ -16,6 +16,9 @@ import re
 import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from utils.build_cache import write_if_changed
+
 def fix_mixed_lists_in_file(file_path):
     """Fix mixed list formats in a single markdown file."""
     path = Path(file_path)
@@ -78,8 +81,7 @@ def fix_mixed_lists_in_file(file_path):
         i += 1
 
     if modified:
-        with open(path, 'w', encoding='utf-8') as f:
-            f.writelines(new_lines)
+        write_if_changed(path, ''.join(new_lines))
         print(f"✓ Fixed mixed list formats in {path.name}")
         return True
     else:
@@ -5,8 +5,12 @@ Adds double spaces at the end of signature lines for proper Markdown line breaks
 """
 
 import re
+import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from utils.build_cache import write_if_changed
+
 def fix_signature_formatting(content):
     """Fix signature blocks and hearing info to have proper line breaks."""
     
@@ -66,7 +70,7 @@ def process_files():
             
             # Only write if changed
             if content != original:
-                md_file.write_text(content, encoding='utf-8')
+                write_if_changed(md_file, content)
                 print(f"Fixed signatures in: {md_file}")
                 fixed_count += 1
     
@@ -13,6 +13,9 @@ import re
 import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from utils.build_cache import BuildCache, write_if_changed
+
 def validate_footnotes(content):
     """Check if footnote references in tables match footnote definitions."""
     lines = content.split('\n')
@@ -108,14 +111,18 @@ def process_footnotes(content):
     
     return '\n'.join(result_lines)
 
-def process_file(filepath, dry_run=False):
+def process_file(filepath, dry_run=False, cache=None):
     """Process a single markdown file."""
     path = Path(filepath)
     if not path.exists() or not path.suffix == '.md':
         return None
     
     content = path.read_text()
-    processed = process_footnotes(content)
+    processed = cache.get(path, content) if cache else None
+    if processed is None:
+        processed = process_footnotes(content)
+        if cache:
+            cache.put(path, content, processed)
     
     # Validate footnotes
     warnings = validate_footnotes(processed)
@@ -123,7 +130,7 @@ def process_file(filepath, dry_run=False):
     # Debug: Check if content actually changed
     if content != processed:
         if not dry_run:
-            path.write_text(processed)
+            write_if_changed(path, processed)
         # Count how many footnotes were found (with or without bold)
         footnote_count = len(re.findall(r'^[¹²³⁴⁵⁶⁷⁸⁹⁰]+\s+', processed, re.MULTILINE))
         # Debug: Count divs added
@@ -138,14 +145,18 @@ def main(dry_run=False):
     src_dirs = ['src/ordinances', 'src/resolutions', 'src/interpretations', 'src/other']
     
     changed_files = []
+    cache = BuildCache('footnotes', [__file__])
     
     for dir_path in src_dirs:
         if Path(dir_path).exists():
             for file in Path(dir_path).glob('*.md'):
-                result = process_file(file, dry_run)
+                result = process_file(file, dry_run, cache)
                 if result:
                     changed_files.append(result)
     
+    if not dry_run:
+        cache.save()
+    
     # Print report
     if changed_files:
         print("\n" + "="*60)
@@ -10,6 +10,9 @@ import re
 import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from utils.build_cache import write_if_changed
+
 def process_unfilled_blanks(content):
     """
     Convert unfilled blank fields (underscores) to markdown notation.
@@ -86,7 +89,7 @@ def process_file(file_path):
         
         # Only write if changes were made
         if content != original_content:
-            path.write_text(content, encoding='utf-8')
+            write_if_changed(path, content)
             print(f"✓ Processed form fields in: {path.name}")
             
             # Count what was processed
@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 """
 DEPRECATED: Image processing is now handled directly by the sync scripts
-(sync-ordinances.py, sync-resolutions.py, etc.)
+(sync-documents.py, which sync-ordinances.py, sync-resolutions.py, etc. wrap)
 
 This standalone script is kept for reference but is not used in the build pipeline.
 
@@ -13,6 +13,9 @@ import re
 import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from utils.build_cache import write_if_changed
+
 def get_image_path(filename, document_path):
     """
     Determine the correct image path based on document type and location.
@@ -119,7 +122,7 @@ def process_file(file_path):
         
         # Only write if changes were made
         if content != original_content:
-            path.write_text(content, encoding='utf-8')
+            write_if_changed(path, content)
             print(f"✓ Processed images in: {path.name}")
             
             # Count what was processed
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Fused Markdown preprocessing for City of Rivergrove documents.
+
+Does the work of build-all.sh Steps 1 and 4-6 in one process:
+1. Sync       - sync-documents.py (image and form field conversion,
+                # removed from filenames)
+2. Footnotes  - footnote-preprocessor.py
+3. Auto-link  - auto-link-converter.py (URLs, then emails)
+4. Cross-refs - add-cross-references.py
+
+Each source document is read once, run through the stages in memory in that
+order, and its src/ file is written once - and only if the result differs from
+what is already there. Footnotes and auto-link apply to the four governing
+document folders, cross-references to every src/ page (as before). src/ files
+that aren't synced from source-documents/ (e.g. introduction.md) still get
+cross-references.
+
+The individual scripts still run standalone for debugging a single stage.
+
+Usage:
+    python3 scripts/preprocessing/preprocess-documents.py
+    python3 scripts/preprocessing/preprocess-documents.py --dry-run
+"""
+
+import sys
+import json
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from utils.build_cache import BuildCache, atomic_write_text
+from utils.script_loader import load_script
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+SRC_DIR = Path('src')
+
+sync_documents = load_script('preprocessing/sync-documents.py')
+footnotes = load_script('preprocessing/footnote-preprocessor.py')
+auto_link = load_script('preprocessing/auto-link-converter.py')
+cross_references = load_script('mdbook/add-cross-references.py')
+
+# The stage scripts and the shared modules they convert with - their code versions the cache
+STAGE_SCRIPTS = [
+    'preprocessing/sync-documents.py',
+    'preprocessing/footnote-preprocessor.py',
+    'preprocessing/auto-link-converter.py',
+    'mdbook/add-cross-references.py',
+    'utils/directives.py',
+]
+
+
+class Document:
+    """One src/ page and where its content comes from."""
+
+    def __init__(self, label, dest, source=None, convert=None, markdown_stages=False):
+        self.label = label
+        self.dest = dest
+        self.source = source or dest
+        self.convert = convert
+        self.markdown_stages = markdown_stages
+        self.footnote_warnings = []
+
+
+def plan_documents():
+    """
+    List every src/ page this run produces, plus the src/ directories it owns.
+    Returns (documents, managed_dirs).
+    """
+    sources, managed_dirs = sync_documents.plan()
+    documents = [Document(doc.label, doc.dest, doc.source,
+                          sync_documents.convert if doc.doc_type.governing else None,
+                          markdown_stages=doc.doc_type.governing)
+                 for doc in sources]
+
+    # Hand-maintained src/ pages only get cross-references
+    synced = {doc.dest for doc in documents}
+    for md_file in sorted(SRC_DIR.rglob('*.md')):
+        if md_file.name == 'SUMMARY.md' or md_file in synced or md_file.parent in managed_dirs:
+            continue
+        documents.append(Document('page', md_file))
+
+    return documents, managed_dirs
+
+
+def preprocess(doc, content, doc_map):
+    """Run every stage over one document's content in memory."""
+    if doc.convert:
+        content = doc.convert(content, doc.dest)
+
+    if doc.markdown_stages:
+        before = content
+        content = footnotes.process_footnotes(content)
+        if content != before:
+            doc.footnote_warnings = footnotes.validate_footnotes(content)
+
+        content = auto_link.convert_urls_to_links(content)
+        content = auto_link.convert_emails_to_links(content)
+
+    return cross_references.add_cross_references(content, doc_map, doc.dest)
+
+
+def cache_for_stages():
+    """The build cache shared by every run of the fused stages."""
+    return BuildCache('preprocess', [__file__] + [SCRIPTS_DIR / script for script in STAGE_SCRIPTS])
+
+
+def write_documents(documents, doc_map, cache, reference_index, dry_run=False):
+    """
+    Preprocess documents and write each src/ file that changed.
+    Returns (updated, footnote_warnings): label -> written files, and
+    (dest, warnings) for documents whose footnotes need attention.
+    """
+    doc_map_key = json.dumps(doc_map, sort_keys=True)
+
+    updated = {}
+    footnote_warnings = []
+    for doc in documents:
+        with open(doc.source, 'r', encoding='utf-8') as f:
+            content = f.read()
+
+        processed = cache.get(doc.source, content, doc_map_key)
+        if processed is None:
+            processed = preprocess(doc, content, doc_map)
+            cache.put(doc.source, content, processed, doc_map_key)
+            if doc.footnote_warnings:
+                footnote_warnings.append((doc.dest, doc.footnote_warnings))
+        reference_index.record(doc.dest, processed, doc_map)
+
+        existing = None
+        if doc.dest.exists():
+            with open(doc.dest, 'r', encoding='utf-8') as f:
+                existing = f.read()
+
+        if processed != existing:
+            if not dry_run:
+                atomic_write_text(doc.dest, processed)
+            updated.setdefault(doc.label, []).append(doc.dest)
+
+    return updated, footnote_warnings
+
+
+def remove_orphans(documents, managed_dirs, dry_run=False):
+    """Remove pages whose source document no longer exists. Returns the removed files."""
+    planned = {doc.dest for doc in documents}
+    removed = []
+    for dest_dir in managed_dirs:
+        for existing_file in sorted(dest_dir.glob('*.md')):
+            if existing_file not in planned:
+                if not dry_run:
+                    existing_file.unlink()
+                removed.append(existing_file)
+    return removed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Sync and preprocess all documents into src/ in one pass')
+    parser.add_argument('--dry-run', action='store_true', help='Report what would change without writing src/')
+    args = parser.parse_args()
+
+    print("📁 Preprocessing documents (sync → footnotes → auto-link → cross-references)...")
+
+    documents, managed_dirs = plan_documents()
+
+    # The cross-reference map comes from the planned file set, so it is
+    # complete even before new documents have been written
+    doc_map = cross_references.build_document_map([doc.dest for doc in documents])
+
+    cache = cache_for_stages()
+
+    # Lets add-cross-references.py relink only affected files after a later edit
+    reference_index = cross_references.ReferenceIndex()
+
+    updated, footnote_warnings = write_documents(documents, doc_map, cache, reference_index, args.dry_run)
+    removed = remove_orphans(documents, managed_dirs, args.dry_run)
+
+    if not args.dry_run:
+        cache.save()
+        reference_index.save(doc_map)
+
+    # Print results
+    for label, files in updated.items():
+        print(f"  Updated {len(files)} {label} file(s):")
+        for file in files:
+            print(f"    ✓ {file}")
+    if removed:
+        print(f"  Removed {len(removed)} file(s):")
+        for file in removed:
+            print(f"    ✗ {file}")
+    for dest, warnings in footnote_warnings:
+        print(f"  📄 {dest}")
+        for warning in warnings:
+            print(warning)
+
+    changed = sum(len(files) for files in updated.values())
+    print(f"  {changed} written, {len(documents) - changed} unchanged, {len(removed)} removed "
+          f"({len(doc_map)} cross-reference patterns, {cache.summary()})")
+    if args.dry_run:
+        print("  This was a DRY RUN - no files were modified")
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -5,8 +5,12 @@ These should be plain text that gets converted to links during the build process
 """
 
 import re
+import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from utils.build_cache import write_if_changed
+
 def remove_manual_links(content):
     """Remove manual markdown links to ordinances/resolutions, keeping just the text."""
     
@@ -37,7 +41,7 @@ def process_file(file_path):
         
         # Only write if changes were made
         if content != original_content:
-            path.write_text(content, encoding='utf-8')
+            write_if_changed(path, content)
             
             # Count how many links were removed
             links_removed = original_content.count('](../') - content.count('](../')
@@ -8,6 +8,9 @@ import re
 import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from utils.build_cache import write_if_changed
+
 def process_resolution_41425(content):
     """
     Handle the special case in Resolution 41425 where the instructions list
@@ -110,7 +113,7 @@ def process_file(file_path):
         
         # Only write if changes were made
         if content != original_content:
-            path.write_text(content, encoding='utf-8')
+            write_if_changed(path, content)
             print(f"✓ Processed special lists in: {path.name}")
             return True
         else:
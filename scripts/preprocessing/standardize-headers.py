@@ -5,8 +5,12 @@ This only changes the markdown formatting (# levels), not the actual text or str
 """
 
 import re
+import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from utils.build_cache import write_if_changed
+
 def standardize_ordinance_headers(content, filename):
     """
     Standardize header levels in an ordinance file.
@@ -142,7 +146,7 @@ def process_ordinances():
         
         # Only write if changed
         if content != original:
-            md_file.write_text(content, encoding='utf-8')
+            write_if_changed(md_file, content)
             changed_files.append(md_file.name)
             print(f"  ✓ Updated headers")
         else:
@@ -13,6 +13,9 @@ import re
 import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from utils.build_cache import write_if_changed
+
 def standardize_lists(content):
     """Standardize list formats in markdown"""
     lines = content.split('\n')
@@ -76,8 +79,7 @@ def process_file(filepath):
     
     # Check if anything changed
     if fixed_content != content:
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(fixed_content)
+        write_if_changed(filepath, fixed_content)
         
         # Count changes
         original_numeric = len(re.findall(r'^\(\d+\)', content, re.MULTILINE))
@@ -8,6 +8,9 @@ import sys
 import re
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from utils.build_cache import write_if_changed
+
 def standardize_ordinance_headers(content, filename):
     """
     Standardize header levels in an ordinance file.
@@ -201,7 +204,7 @@ def process_file(file_path):
         
         # Only write if changes were made
         if content != original_content:
-            path.write_text(content, encoding='utf-8')
+            write_if_changed(path, content)
             print(f"✓ Standardized: {path.name}")
             return True
         else:
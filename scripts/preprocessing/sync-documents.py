@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""
+Sync source documents into src/ for mdBook - one engine for every document type.
+
+DOCUMENT_TYPES says where each source-documents/ folder goes:
+- Ordinances, Resolutions  -> src/ordinances, src/resolutions (# removed from filenames)
+- Interpretations, Other   -> src/interpretations, src/other
+- Meetings/YYYY/YYYY-MM/YYYY-MM-DD-Type.md -> src/transcripts, src/agendas, src/minutes
+
+source-documents/ is walked once for all of them. Governing documents get image
+and form field conversion ({{image:}}, {{filled:}}, {{signature}}, ...);
+meeting documents are copied as they are. A src/ file is only written if its
+content changed, and pages whose source document is gone are removed.
+
+sync-ordinances.py, sync-resolutions.py, sync-interpretations.py,
+sync-other.py and sync-meetings.py are thin wrappers that sync one type, and
+preprocess-documents.py plans its Step 1 with the same table.
+
+Usage:
+    python3 scripts/preprocessing/sync-documents.py                      # every type
+    python3 scripts/preprocessing/sync-documents.py --type ordinances
+    python3 scripts/preprocessing/sync-documents.py --only source-documents/Resolutions/2024-Res-#300-Fee-Schedule-Modification.md
+    python3 scripts/preprocessing/sync-documents.py --dry-run
+"""
+
+import re
+import sys
+import filecmp
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from utils.build_cache import BuildCache, write_if_changed
+from utils import directives
+from utils.directives import render
+
+SOURCE_ROOT = Path('source-documents')
+
+
+class DocumentType:
+    """One source-documents/ folder and how its files sync into src/."""
+
+    def __init__(self, name, label, folder, dest_dir, strip_hash=False, governing=True):
+        self.name = name              # --type value
+        self.label = label            # as in "Updated 2 ordinance file(s)"
+        self.source_dir = SOURCE_ROOT / folder
+        self.dest_dir = Path(dest_dir)
+        self.strip_hash = strip_hash
+        self.governing = governing    # gets image/form field conversion (and footnotes etc. in preprocessing)
+
+    def dest_dirs(self):
+        return [self.dest_dir]
+
+    def includes(self, relative):
+        """Whether a file at this path (relative to source_dir) belongs to the type."""
+        return len(relative.parts) == 1
+
+    def route(self, file):
+        """(label, src/ path) for a source file, or None to skip it."""
+        name = file.name.replace('#', '') if self.strip_hash else file.name
+        return self.label, self.dest_dir / name
+
+
+class MeetingType(DocumentType):
+    """Meeting documents, filed by year and month and sorted into src/ by kind."""
+
+    TARGETS = {
+        'Transcript': Path('src/transcripts'),
+        'Agenda': Path('src/agendas'),
+        'Minutes': Path('src/minutes'),
+    }
+    PATTERN = re.compile(r'^(\d{4}-\d{2}-\d{2})-(Transcript|Agenda|Minutes)\.md$')
+
+    def __init__(self):
+        super().__init__('meetings', 'meeting', 'Meetings', 'src', governing=False)
+
+    def dest_dirs(self):
+        return list(self.TARGETS.values())
+
+    def includes(self, relative):
+        return True
+
+    def route(self, file):
+        match = self.PATTERN.match(file.name)
+        if not match:
+            print(f"  ⚠️  Skipped (unrecognized format): {file.name}")
+            return None
+        kind = match.group(2)
+        return kind.lower(), self.TARGETS[kind] / file.name
+
+
+DOCUMENT_TYPES = [
+    DocumentType('ordinances', 'ordinance', 'Ordinances', 'src/ordinances', strip_hash=True),
+    DocumentType('resolutions', 'resolution', 'Resolutions', 'src/resolutions', strip_hash=True),
+    DocumentType('interpretations', 'interpretation', 'Interpretations', 'src/interpretations'),
+    DocumentType('other', 'other document', 'Other', 'src/other'),
+    MeetingType(),
+]
+TYPES_BY_NAME = {doc_type.name: doc_type for doc_type in DOCUMENT_TYPES}
+
+
+class SourceDocument:
+    """A source file and the src/ page it syncs to."""
+
+    def __init__(self, doc_type, label, source, dest):
+        self.doc_type = doc_type
+        self.label = label
+        self.source = source
+        self.dest = dest
+        self.duplicates = []   # other source files that map to the same page
+
+    def convert(self, content):
+        return convert(content, self.dest) if self.doc_type.governing else content
+
+
+EMPTY_FIELD = '<span class="form-field-empty form-field-medium" data-tooltip="Field left blank in source doc"></span>'
+FILLED_FIELD = '<span class="form-field-filled" data-tooltip="Field filled in on source doc">{}</span>'
+SIGNATURE = ('<span class="signature-mark" aria-label="Signature" '
+             'data-tooltip="Signature present in original document">Signature</span><br>')
+
+
+def render_filled(value, heading, context):
+    """
+    {{filled:}} -> empty field, {{filled:text}} -> filled field.
+
+    In headings, mdBook builds the anchor ID from the text inside the spans,
+    so anything after the colon (even blanks) stays a filled field.
+    """
+    if value is None:
+        return None
+    if not value or (not heading and not value.strip()):
+        return EMPTY_FIELD
+    return FILLED_FIELD.format(value.strip())
+
+
+def render_image(value, heading, context):
+    """{{image:filename|alt=text|caption=text}} -> figure with the image from images/<type>/."""
+    if not value:
+        return None
+    parts = value.split('|')
+    filename = parts[0].strip()
+
+    # Parse additional parameters
+    alt_text = ""
+    caption = ""
+    for part in parts[1:]:
+        if '=' in part:
+            key, param = part.split('=', 1)
+            key = key.strip()
+            if key == 'alt':
+                alt_text = param.strip()
+            elif key == 'caption':
+                caption = param.strip()
+
+    # Relative to the HTML file location in book/<type>/
+    image_path = f"../images/{context['image_dir']}/{context['doc_name']}-{filename}.png"
+
+    html = f'<figure class="document-figure">\n'
+    html += f'    <img src="{image_path}" alt="{alt_text}" />\n'
+    if caption:
+        html += f'    <figcaption>{caption}</figcaption>\n'
+    html += f'</figure>'
+    return html
+
+
+# Directive -> handler(value, heading, context); see utils/directives.py
+SYNC_DIRECTIVES = {
+    'filled': render_filled,
+    'signature': lambda value, heading, context: SIGNATURE if value is None else None,
+    'br': lambda value, heading, context: '<br>' if value is None else None,
+    'table-footnote': lambda value, heading, context:
+        f'<div class="table-footnotes">{value.strip()}</div>' if value else None,
+    'page': lambda value, heading, context: f'[page {value.strip()}]' if value else None,
+    'image': render_image,
+}
+
+
+def convert(content, dest_file):
+    """
+    Sync conversion for a governing document headed for dest_file: images,
+    form fields ({{filled:}}, {{signature}}) and layout directives ({{br}},
+    {{table-footnote:}}, {{page:}}), all in one pass.
+    """
+    return render(content, SYNC_DIRECTIVES, doc_name=dest_file.stem, image_dir=dest_file.parent.name)
+
+
+def plan(types=None):
+    """
+    Walk source-documents/ once and map every source file of the given types
+    (default: all) to its src/ page. Returns (documents, managed_dirs).
+    """
+    types = types or DOCUMENT_TYPES
+    managed_dirs = []
+    for doc_type in types:
+        if doc_type.source_dir.exists():
+            managed_dirs.extend(doc_type.dest_dirs())
+        else:
+            print(f"  ⚠️  Source directory {doc_type.source_dir} does not exist")
+
+    by_folder = {doc_type.source_dir.name: doc_type for doc_type in types}
+    planned = {}
+    for file in sorted(SOURCE_ROOT.rglob('*.md')):
+        relative = file.relative_to(SOURCE_ROOT)
+        doc_type = by_folder.get(relative.parts[0])
+        if doc_type is None or not doc_type.includes(Path(*relative.parts[1:])):
+            continue
+        route = doc_type.route(file)
+        if route is None:
+            continue
+        label, dest = route
+        if dest in planned:
+            # e.g. "Ord-#54-..." and a stray "Ord-54-..." both become Ord-54-...;
+            # the #-named file is the original, so it wins
+            original, duplicate = sorted([planned[dest].source, file], key=lambda f: '#' not in f.name)
+            if not filecmp.cmp(original, duplicate, shallow=False):
+                print(f"  ⚠️  {duplicate.name} and {original.name} both sync to {dest} - using {original}")
+            planned[dest].source = original
+            planned[dest].duplicates.append(duplicate)
+            continue
+        planned[dest] = SourceDocument(doc_type, label, file, dest)
+
+    # In DOCUMENT_TYPES order, each type's files sorted by path
+    documents = sorted(planned.values(), key=lambda doc: types.index(doc.doc_type))
+    return documents, managed_dirs
+
+
+def sync(types=None, only=None, dry_run=False):
+    """
+    Sync documents into src/ and remove pages whose source is gone. With
+    `only` (a source path) just that document is synced and nothing is removed.
+
+    Returns (documents, updated, removed): the documents synced, label ->
+    files written, and the files removed.
+    """
+    documents, managed_dirs = plan(types)
+    if only is not None:
+        only = Path(only).resolve()
+        documents = [doc for doc in documents
+                     if only in [path.resolve() for path in [doc.source] + doc.duplicates]]
+
+    # Reuse converted content for source files that haven't changed
+    cache = BuildCache('sync-documents', [__file__, directives.__file__])
+    updated = {}
+    for doc in documents:
+        with open(doc.source, 'r', encoding='utf-8') as f:
+            source_content = f.read()
+
+        processed = cache.get(doc.source, source_content)
+        if processed is None:
+            processed = doc.convert(source_content)
+            cache.put(doc.source, source_content, processed)
+
+        if dry_run:
+            changed = not doc.dest.exists() or doc.dest.read_text(encoding='utf-8') != processed
+        else:
+            changed = write_if_changed(doc.dest, processed)
+        if changed:
+            updated.setdefault(doc.label, []).append(doc.dest)
+
+    removed = []
+    if only is None:
+        planned = {doc.dest for doc in documents}
+        for dest_dir in managed_dirs:
+            for existing_file in sorted(dest_dir.glob('*.md')):
+                if existing_file not in planned:
+                    if not dry_run:
+                        existing_file.unlink()
+                    removed.append(existing_file)
+
+    if not dry_run:
+        cache.save()
+    return documents, updated, removed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Sync source documents into src/ for mdBook')
+    parser.add_argument('--type', dest='types', action='append', choices=list(TYPES_BY_NAME),
+                        help='Only sync this document type (repeatable; default: all)')
+    parser.add_argument('--only', metavar='PATH', help='Only sync this one source document')
+    parser.add_argument('--dry-run', action='store_true', help='Report what would change without writing src/')
+    args = parser.parse_args(argv)
+
+    types = [TYPES_BY_NAME[name] for name in args.types] if args.types else None
+    documents, updated, removed = sync(types, args.only, args.dry_run)
+    if args.only and not documents:
+        print(f"✗ {args.only} is not a source document that syncs to src/")
+        return 1
+
+    for label, files in updated.items():
+        print(f"  Updated {len(files)} {label} file(s):")
+        for file in files:
+            print(f"    ✓ {file}")
+    if removed:
+        print(f"  Removed {len(removed)} file(s):")
+        for file in removed:
+            print(f"    ✗ {file}")
+
+    changed = sum(len(files) for files in updated.values())
+    print(f"✓ Synced {len(documents)} document(s): {changed} changed, "
+          f"{len(documents) - changed} unchanged, {len(removed)} removed")
+    if args.dry_run:
+        print("  This was a DRY RUN - no files were modified")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -4,8 +4,12 @@ Update document counts in introduction.md based on actual files in src/ director
 """
 
 import re
+import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from utils.build_cache import write_if_changed
+
 def count_documents():
     """Count documents in each category."""
     src_dir = Path("src")
@@ -104,7 +108,7 @@ def update_introduction_counts(counts):
     
     # Write updated content back
     if updated_content != content:
-        intro_file.write_text(updated_content, encoding='utf-8')
+        write_if_changed(intro_file, updated_content)
         return True
     
     return False
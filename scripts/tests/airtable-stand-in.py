@@ -0,0 +1,643 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the Airtable REST API, for offline builds, tests and benchmarks.
+
+Serves the endpoints our scripts use (through scripts/utils/airtable_client.py)
+from JSON fixtures, so the sync paths can run and be profiled without live
+credentials:
+- GET  /v0/<base>/<table>               list records (pageSize, offset,
+                                        filterByFormula, fields[], maxRecords)
+- POST /v0/<base>/<table>/listRecords   the same, with parameters in the body
+- GET  /v0/<base>/<table>/<id>          one record
+- PATCH|PUT /v0/<base>/<table>/<id>     update one record
+- PATCH|PUT /v0/<base>/<table>          update up to 10 records
+- POST /v0/<base>/<table>               create up to 10 records
+
+filterByFormula supports the subset of Airtable formulas our scripts send:
+field references, string/number literals, = != < > <= >= &, and OR, AND,
+NOT, IF, BLANK, LOWER, UPPER, FIND, LEN, RECORD_ID, CREATED_TIME,
+LAST_MODIFIED_TIME, DATETIME_PARSE, IS_AFTER, IS_BEFORE. Updates bump a
+record's modified time, so delta syncs see them.
+
+Fixtures are one file per table (<Table>.json, in Airtable's list format):
+- scripts/tests/fixtures/airtable/ holds a recorded set, rebuilt from the
+  committed caches in src/ (`generate --records 0`)
+- `generate --records 10000` pads that set with deterministic synthetic records
+- `record` captures the live tables (needs real credentials)
+
+Usage:
+    ./scripts/tests/airtable-stand-in.py serve                     # port 8787
+    ./scripts/tests/airtable-stand-in.py serve --fixtures /tmp/at --rate-limit 5
+    ./scripts/tests/airtable-stand-in.py generate --out /tmp/at --records 10000
+    ./scripts/tests/airtable-stand-in.py record --out scripts/tests/fixtures/airtable
+
+Then point any script at it:
+    export AIRTABLE_API_URL=http://127.0.0.1:8787
+    export AIRTABLE_API_KEY=stand-in AIRTABLE_BASE_ID=appStandIn
+    ./scripts/mdbook/sync-airtable-metadata.py --mode=full --force --include-meetings
+"""
+
+import re
+import sys
+import json
+import time
+import random
+import argparse
+import threading
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qsl, unquote, urlparse
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+FIXTURES_DIR = Path(__file__).parent / 'fixtures' / 'airtable'
+TABLES = ['Governing_Metadata', 'Meetings_Metadata']
+MAX_PAGE_SIZE = 100
+MAX_BATCH = 10
+REPO_URL = 'https://github.com/wifelette/city_of_rivergrove/blob/main'
+
+
+def timestamp(moment):
+    return moment.strftime('%Y-%m-%dT%H:%M:%S.000Z')
+
+
+def parse_time(value):
+    value = str(value).strip()
+    if not value:
+        return None
+    try:
+        moment = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    return moment if moment.tzinfo else moment.replace(tzinfo=timezone.utc)
+
+
+# ---- Formulas ------------------------------------------------------------------
+
+class FormulaError(Exception):
+    """filterByFormula uses syntax or a function the stand-in doesn't support."""
+
+
+TOKEN = re.compile(r"""
+    \s*(?:
+      (?P<field>\{[^}]*\})
+    | (?P<string>'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*")
+    | (?P<number>\d+(?:\.\d+)?)
+    | (?P<op>!=|<=|>=|[=<>&(),])
+    | (?P<name>[A-Za-z_][A-Za-z_0-9]*)
+    )""", re.VERBOSE)
+
+
+def tokenize(formula):
+    tokens = []
+    pos = 0
+    formula = formula.rstrip()
+    while pos < len(formula):
+        match = TOKEN.match(formula, pos)
+        if not match or match.end() == pos:
+            raise FormulaError(f"Unexpected input at {formula[pos:pos + 20]!r}")
+        pos = match.end()
+        kind = match.lastgroup
+        text = match.group(kind)
+        if kind == 'string':
+            text = re.sub(r'\\(.)', r'\1', text[1:-1])
+        elif kind == 'field':
+            text = text[1:-1]
+        elif kind == 'number':
+            text = float(text)
+        tokens.append((kind, text))
+    return tokens
+
+
+class Formula:
+    """A parsed filterByFormula, evaluated against one record at a time."""
+
+    COMPARISONS = ['=', '!=', '<', '>', '<=', '>=']
+
+    def __init__(self, formula):
+        self.tokens = tokenize(formula)
+        self.pos = 0
+        self.tree = self.expression()
+        if self.pos != len(self.tokens):
+            raise FormulaError(f"Unexpected {self.tokens[self.pos][1]!r}")
+
+    # Parsing: comparison > concatenation > term
+    def peek(self):
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else (None, None)
+
+    def take(self, text=None):
+        kind, value = self.peek()
+        if kind is None or (text is not None and value != text):
+            raise FormulaError(f"Expected {text or 'a value'}, got {value!r}")
+        self.pos += 1
+        return kind, value
+
+    def expression(self):
+        left = self.concatenation()
+        kind, value = self.peek()
+        if kind == 'op' and value in self.COMPARISONS:
+            self.take()
+            return ('compare', value, left, self.concatenation())
+        return left
+
+    def concatenation(self):
+        node = self.term()
+        while self.peek() == ('op', '&'):
+            self.take()
+            node = ('concat', node, self.term())
+        return node
+
+    def term(self):
+        kind, value = self.take()
+        if kind in ('string', 'number'):
+            return ('literal', value)
+        if kind == 'field':
+            return ('field', value)
+        if kind == 'op' and value == '(':
+            node = self.expression()
+            self.take(')')
+            return node
+        if kind == 'name':
+            name = value.upper()
+            if name in ('TRUE', 'FALSE') and self.peek() != ('op', '('):
+                return ('literal', name == 'TRUE')
+            if name not in FUNCTIONS:
+                raise FormulaError(f"Unsupported function {value}()")
+            self.take('(')
+            args = []
+            if self.peek() != ('op', ')'):
+                args.append(self.expression())
+                while self.peek() == ('op', ','):
+                    self.take()
+                    args.append(self.expression())
+            self.take(')')
+            return ('call', name, args)
+        raise FormulaError(f"Unexpected {value!r}")
+
+    # Evaluation
+    def matches(self, record):
+        return truthy(self.evaluate(self.tree, record))
+
+    def evaluate(self, node, record):
+        kind = node[0]
+        if kind == 'literal':
+            return node[1]
+        if kind == 'field':
+            return field_value(record['fields'].get(node[1]))
+        if kind == 'concat':
+            return text(self.evaluate(node[1], record)) + text(self.evaluate(node[2], record))
+        if kind == 'compare':
+            return compare(node[1], self.evaluate(node[2], record), self.evaluate(node[3], record))
+        return FUNCTIONS[node[1]](record, *[self.evaluate(arg, record) for arg in node[2]])
+
+
+def field_value(value):
+    """A cell as formulas see it: lookups and multi-selects become comma-joined text."""
+    if value is None:
+        return ''
+    if isinstance(value, list):
+        return ', '.join(text(item) for item in value)
+    return value
+
+
+def text(value):
+    if isinstance(value, bool):
+        return '1' if value else '0'
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    if isinstance(value, datetime):
+        return timestamp(value)
+    return '' if value is None else str(value)
+
+
+def truthy(value):
+    return value not in (None, '', 0, False)
+
+
+def is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def compare(op, left, right):
+    if isinstance(left, datetime) or isinstance(right, datetime):
+        left, right = parse_time(text(left)), parse_time(text(right))
+        if left is None or right is None:
+            return False
+    elif is_number(left) or is_number(right):
+        try:
+            left, right = float(left or 0), float(right or 0)
+        except (TypeError, ValueError):
+            left, right = text(left), text(right)
+    else:
+        left, right = text(left), text(right)
+    return {'=': left == right, '!=': left != right, '<': left < right,
+            '>': left > right, '<=': left <= right, '>=': left >= right}[op]
+
+
+def after(record, a, b):
+    a, b = parse_time(text(a)), parse_time(text(b))
+    return bool(a and b and a > b)
+
+
+def before(record, a, b):
+    a, b = parse_time(text(a)), parse_time(text(b))
+    return bool(a and b and a < b)
+
+
+FUNCTIONS = {
+    'OR': lambda record, *args: any(truthy(arg) for arg in args),
+    'AND': lambda record, *args: all(truthy(arg) for arg in args),
+    'NOT': lambda record, value: not truthy(value),
+    'IF': lambda record, test, yes, no='': yes if truthy(test) else no,
+    'BLANK': lambda record: '',
+    'LOWER': lambda record, value: text(value).lower(),
+    'UPPER': lambda record, value: text(value).upper(),
+    'LEN': lambda record, value: float(len(text(value))),
+    'FIND': lambda record, needle, haystack, start=1.0:
+        float(text(haystack).find(text(needle), max(int(start) - 1, 0)) + 1),
+    'RECORD_ID': lambda record: record['id'],
+    'CREATED_TIME': lambda record: parse_time(record['createdTime']),
+    'LAST_MODIFIED_TIME': lambda record: parse_time(record.get('lastModifiedTime') or record['createdTime']),
+    'DATETIME_PARSE': lambda record, value, *fmt: parse_time(text(value)),
+    'IS_AFTER': after,
+    'IS_BEFORE': before,
+}
+
+
+# ---- Record store ----------------------------------------------------------------
+
+class RecordStore:
+    """In-memory tables loaded from a fixtures directory."""
+
+    def __init__(self, fixtures_dir):
+        self.tables = {}
+        self.lock = threading.Lock()
+        for path in sorted(Path(fixtures_dir).glob('*.json')):
+            with open(path, encoding='utf-8') as f:
+                self.tables[path.stem] = {record['id']: record for record in json.load(f)['records']}
+
+    def list(self, table, formula=None, fields=None, max_records=None):
+        matcher = Formula(formula) if formula else None
+        with self.lock:
+            records = list(self.tables[table].values())
+        records = [record for record in records if not matcher or matcher.matches(record)]
+        if max_records:
+            records = records[:max_records]
+        return [self.public(record, fields) for record in records]
+
+    def public(self, record, fields=None):
+        """The record as the API returns it (no bookkeeping, optional field subset)."""
+        cells = record['fields']
+        if fields:
+            cells = {name: cells[name] for name in fields if name in cells}
+        return {'id': record['id'], 'createdTime': record['createdTime'], 'fields': dict(cells)}
+
+    def update(self, table, record_id, fields, replace=False):
+        with self.lock:
+            record = self.tables[table][record_id]
+            record['fields'] = dict(fields) if replace else {**record['fields'], **fields}
+            record['fields'] = {name: value for name, value in record['fields'].items() if value is not None}
+            record['lastModifiedTime'] = timestamp(datetime.now(timezone.utc))
+            return self.public(record)
+
+    def create(self, table, fields):
+        now = timestamp(datetime.now(timezone.utc))
+        with self.lock:
+            record_id = 'rec' + ''.join(random.choices('ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789', k=14))
+            record = {'id': record_id, 'createdTime': now, 'lastModifiedTime': now, 'fields': dict(fields)}
+            self.tables[table][record_id] = record
+            return self.public(record)
+
+
+# ---- HTTP ----------------------------------------------------------------------
+
+class ApiError(Exception):
+    def __init__(self, status, error_type, message=''):
+        super().__init__(message)
+        self.status = status
+        self.error_type = error_type
+        self.message = message
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Routes /v0/<base>/<table>[/<id>|/listRecords] to the server's RecordStore."""
+
+    server_version = 'AirtableStandIn/1.0'
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def do_GET(self):
+        self.handle_api('GET')
+
+    def do_POST(self):
+        self.handle_api('POST')
+
+    def do_PATCH(self):
+        self.handle_api('PATCH')
+
+    def do_PUT(self):
+        self.handle_api('PUT')
+
+    def handle_api(self, method):
+        self.server.requests[method] += 1
+        try:
+            if not self.headers.get('Authorization', '').startswith('Bearer '):
+                raise ApiError(401, 'AUTHENTICATION_REQUIRED', 'Authentication required')
+            if not self.server.allow_request():
+                raise ApiError(429, 'RATE_LIMIT_REACHED', 'Rate limit exceeded')
+            if self.server.latency:
+                time.sleep(self.server.latency)
+            self.send_json(200, self.route(method))
+        except ApiError as e:
+            self.send_json(e.status, {'error': {'type': e.error_type, 'message': e.message}},
+                           {'Retry-After': '1'} if e.status == 429 else None)
+        except FormulaError as e:
+            self.send_json(422, {'error': {'type': 'INVALID_FILTER_BY_FORMULA', 'message': str(e)}})
+
+    def route(self, method):
+        url = urlparse(self.path)
+        parts = [unquote(part) for part in url.path.strip('/').split('/')]
+        if len(parts) < 3 or parts[0] != 'v0':
+            raise ApiError(404, 'NOT_FOUND')
+        table, rest = parts[2], parts[3:]
+        store = self.server.store
+        if table not in store.tables:
+            raise ApiError(404, 'TABLE_NOT_FOUND', f"Could not find table {table}")
+
+        if not rest and method == 'GET':
+            return self.list_page(table, parse_qsl(url.query))
+        if rest == ['listRecords'] and method == 'POST':
+            body = self.read_body()
+            params = [(key, str(value)) for key, value in body.items() if key != 'fields']
+            params += [('fields[]', name) for name in body.get('fields', [])]
+            return self.list_page(table, params)
+        if not rest and method in ('PATCH', 'PUT'):
+            records = self.batch(self.read_body())
+            for record in records:
+                self.require_record(table, record.get('id'))
+            return {'records': [store.update(table, record['id'], record.get('fields', {}), method == 'PUT')
+                                for record in records]}
+        if not rest and method == 'POST':
+            return {'records': [store.create(table, record.get('fields', {}))
+                                for record in self.batch(self.read_body())]}
+        if len(rest) == 1 and rest[0] != 'listRecords':
+            self.require_record(table, rest[0])
+            if method == 'GET':
+                return store.public(store.tables[table][rest[0]])
+            if method in ('PATCH', 'PUT'):
+                return store.update(table, rest[0], self.read_body().get('fields', {}), method == 'PUT')
+        raise ApiError(404, 'NOT_FOUND')
+
+    def list_page(self, table, params):
+        fields = [value for key, value in params if key in ('fields[]', 'fields')]
+        params = dict((key, value) for key, value in params if key not in ('fields[]', 'fields'))
+        try:
+            page_size = min(int(params.get('pageSize', MAX_PAGE_SIZE)), MAX_PAGE_SIZE)
+            max_records = int(params['maxRecords']) if params.get('maxRecords') else None
+            start = int(params.get('offset', 'itr0')[3:])
+        except ValueError:
+            raise ApiError(422, 'INVALID_REQUEST_UNKNOWN', 'Invalid pageSize, maxRecords or offset')
+
+        records = self.server.store.list(table, params.get('filterByFormula'), fields, max_records)
+        page = {'records': records[start:start + page_size]}
+        if start + page_size < len(records):
+            page['offset'] = f"itr{start + page_size}"
+        return page
+
+    def batch(self, body):
+        records = body.get('records')
+        if not isinstance(records, list) or not 0 < len(records) <= MAX_BATCH:
+            raise ApiError(422, 'INVALID_RECORDS', f"Send between 1 and {MAX_BATCH} records")
+        return records
+
+    def require_record(self, table, record_id):
+        if record_id not in self.server.store.tables[table]:
+            raise ApiError(404, 'NOT_FOUND', f"Record {record_id} not found")
+
+    def read_body(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        try:
+            return json.loads(self.rfile.read(length) or b'{}')
+        except json.JSONDecodeError:
+            raise ApiError(422, 'INVALID_REQUEST_BODY', 'Body is not valid JSON')
+
+    def send_json(self, status, payload, headers=None):
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class StandInServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, store, rate_limit=None, latency=0.0, verbose=False):
+        super().__init__(address, StandInHandler)
+        self.store = store
+        self.rate_limit = rate_limit
+        self.latency = latency
+        self.verbose = verbose
+        self.requests = Counter()
+        self.window = []
+        self.window_lock = threading.Lock()
+
+    def allow_request(self):
+        """Reject requests beyond rate_limit per second, like Airtable's 5/s per base."""
+        if not self.rate_limit:
+            return True
+        with self.window_lock:
+            now = time.monotonic()
+            self.window = [sent for sent in self.window if now - sent < 1.0]
+            if len(self.window) >= self.rate_limit:
+                self.requests['429'] += 1
+                return False
+            self.window.append(now)
+            return True
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+
+def start_server(fixtures_dir=FIXTURES_DIR, port=0, **kwargs):
+    """Serve fixtures_dir on a background thread (port 0 picks a free port)."""
+    server = StandInServer(('127.0.0.1', port), RecordStore(fixtures_dir), **kwargs)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+# ---- Fixtures ----------------------------------------------------------------------
+
+def cached_records(cache_file, section, to_fields):
+    """Rebuild raw records from one of the committed metadata caches."""
+    with open(cache_file, encoding='utf-8') as f:
+        entries = json.load(f)[section]
+    records = {}
+    for entry in entries.values():
+        # A record cached under two keys (e.g. after a --mode single update) is stored once
+        if not entry.get('airtable_id') or entry.get('provisional') or entry['airtable_id'] in records:
+            continue
+        modified = entry.get('last_updated') or '2025-01-01T00:00:00.000Z'
+        fields = {name: value for name, value in to_fields(entry).items() if value not in (None, '')}
+        records[entry['airtable_id']] = {'id': entry['airtable_id'], 'createdTime': modified,
+                                         'lastModifiedTime': modified, 'fields': fields}
+    return list(records.values())
+
+
+def governing_fields(entry):
+    return {
+        'display_name': entry.get('display_name'),
+        'short_title': entry.get('short_title'),
+        'governing_doc_type': [entry['type'].capitalize()] if entry.get('type') not in (None, 'unknown') else None,
+        'year': entry.get('year'),
+        'doc_number': entry.get('doc_number'),
+        'mdURL': entry.get('md_url'),
+        'fileURL': entry.get('file_url'),
+        'status': entry.get('status'),
+        'special_state': entry.get('special_state'),
+        'digitized': [entry['digitized']] if entry.get('digitized') is not None else None,
+        'passed_date': [entry['passed_date']] if entry.get('passed_date') else None,
+        'last_updated': entry.get('last_updated'),
+    }
+
+
+def meeting_fields(entry):
+    return {
+        'display_name': entry.get('display_name'),
+        'short_title': entry.get('short_title'),
+        'meeting_doc_type': [entry['meeting_doc_type'].capitalize()] if entry.get('meeting_doc_type') else None,
+        'meeting_date': [entry['meeting_date']] if entry.get('meeting_date') else None,
+        'year': entry.get('year'),
+        'mdURL': entry.get('md_url'),
+        'fileURL': entry.get('file_url'),
+        'status': entry.get('status'),
+        'last_updated': entry.get('last_updated'),
+    }
+
+
+def synthetic_record(rng, table, index, created):
+    """
+    One deterministic fake record. Fake numbers and file names never collide
+    with real files, and the years predate every local document so the
+    type-and-year matching for interpretations can't pick them up either.
+    """
+    record_id = f"recSyn{index:011d}"
+    year = rng.randint(1900, 1959)
+    if table == 'Meetings_Metadata':
+        date = f"{year}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"
+        kind = rng.choice(['Agenda', 'Minutes', 'Transcript'])
+        folder = {'Agenda': 'agendas', 'Minutes': 'minutes', 'Transcript': 'transcripts'}[kind]
+        fields = {'display_name': f"{date} - {kind}", 'meeting_doc_type': [kind], 'meeting_date': [date],
+                  'year': year, 'mdURL': f"{REPO_URL}/src/{folder}/{date}-{kind}-S{index}.md",
+                  'status': 'Published'}
+    else:
+        kind = rng.choice(['Ordinance', 'Resolution', 'Interpretation'])
+        number = f"S{index}"
+        prefix = {'Ordinance': 'Ord', 'Resolution': 'Res', 'Interpretation': 'RE'}[kind]
+        filename = f"{year}-{prefix}-#{number}-Synthetic.md"
+        fields = {'display_name': f"{kind} #{number} - Synthetic {index}", 'governing_doc_type': [kind],
+                  'year': year, 'doc_number': number, 'status': rng.choice(['Published', 'Draft']),
+                  'mdURL': f"{REPO_URL}/source-documents/{kind}s/{filename}",
+                  'digitized': [rng.random() < 0.8], 'passed_date': [f"{year}-01-01"]}
+    moment = timestamp(created)
+    return {'id': record_id, 'createdTime': moment, 'lastModifiedTime': moment, 'fields': fields}
+
+
+def generate(out_dir, records=0, seed=1):
+    """Write fixtures: the cached real records, padded to `records` per table with synthetic ones."""
+    rng = random.Random(seed)
+    sources = {
+        'Governing_Metadata': ('src/airtable-metadata.json', 'documents', governing_fields),
+        'Meetings_Metadata': ('src/meetings-metadata.json', 'meetings', meeting_fields),
+    }
+    created = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    for table, (cache_file, section, to_fields) in sources.items():
+        table_records = cached_records(cache_file, section, to_fields) if Path(cache_file).exists() else []
+        index = 0
+        while len(table_records) < records:
+            index += 1
+            table_records.append(synthetic_record(rng, table, index, created + timedelta(minutes=index)))
+        write_fixture(out_dir / f"{table}.json", table_records)
+        print(f"  ✓ {table}: {len(table_records)} records → {out_dir / f'{table}.json'}")
+
+
+def record(out_dir, tables):
+    """Capture the live tables as fixtures (uses the real AIRTABLE_* environment)."""
+    from dotenv import load_dotenv
+    from utils.airtable_client import AirtableClient
+    load_dotenv()
+    client = AirtableClient.from_env()
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    for table in tables:
+        table_records = client.table(table).all()
+        write_fixture(out_dir / f"{table}.json", table_records)
+        print(f"  ✓ {table}: {len(table_records)} records → {out_dir / f'{table}.json'}")
+
+
+def write_fixture(path, records):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'records': records}, f, indent=1, ensure_ascii=False)
+        f.write('\n')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Local Airtable stand-in server and fixture tools')
+    commands = parser.add_subparsers(dest='command')
+
+    serve = commands.add_parser('serve', help='Serve fixtures over the Airtable REST API (default)')
+    serve.add_argument('--fixtures', default=str(FIXTURES_DIR), help='Directory of <Table>.json fixtures')
+    serve.add_argument('--port', type=int, default=8787, help='Port to listen on (default: 8787)')
+    serve.add_argument('--rate-limit', type=int, help="Answer 429 beyond this many requests per second (Airtable's is 5)")
+    serve.add_argument('--latency', type=float, default=0.0, help='Seconds to delay every response')
+    serve.add_argument('--verbose', '-v', action='store_true', help='Log every request')
+
+    gen = commands.add_parser('generate', help='Write fixtures from the committed caches plus synthetic records')
+    gen.add_argument('--out', default=str(FIXTURES_DIR), help='Output directory')
+    gen.add_argument('--records', type=int, default=0, help='Pad each table to this many records (e.g. 10000)')
+    gen.add_argument('--seed', type=int, default=1, help='Random seed for synthetic records')
+
+    rec = commands.add_parser('record', help='Capture the live Airtable tables as fixtures')
+    rec.add_argument('--out', default=str(FIXTURES_DIR), help='Output directory')
+    rec.add_argument('--table', action='append', help=f"Table to record (default: {', '.join(TABLES)})")
+
+    args = parser.parse_args()
+
+    if args.command == 'generate':
+        generate(args.out, args.records, args.seed)
+        return 0
+    if args.command == 'record':
+        record(args.out, args.table or TABLES)
+        return 0
+    if args.command is None:
+        args = parser.parse_args(['serve'])
+
+    store = RecordStore(args.fixtures)
+    server = StandInServer(('127.0.0.1', args.port), store, args.rate_limit, args.latency, args.verbose)
+    counts = ', '.join(f"{table} ({len(records)})" for table, records in store.tables.items())
+    print(f"☁️  Airtable stand-in serving {counts or 'no tables'} on {server.url}")
+    print(f"   export AIRTABLE_API_URL={server.url} AIRTABLE_API_KEY=stand-in AIRTABLE_BASE_ID=appStandIn",
+          flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f"\n📊 Requests served: {dict(server.requests) or 'none'}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
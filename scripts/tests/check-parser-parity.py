@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Parser parity check for the shared HTML parser factory (scripts/utils/html_parser.py).
+
+Compares a candidate bs4 backend (default: lxml) against html.parser on our own
+pages: validate-list-formatting, check-styles-health and test-list-formatting
+must report exactly the same findings. These read-only checks default to lxml,
+so any difference is a failure.
+
+Postprocessors are not covered - they always write with html.parser, and
+their output under lxml is not byte-identical (it differs on every page).
+
+Run manually: python3 scripts/tests/check-parser-parity.py
+Run on raw mdBook output: python3 scripts/tests/check-parser-parity.py --dir book-test
+"""
+
+import io
+import os
+import sys
+import argparse
+from contextlib import redirect_stdout
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from utils.html_parser import PARSER_ENV, backend_available
+from utils.script_loader import load_script
+
+# ANSI color codes
+GREEN = '\033[0;32m'
+RED = '\033[0;31m'
+YELLOW = '\033[1;33m'
+NC = '\033[0m'
+
+
+def with_backend(backend, func, *args):
+    """Call func with RIVERGROVE_HTML_PARSER forced to backend, discarding its output."""
+    previous = os.environ.get(PARSER_ENV)
+    os.environ[PARSER_ENV] = backend
+    try:
+        with redirect_stdout(io.StringIO()):
+            return func(*args)
+    finally:
+        if previous is None:
+            del os.environ[PARSER_ENV]
+        else:
+            os.environ[PARSER_ENV] = previous
+
+
+def validator_findings(pages):
+    """Collect every validator finding for the pages under the current backend."""
+    validate_list = load_script('validation/validate-list-formatting.py')
+    styles_health = load_script('validation/check-styles-health.py')
+    list_tests = load_script('tests/test-list-formatting.py')
+
+    findings = []
+    for page in pages:
+        errors, warnings = validate_list.validate_file(str(page))
+        findings.append(('validate-list-formatting', str(page), errors, warnings))
+
+    tester = list_tests.ListFormattingTester()
+    for page in pages:
+        tester.test_file(str(page))
+    findings.append(('test-list-formatting', '', tester.tests_run, tester.tests_passed, tester.failures))
+
+    if Path('book').exists():
+        findings.append(('check-styles-health', 'book', styles_health.check_html_structure()))
+
+    return findings
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare bs4 parser backends on the validators')
+    parser.add_argument('--dir', default='book', help='Directory of HTML pages (default: book)')
+    parser.add_argument('--backend', default='lxml', help='Backend to compare with html.parser (default: lxml)')
+    args = parser.parse_args()
+
+    if not backend_available(args.backend):
+        print(f"{YELLOW}⏭  {args.backend} is not installed - nothing to compare{NC}")
+        return 0
+
+    pages = sorted(Path(args.dir).glob('**/*.html'))
+    if not pages:
+        print(f"{RED}✗ No HTML files found in {args.dir}/ - run a build first{NC}")
+        return 1
+
+    print(f"🔬 Comparing {args.backend} with html.parser on {len(pages)} page(s) in {args.dir}/\n")
+    failed = False
+
+    # Validators must agree exactly
+    baseline = with_backend('html.parser', validator_findings, pages)
+    candidate = with_backend(args.backend, validator_findings, pages)
+    mismatches = [(a, b) for a, b in zip(baseline, candidate) if a != b]
+    if mismatches:
+        failed = True
+        print(f"{RED}✗ Validators: {len(mismatches)} finding(s) differ{NC}")
+        for a, b in mismatches:
+            print(f"    {a[0]} {a[1]}")
+    else:
+        print(f"{GREEN}✓ Validators: identical findings{NC}")
+
+    print()
+    if failed:
+        print(f"{RED}✗ {args.backend} is not a drop-in replacement for the validators{NC}")
+        return 1
+    print(f"{GREEN}✅ Validators report the same findings under {args.backend} and html.parser{NC}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
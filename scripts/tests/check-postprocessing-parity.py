@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Regression check for the single-parse postprocessing runner.
+
+run-postprocessing.py must write exactly what the postprocessors write when
+they run one after another as separate scripts (each parsing the previous
+one's output from disk). This copies a directory of mdBook output twice, runs
+the scripts in TRANSFORMS order on one copy and run-postprocessing.py on the
+other, and fails if any page differs.
+
+Run on raw mdBook output (mdbook build -d book-test):
+    python3 scripts/tests/check-postprocessing-parity.py --dir book-test
+Defaults to book-test/ if it exists, otherwise book/.
+"""
+
+import os
+import sys
+import shutil
+import difflib
+import argparse
+import tempfile
+import subprocess
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from utils.script_loader import SCRIPTS_DIR, load_script
+
+# ANSI color codes
+GREEN = '\033[0;32m'
+RED = '\033[0;31m'
+NC = '\033[0m'
+
+POSTPROCESSING_DIR = SCRIPTS_DIR / 'postprocessing'
+
+
+def run_script(script, args, cwd):
+    """Run a postprocessing script in cwd (its book/ is the copy) with the build cache off."""
+    env = dict(os.environ, RIVERGROVE_BUILD_CACHE='0')
+    result = subprocess.run([sys.executable, str(POSTPROCESSING_DIR / script)] + args,
+                            cwd=cwd, env=env, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"{script} failed:\n{result.stdout}{result.stderr}")
+
+
+def postprocess_sequentially(workdir):
+    """What build-all.sh used to do: one script after another, each rereading the pages."""
+    runner = load_script('postprocessing/run-postprocessing.py')
+    for _, script, target, _, _ in runner.TRANSFORMS:
+        run_script(script, [str(target)] if target else [], workdir)
+
+
+def postprocess_with_runner(workdir):
+    run_script('run-postprocessing.py', [], workdir)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare run-postprocessing.py with the separate postprocessing scripts')
+    parser.add_argument('--dir', help='Directory of mdBook output (default: book-test, else book)')
+    parser.add_argument('--show-diff', action='store_true', help='Print a diff for every page that differs')
+    args = parser.parse_args()
+
+    source = Path(args.dir) if args.dir else next((Path(d) for d in ('book-test', 'book') if Path(d).is_dir()), None)
+    if source is None or not source.is_dir():
+        print(f"{RED}✗ No mdBook output found - run 'mdbook build -d book-test' first{NC}")
+        return 1
+
+    with tempfile.TemporaryDirectory() as tmp:
+        sequential = Path(tmp) / 'sequential'
+        fused = Path(tmp) / 'runner'
+        for workdir in (sequential, fused):
+            shutil.copytree(source, workdir / 'book')
+
+        pages = sorted(path.relative_to(sequential / 'book') for path in (sequential / 'book').glob('**/*.html'))
+        print(f"🔬 Postprocessing {len(pages)} page(s) from {source}/ both ways...")
+        try:
+            postprocess_sequentially(sequential)
+            postprocess_with_runner(fused)
+        except RuntimeError as e:
+            print(f"{RED}✗ {e}{NC}")
+            return 1
+
+        differing = []
+        for page in pages:
+            expected = (sequential / 'book' / page).read_text(encoding='utf-8')
+            actual = (fused / 'book' / page).read_text(encoding='utf-8')
+            if expected != actual:
+                differing.append((page, expected, actual))
+
+    if not differing:
+        print(f"{GREEN}✓ run-postprocessing.py output is byte-identical to the separate scripts{NC}")
+        return 0
+
+    print(f"{RED}✗ {len(differing)} of {len(pages)} page(s) differ from the separate scripts:{NC}")
+    for page, expected, actual in differing:
+        print(f"    {page}")
+        if args.show_diff:
+            diff = difflib.unified_diff(expected.splitlines(), actual.splitlines(),
+                                        'scripts', 'run-postprocessing.py', lineterm='', n=0)
+            for line in list(diff)[:20]:
+                print(f"        {line[:160]}")
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
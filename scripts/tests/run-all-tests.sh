@@ -42,6 +42,48 @@ else
 fi
 echo ""
 
+# Test 3b: Validator parity between HTML parser backends (if build exists)
+echo "📐 Test Suite 3b: HTML Parser Parity"
+echo "------------------------------------"
+if [ -d "book" ]; then
+    if ./scripts/tests/check-parser-parity.py; then
+        echo "✓ Validators agree under both parser backends"
+    else
+        echo "✗ Validators disagree between parser backends - see scripts/utils/html_parser.py"
+        ((TOTAL_FAILURES++))
+    fi
+else
+    echo "⏭ Skipped - build needed first"
+fi
+echo ""
+
+# Test 3c: Airtable sync against the local stand-in server (no credentials needed)
+echo "📐 Test Suite 3c: Airtable Sync (offline)"
+echo "-----------------------------------------"
+if ./scripts/tests/check-airtable-sync.py; then
+    echo ""
+else
+    echo "✗ Airtable sync check failed - see scripts/tests/airtable-stand-in.py"
+    ((TOTAL_FAILURES++))
+    echo ""
+fi
+
+# Test 3d: Single-parse postprocessing runner matches the separate scripts (if a build exists)
+echo "📐 Test Suite 3d: Postprocessing Runner Parity"
+echo "----------------------------------------------"
+if [ -d "book-test" ] || [ -d "book" ]; then
+    if ./scripts/tests/check-postprocessing-parity.py; then
+        echo ""
+    else
+        echo "✗ run-postprocessing.py output differs - see scripts/postprocessing/run-postprocessing.py"
+        ((TOTAL_FAILURES++))
+        echo ""
+    fi
+else
+    echo "⏭ Skipped - build needed first"
+    echo ""
+fi
+
 # Test 4: Form field validation
 echo "📐 Test Suite 4: Form Field Validation"
 echo "--------------------------------------"
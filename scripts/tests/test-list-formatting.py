@@ -16,9 +16,14 @@ Run specific file: python3 scripts/tests/test-list-formatting.py book/ordinances
 import sys
 import re
 from pathlib import Path
-from bs4 import BeautifulSoup
 import json
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from utils.html_parser import parse_html
+from utils.page_index import PageIndex
+
+MARKER_CLASSES = ['list-marker-alpha', 'list-marker-numeric', 'list-marker-roman']
+
 class ListFormattingTester:
     def __init__(self):
         self.tests_run = 0
@@ -36,51 +41,53 @@ class ListFormattingTester:
         with open(file_path, 'r', encoding='utf-8') as f:
             html_content = f.read()
 
-        soup = BeautifulSoup(html_content, 'html.parser')
+        return self.test_page(PageIndex(parse_html(html_content)), file_path)
 
+    def test_page(self, page, file_path):
+        """Run every list formatting test on an indexed page (utils/page_index.py)."""
         # Run all tests
         all_passed = True
-        all_passed &= self.test_no_orphaned_alpha_paragraphs(soup, file_path)
-        all_passed &= self.test_no_concatenated_numeric_items(soup, file_path)
-        all_passed &= self.test_no_list_code_blocks(soup, file_path)
-        all_passed &= self.test_no_orphaned_paragraphs_after_lists(soup, file_path)
-        all_passed &= self.test_proper_list_nesting(soup, file_path)
-        all_passed &= self.test_css_classes(soup, file_path)
+        all_passed &= self.test_no_orphaned_alpha_paragraphs(page, file_path)
+        all_passed &= self.test_no_concatenated_numeric_items(page, file_path)
+        all_passed &= self.test_no_list_code_blocks(page, file_path)
+        all_passed &= self.test_no_orphaned_paragraphs_after_lists(page, file_path)
+        all_passed &= self.test_proper_list_nesting(page, file_path)
+        all_passed &= self.test_css_classes(page, file_path)
 
         # Additional comprehensive tests to catch visual regressions
-        all_passed &= self.test_inline_numeric_references(soup, file_path)
-        all_passed &= self.test_paragraph_references(soup, file_path)
-        all_passed &= self.test_section_2060_nested_list(soup, file_path)
-        all_passed &= self.test_section_2080_single_item(soup, file_path)
-        all_passed &= self.test_section_4120_complete_list(soup, file_path)
-        all_passed &= self.test_no_empty_list_items(soup, file_path)
-        all_passed &= self.test_proper_marker_spacing(soup, file_path)
-        all_passed &= self.test_no_duplicate_list_items(soup, file_path)
-        all_passed &= self.test_no_broken_nested_structure(soup, file_path)
-        all_passed &= self.test_consistent_marker_styles(soup, file_path)
-        all_passed &= self.test_proper_definition_nesting(soup, file_path)
+        all_passed &= self.test_inline_numeric_references(page, file_path)
+        all_passed &= self.test_paragraph_references(page, file_path)
+        all_passed &= self.test_section_2060_nested_list(page, file_path)
+        all_passed &= self.test_section_2080_single_item(page, file_path)
+        all_passed &= self.test_section_4120_complete_list(page, file_path)
+        all_passed &= self.test_no_empty_list_items(page, file_path)
+        all_passed &= self.test_proper_marker_spacing(page, file_path)
+        all_passed &= self.test_no_duplicate_list_items(page, file_path)
+        all_passed &= self.test_no_broken_nested_structure(page, file_path)
+        all_passed &= self.test_consistent_marker_styles(page, file_path)
+        all_passed &= self.test_proper_definition_nesting(page, file_path)
 
         # Special tests for known problem areas
         if '1989-Ord-54' in file_path:
-            all_passed &= self.test_section_1050_formatting(soup, file_path)
-            all_passed &= self.test_section_2060_formatting(soup, file_path)
-            all_passed &= self.test_section_5080_formatting(soup, file_path)
-            all_passed &= self.test_section_5110_formatting(soup, file_path)
-            all_passed &= self.test_section_5120_formatting(soup, file_path)
+            all_passed &= self.test_section_1050_formatting(page, file_path)
+            all_passed &= self.test_section_2060_formatting(page, file_path)
+            all_passed &= self.test_section_5080_formatting(page, file_path)
+            all_passed &= self.test_section_5110_formatting(page, file_path)
+            all_passed &= self.test_section_5120_formatting(page, file_path)
 
         if '1999-Ord-65' in file_path or 'Sewer-Services' in file_path:
-            all_passed &= self.test_ord_65_section_2_formatting(soup, file_path)
+            all_passed &= self.test_ord_65_section_2_formatting(page, file_path)
 
         return all_passed
 
-    def test_no_orphaned_alpha_paragraphs(self, soup, file_path):
+    def test_no_orphaned_alpha_paragraphs(self, page, file_path):
         """Check that alpha-marked items (a), (b), etc. are not paragraphs."""
         self.tests_run += 1
 
         # Find paragraphs that start with alpha markers
         orphaned = []
-        for p in soup.find_all('p'):
-            text = p.get_text().strip()
+        for p in page.find_all('p'):
+            text = page.text(p).strip()
             if re.match(r'^\([a-z]\)\s+', text):
                 orphaned.append(text[:50] + '...' if len(text) > 50 else text)
 
@@ -98,13 +105,13 @@ class ListFormattingTester:
             print(f"  ✅ No orphaned alpha paragraphs")
             return True
 
-    def test_no_concatenated_numeric_items(self, soup, file_path):
+    def test_no_concatenated_numeric_items(self, page, file_path):
         """Check that numeric sub-items are not concatenated in single list elements."""
         self.tests_run += 1
 
         concatenated = []
-        for li in soup.find_all('li'):
-            text = li.get_text()
+        for li in page.find_all('li'):
+            text = page.text(li)
             # Look for patterns like "1. ... 2. ..." or "(1) ... (2) ..."
             if re.findall(r'\b2[\.\)]\s+(?:"|[A-Z])', text):
                 # Check if it's actually multiple items in one
@@ -125,15 +132,15 @@ class ListFormattingTester:
             print(f"  ✅ No concatenated numeric items")
             return True
 
-    def test_no_list_code_blocks(self, soup, file_path):
+    def test_no_list_code_blocks(self, page, file_path):
         """Check that lists are not appearing as code blocks."""
         self.tests_run += 1
 
         code_block_lists = []
-        for pre in soup.find_all('pre'):
-            code = pre.find('code')
+        for pre in page.find_all('pre'):
+            code = page.find(pre, 'code')
             if code:
-                text = code.get_text()
+                text = page.text(code)
                 # Check if this looks like list items
                 if re.match(r'^\s*(\()?([1-9a-z]|[ivx]+)[\)\.]\s', text, re.IGNORECASE):
                     code_block_lists.append(text[:100] + '...' if len(text) > 100 else text)
@@ -152,19 +159,19 @@ class ListFormattingTester:
             print(f"  ✅ No lists appearing as code blocks")
             return True
 
-    def test_no_orphaned_paragraphs_after_lists(self, soup, file_path):
+    def test_no_orphaned_paragraphs_after_lists(self, page, file_path):
         """Check that paragraphs after list items are properly nested."""
         self.tests_run += 1
 
         orphaned = []
-        for ul in soup.find_all('ul', class_='alpha-list'):
+        for ul in page.find_all('ul', 'alpha-list'):
             # Check if there's a paragraph right after this list
             next_elem = ul.find_next_sibling()
             if next_elem and next_elem.name == 'p':
                 # This paragraph should likely be inside the last list item
                 last_li = ul.find_all('li', recursive=False)[-1] if ul.find_all('li', recursive=False) else None
                 if last_li:
-                    marker = last_li.find('span', class_='list-marker-alpha')
+                    marker = page.find(last_li, 'span', 'list-marker-alpha')
                     if marker:
                         orphaned.append(f"Orphaned paragraph after {marker.get_text()} - should be nested inside the list item")
 
@@ -182,14 +189,14 @@ class ListFormattingTester:
             print(f"  ✅ No orphaned paragraphs after lists")
             return True
 
-    def test_proper_list_nesting(self, soup, file_path):
+    def test_proper_list_nesting(self, page, file_path):
         """Check that lists are properly nested."""
         self.tests_run += 1
 
         nesting_issues = []
 
         # Check for orphaned ordered lists that should be nested
-        for ol in soup.find_all('ol'):
+        for ol in page.find_all('ol'):
             # Check if this ol is at the root level (not nested)
             parent = ol.parent
             if parent.name in ['body', 'article', 'section', 'div', 'main']:
@@ -204,15 +211,15 @@ class ListFormattingTester:
                         nesting_issues.append(f"Orphaned <ol> found after alpha paragraph - both should be properly formatted")
 
         # Check for alpha lists with numeric sub-lists
-        for ul in soup.find_all('ul', class_='alpha-list'):
+        for ul in page.find_all('ul', 'alpha-list'):
             for li in ul.find_all('li', recursive=False):
                 # Check if this item should have nested content
-                text = li.get_text()
+                text = page.text(li)
                 if 'means' in text and ':' in text:
                     # Should have a nested list
-                    nested = li.find('ul')
+                    nested = page.find(li, 'ul')
                     if not nested:
-                        marker = li.find('span', class_='list-marker-alpha')
+                        marker = page.find(li, 'span', 'list-marker-alpha')
                         if marker:
                             nesting_issues.append(f"Item {marker.get_text()} missing nested list")
 
@@ -230,17 +237,17 @@ class ListFormattingTester:
             print(f"  ✅ Proper list nesting")
             return True
 
-    def test_css_classes(self, soup, file_path):
+    def test_css_classes(self, page, file_path):
         """Check that lists have proper CSS classes."""
         self.tests_run += 1
 
         missing_classes = []
-        for ul in soup.find_all('ul'):
+        for ul in page.find_all('ul'):
             if not ul.get('class'):
                 # Check what type of list this should be
-                first_li = ul.find('li')
+                first_li = page.find(ul, 'li')
                 if first_li:
-                    marker = first_li.find('span')
+                    marker = page.find(first_li, 'span')
                     if marker and marker.get_text():
                         missing_classes.append(f"List starting with {marker.get_text()} missing CSS class")
 
@@ -258,7 +265,7 @@ class ListFormattingTester:
             print(f"  ✅ All lists have proper CSS classes")
             return True
 
-    def test_section_1050_formatting(self, soup, file_path):
+    def test_section_1050_formatting(self, page, file_path):
         """Specific test for Section 1.050 definitions."""
         self.tests_run += 1
 
@@ -266,8 +273,8 @@ class ListFormattingTester:
 
         # Find Section 1.050
         section = None
-        for h3 in soup.find_all('h3'):
-            if 'Section 1.050' in h3.get_text():
+        for h3 in page.find_all('h3'):
+            if 'Section 1.050' in page.text(h3):
                 section = h3
                 break
 
@@ -284,7 +291,7 @@ class ListFormattingTester:
         while current and current.name != 'h3':
             if current.name == 'ul' and 'alpha-list' in current.get('class', []):
                 for li in current.find_all('li', recursive=False):
-                    marker = li.find('span', class_='list-marker-alpha')
+                    marker = page.find(li, 'span', 'list-marker-alpha')
                     if marker and marker.get_text() in expected_items:
                         found_items.append(marker.get_text())
             current = current.find_next_sibling()
@@ -294,11 +301,11 @@ class ListFormattingTester:
             issues.append(f"Missing list items: {', '.join(sorted(missing))}")
 
         # Check that (i) "Lot" has proper nested items
-        for ul in soup.find_all('ul', class_='alpha-list'):
+        for ul in page.find_all('ul', 'alpha-list'):
             for li in ul.find_all('li', recursive=False):
-                marker = li.find('span', class_='list-marker-alpha')
-                if marker and marker.get_text() == '(i)' and '"Lot"' in li.get_text():
-                    nested = li.find('ul', class_='numeric-list')
+                marker = page.find(li, 'span', 'list-marker-alpha')
+                if marker and marker.get_text() == '(i)' and '"Lot"' in page.text(li):
+                    nested = page.find(li, 'ul', 'numeric-list')
                     if not nested:
                         issues.append("Item (i) 'Lot' missing nested numeric list")
                     else:
@@ -320,14 +327,14 @@ class ListFormattingTester:
             print(f"  ✅ Section 1.050 properly formatted")
             return True
 
-    def test_section_2060_formatting(self, soup, file_path):
+    def test_section_2060_formatting(self, page, file_path):
         """Specific test for Section 2.060 to ensure no code blocks."""
         self.tests_run += 1
 
         # Find Section 2.060
         section = None
-        for h3 in soup.find_all('h3'):
-            if 'Section 2.060' in h3.get_text():
+        for h3 in page.find_all('h3'):
+            if 'Section 2.060' in page.text(h3):
                 section = h3
                 break
 
@@ -342,13 +349,13 @@ class ListFormattingTester:
             if not current:
                 break
             if current.name == 'pre':
-                code = current.find('code')
-                if code and 'floor area' in code.get_text():
+                code = page.find(current, 'code')
+                if code and 'floor area' in page.text(code):
                     self.failures.append({
                         'file': file_path,
                         'test': 'section_2060_formatting',
                         'issue': 'Section 2.060(b) items appearing as code block',
-                        'examples': [code.get_text()[:100]]
+                        'examples': [page.text(code)[:100]]
                     })
                     print(f"  ❌ Section 2.060(b) has code block issue")
                     return False
@@ -357,14 +364,14 @@ class ListFormattingTester:
         print(f"  ✅ Section 2.060 properly formatted")
         return True
 
-    def test_section_5080_formatting(self, soup, file_path):
+    def test_section_5080_formatting(self, page, file_path):
         """Specific test for Section 5.080 setback formatting with special div structure."""
         self.tests_run += 1
 
         # Find Section 5.080
         section = None
-        for h3 in soup.find_all('h3'):
-            if 'Section 5.080' in h3.get_text() and 'Building Setbacks' in h3.get_text():
+        for h3 in page.find_all('h3'):
+            if 'Section 5.080' in page.text(h3) and 'Building Setbacks' in page.text(h3):
                 section = h3
                 break
 
@@ -382,23 +389,23 @@ class ListFormattingTester:
             if current.name == 'ul' and 'alpha-list' in current.get('class', []):
                 # Check items (a) and (c) for setback specifications
                 for li in current.find_all('li', recursive=False):
-                    marker = li.find('span', class_='list-marker-alpha')
+                    marker = page.find(li, 'span', 'list-marker-alpha')
                     if marker and marker.get_text() in ['(a)', '(c)']:
                         # These should have setback-specifications divs
-                        setback_div = li.find('div', class_='setback-specifications')
+                        setback_div = page.find(li, 'div', 'setback-specifications')
                         if not setback_div:
                             issues.append(f"Item {marker.get_text()} missing setback-specifications div")
                         else:
                             found_setback_divs += 1
                             # Check that we have separate p elements for each setback
-                            setback_ps = setback_div.find_all('p', class_='setback-spec')
+                            setback_ps = page.find_all('p', 'setback-spec', within=setback_div)
                             if marker.get_text() == '(a)':
                                 if len(setback_ps) != 4:
                                     issues.append(f"Item (a) has {len(setback_ps)} setback specs, expected 4")
                                 else:
                                     # Check that each spec is on its own line
                                     for p in setback_ps:
-                                        text = p.get_text()
+                                        text = page.text(p)
                                         # Each spec should be just one line (Front/Side/Rear Setback - X feet)
                                         if text.count('Setback') > 1:
                                             issues.append(f"Setback specs not properly separated: {text[:50]}...")
@@ -426,14 +433,14 @@ class ListFormattingTester:
             print(f"  ✅ Section 5.080 properly formatted with special setback divs")
             return True
 
-    def test_section_5110_formatting(self, soup, file_path):
+    def test_section_5110_formatting(self, page, file_path):
         """Test that Section 5.110 items (a) through (e) are combined into a single alpha list."""
         self.tests_run += 1
 
         # Find Section 5.110
         section = None
-        for h3 in soup.find_all('h3'):
-            if 'Section 5.110' in h3.get_text() and 'Houses Moved' in h3.get_text():
+        for h3 in page.find_all('h3'):
+            if 'Section 5.110' in page.text(h3) and 'Houses Moved' in page.text(h3):
                 section = h3
                 break
 
@@ -454,7 +461,7 @@ class ListFormattingTester:
                 items = current.find_all('li', recursive=False)
                 markers = []
                 for li in items:
-                    marker = li.find('span', class_='list-marker-alpha')
+                    marker = page.find(li, 'span', 'list-marker-alpha')
                     if marker:
                         markers.append(marker.get_text())
 
@@ -468,7 +475,7 @@ class ListFormattingTester:
                 break
             elif current.name == 'p':
                 # Check for orphaned items that should be in the list
-                text = current.get_text().strip()
+                text = page.text(current).strip()
                 if text.startswith('(a)') or text.startswith('(b)') or text.startswith('(e)'):
                     orphaned_items.append(text[:50] + '...' if len(text) > 50 else text)
             current = current.find_next_sibling()
@@ -493,14 +500,14 @@ class ListFormattingTester:
             print(f"  ✅ Section 5.110 properly formatted with all 5 items in single list")
             return True
 
-    def test_section_5120_formatting(self, soup, file_path):
+    def test_section_5120_formatting(self, page, file_path):
         """Specific test for Section 5.120 Home Occupations formatting."""
         self.tests_run += 1
 
         # Find Section 5.120
         section = None
-        for h3 in soup.find_all('h3'):
-            if 'Section 5.120' in h3.get_text():
+        for h3 in page.find_all('h3'):
+            if 'Section 5.120' in page.text(h3):
                 section = h3
                 break
 
@@ -524,14 +531,14 @@ class ListFormattingTester:
             elif current.name == 'ul' and 'alpha-list' in current.get('class', []):
                 # Check if alpha items have proper nested lists
                 for li in current.find_all('li', recursive=False):
-                    marker = li.find('span', class_='list-marker-alpha')
+                    marker = page.find(li, 'span', 'list-marker-alpha')
                     if marker:
                         marker_text = marker.get_text()
                         # Check if this item should have nested content
-                        li_text = li.get_text()
+                        li_text = page.text(li)
                         if marker_text in ['(a)', '(b)'] and 'DEFINITION' in li_text or 'PURPOSE' in li_text:
                             # These should have nested numeric lists
-                            nested = li.find('ol') or li.find('ul', class_='numeric-list')
+                            nested = page.find(li, 'ol') or page.find(li, 'ul', 'numeric-list')
                             if not nested:
                                 # Check if there's an orphaned ol after this ul
                                 next_elem = current.find_next_sibling()
@@ -553,15 +560,15 @@ class ListFormattingTester:
             print(f"  ✅ Section 5.120 properly formatted")
             return True
 
-    def test_no_empty_list_items(self, soup, file_path):
+    def test_no_empty_list_items(self, page, file_path):
         """Check for empty or nearly empty list items."""
         self.tests_run += 1
 
         empty_items = []
-        for li in soup.find_all('li'):
-            text = li.get_text().strip()
+        for li in page.find_all('li'):
+            text = page.text(li).strip()
             # Remove marker text to check actual content
-            marker = li.find('span', class_=['list-marker-alpha', 'list-marker-numeric', 'list-marker-roman'])
+            marker = page.find(li, 'span', MARKER_CLASSES)
             if marker:
                 marker_text = marker.get_text()
                 content = text.replace(marker_text, '').strip()
@@ -582,13 +589,13 @@ class ListFormattingTester:
             print(f"  ✅ No empty list items")
             return True
 
-    def test_proper_marker_spacing(self, soup, file_path):
+    def test_proper_marker_spacing(self, page, file_path):
         """Check that list markers have proper spacing."""
         self.tests_run += 1
 
         spacing_issues = []
-        for li in soup.find_all('li'):
-            marker = li.find('span', class_=['list-marker-alpha', 'list-marker-numeric', 'list-marker-roman'])
+        for li in page.find_all('li'):
+            marker = page.find(li, 'span', MARKER_CLASSES)
             if marker:
                 # Check if there's proper spacing after marker
                 next_sibling = marker.next_sibling
@@ -613,21 +620,21 @@ class ListFormattingTester:
             print(f"  ✅ Proper marker spacing")
             return True
 
-    def test_no_duplicate_list_items(self, soup, file_path):
+    def test_no_duplicate_list_items(self, page, file_path):
         """Check for duplicate list items that might indicate processing errors."""
         self.tests_run += 1
 
         duplicates = []
         seen_items = {}
 
-        for ul in soup.find_all('ul'):
+        for ul in page.find_all('ul'):
             ul_class = ul.get('class', [])
             if any(cls in ul_class for cls in ['alpha-list', 'numeric-list', 'roman-list']):
                 for li in ul.find_all('li', recursive=False):
-                    marker = li.find('span', class_=['list-marker-alpha', 'list-marker-numeric', 'list-marker-roman'])
+                    marker = page.find(li, 'span', MARKER_CLASSES)
                     if marker:
                         marker_text = marker.get_text()
-                        text_content = li.get_text()[:100]  # First 100 chars for comparison
+                        text_content = page.text(li)[:100]  # First 100 chars for comparison
 
                         key = (str(ul_class), marker_text, text_content)
                         if key in seen_items:
@@ -649,15 +656,15 @@ class ListFormattingTester:
             print(f"  ✅ No duplicate list items")
             return True
 
-    def test_no_broken_nested_structure(self, soup, file_path):
+    def test_no_broken_nested_structure(self, page, file_path):
         """Check for broken nested list structures."""
         self.tests_run += 1
 
         broken_structures = []
 
-        for ul in soup.find_all('ul', class_='alpha-list'):
+        for ul in page.find_all('ul', 'alpha-list'):
             for li in ul.find_all('li', recursive=False):
-                marker = li.find('span', class_='list-marker-alpha')
+                marker = page.find(li, 'span', 'list-marker-alpha')
                 if marker:
                     marker_text = marker.get_text()
 
@@ -671,7 +678,7 @@ class ListFormattingTester:
                         else:
                             # Check if nested items have proper markers
                             for nested_li in nested_items:
-                                nested_marker = nested_li.find('span')
+                                nested_marker = page.find(nested_li, 'span')
                                 if not nested_marker:
                                     broken_structures.append(f"Item {marker_text} has nested item without marker")
 
@@ -689,17 +696,17 @@ class ListFormattingTester:
             print(f"  ✅ No broken nested structures")
             return True
 
-    def test_consistent_marker_styles(self, soup, file_path):
+    def test_consistent_marker_styles(self, page, file_path):
         """Check that marker styles are consistent within list types."""
         self.tests_run += 1
 
         inconsistencies = []
 
         # Check alpha lists
-        for ul in soup.find_all('ul', class_='alpha-list'):
+        for ul in page.find_all('ul', 'alpha-list'):
             markers = []
             for li in ul.find_all('li', recursive=False):
-                marker = li.find('span', class_='list-marker-alpha')
+                marker = page.find(li, 'span', 'list-marker-alpha')
                 if marker:
                     markers.append(marker.get_text())
 
@@ -709,10 +716,10 @@ class ListFormattingTester:
                     inconsistencies.append(f"Alpha marker '{marker}' not in (x) format")
 
         # Check numeric lists
-        for ul in soup.find_all('ul', class_='numeric-list'):
+        for ul in page.find_all('ul', 'numeric-list'):
             markers = []
             for li in ul.find_all('li', recursive=False):
-                marker = li.find('span', class_='list-marker-numeric')
+                marker = page.find(li, 'span', 'list-marker-numeric')
                 if marker:
                     markers.append(marker.get_text())
 
@@ -735,19 +742,19 @@ class ListFormattingTester:
             print(f"  ✅ Consistent marker styles")
             return True
 
-    def test_proper_definition_nesting(self, soup, file_path):
+    def test_proper_definition_nesting(self, page, file_path):
         """Check that definition items have proper nested sub-definitions."""
         self.tests_run += 1
 
         definition_issues = []
 
         # Look for definition patterns that should have nested items
-        for ul in soup.find_all('ul', class_='alpha-list'):
+        for ul in page.find_all('ul', 'alpha-list'):
             for li in ul.find_all('li', recursive=False):
-                marker = li.find('span', class_='list-marker-alpha')
+                marker = page.find(li, 'span', 'list-marker-alpha')
                 if marker:
                     marker_text = marker.get_text()
-                    li_text = li.get_text()
+                    li_text = page.text(li)
 
                     # Known patterns that should have nested definitions
                     should_have_nested = False
@@ -762,7 +769,7 @@ class ListFormattingTester:
                         expected_nested = ['Alley', 'Arterial', 'Collector', 'Cul-de-sac']
 
                     if should_have_nested:
-                        nested_list = li.find('ul', class_='numeric-list')
+                        nested_list = page.find(li, 'ul', 'numeric-list')
                         if not nested_list:
                             definition_issues.append(f"Item {marker_text} should have nested definitions but has none")
                         else:
@@ -770,7 +777,7 @@ class ListFormattingTester:
                             nested_items = nested_list.find_all('li', recursive=False)
                             found_definitions = []
                             for nested_li in nested_items:
-                                nested_text = nested_li.get_text()
+                                nested_text = nested_page.text(li)
                                 for expected in expected_nested:
                                     if expected in nested_text:
                                         found_definitions.append(expected)
@@ -831,19 +838,19 @@ class ListFormattingTester:
 
         return len(self.failures) == 0
 
-    def test_inline_numeric_references(self, soup, file_path):
+    def test_inline_numeric_references(self, page, file_path):
         """Test that inline numeric references like (10) days are not converted to lists."""
         self.tests_run += 1
 
         issues = []
 
         # Check for improperly converted inline references
-        for ul in soup.find_all('ul'):
+        for ul in page.find_all('ul'):
             for li in ul.find_all('li', recursive=False):
-                marker = li.find('span', class_='list-marker-numeric')
+                marker = page.find(li, 'span', 'list-marker-numeric')
                 if marker:
                     marker_text = marker.get_text()
-                    li_text = li.get_text()
+                    li_text = page.text(li)
                     # Check for common inline reference patterns
                     if marker_text == '(10)' and 'days' in li_text[:20]:
                         issues.append(f"Inline reference '{marker_text} days' incorrectly converted to list item")
@@ -864,19 +871,19 @@ class ListFormattingTester:
             print(f"  ✅ Inline numeric references preserved correctly")
             return True
 
-    def test_paragraph_references(self, soup, file_path):
+    def test_paragraph_references(self, page, file_path):
         """Test that paragraph references like '(a) which' are not converted to lists."""
         self.tests_run += 1
 
         issues = []
 
         # Check for improperly converted paragraph references
-        for ul in soup.find_all('ul'):
+        for ul in page.find_all('ul'):
             for li in ul.find_all('li', recursive=False):
-                li_text = li.get_text().strip()
+                li_text = page.text(li).strip()
                 # Check for patterns that indicate a paragraph reference
                 if li_text.startswith('which') or li_text.startswith('that') or li_text.startswith('as '):
-                    marker = li.find('span', class_='list-marker-alpha')
+                    marker = page.find(li, 'span', 'list-marker-alpha')
                     if marker:
                         issues.append(f"Paragraph reference '{marker.get_text()} {li_text[:30]}...' incorrectly as list")
 
@@ -894,14 +901,14 @@ class ListFormattingTester:
             print(f"  ✅ Paragraph references preserved correctly")
             return True
 
-    def test_section_2060_nested_list(self, soup, file_path):
+    def test_section_2060_nested_list(self, page, file_path):
         """Test that Section 2.060(b) has properly nested numeric list."""
         self.tests_run += 1
 
         # Find Section 2.060
         section = None
-        for h3 in soup.find_all('h3'):
-            if 'Section 2.060' in h3.get_text() and 'Nonconforming' in h3.get_text():
+        for h3 in page.find_all('h3'):
+            if 'Section 2.060' in page.text(h3) and 'Nonconforming' in page.text(h3):
                 section = h3
                 break
 
@@ -919,10 +926,10 @@ class ListFormattingTester:
             if current.name == 'ul' and 'alpha-list' in current.get('class', []):
                 # Find item (b)
                 for li in current.find_all('li', recursive=False):
-                    marker = li.find('span', class_='list-marker-alpha')
+                    marker = page.find(li, 'span', 'list-marker-alpha')
                     if marker and marker.get_text() == '(b)':
                         # Check for nested numeric list
-                        nested = li.find('ul', class_='numeric-list')
+                        nested = page.find(li, 'ul', 'numeric-list')
                         if nested:
                             found_nested = True
                             nested_items = nested.find_all('li', recursive=False)
@@ -933,8 +940,8 @@ class ListFormattingTester:
                         break
             # Also check for orphaned code blocks
             elif current.name == 'pre':
-                code = current.find('code')
-                if code and '(1)' in code.get_text() and '(2)' in code.get_text():
+                code = page.find(current, 'code')
+                if code and '(1)' in page.text(code) and '(2)' in page.text(code):
                     issues.append("Section 2.060 nested list appearing as code block")
             current = current.find_next_sibling()
 
@@ -952,14 +959,14 @@ class ListFormattingTester:
             print(f"  ✅ Section 2.060 nested list formatted correctly")
             return True
 
-    def test_section_2080_single_item(self, soup, file_path):
+    def test_section_2080_single_item(self, page, file_path):
         """Test that Section 2.080 single-item list is preserved."""
         self.tests_run += 1
 
         # Find Section 2.080
         section = None
-        for h3 in soup.find_all('h3'):
-            if 'Section 2.080' in h3.get_text() and 'Termination' in h3.get_text():
+        for h3 in page.find_all('h3'):
+            if 'Section 2.080' in page.text(h3) and 'Termination' in page.text(h3):
                 section = h3
                 break
 
@@ -984,7 +991,7 @@ class ListFormattingTester:
                     if not marker or marker.get_text() != '(a)':
                         issues.append("Section 2.080 single item not marked as (a)")
                 break
-            elif current.name == 'p' and current.get_text().strip().startswith('(a)'):
+            elif current.name == 'p' and page.text(current).strip().startswith('(a)'):
                 issues.append("Section 2.080 item (a) not converted to list")
             current = current.find_next_sibling()
 
@@ -1005,14 +1012,14 @@ class ListFormattingTester:
             print(f"  ✅ Section 2.080 single-item list correct")
             return True
 
-    def test_section_4120_complete_list(self, soup, file_path):
+    def test_section_4120_complete_list(self, page, file_path):
         """Test that Section 4.120 has all four items (a), (b), (c), (d) in the list."""
         self.tests_run += 1
 
         # Find Section 4.120
         section = None
-        for h3 in soup.find_all('h3'):
-            if 'Section 4.120' in h3.get_text() and 'Type IV' in h3.get_text():
+        for h3 in page.find_all('h3'):
+            if 'Section 4.120' in page.text(h3) and 'Type IV' in page.text(h3):
                 section = h3
                 break
 
@@ -1031,13 +1038,13 @@ class ListFormattingTester:
             if current.name == 'ul' and 'alpha-list' in current.get('class', []):
                 found_list = True
                 for li in current.find_all('li', recursive=False):
-                    marker = li.find('span', class_='list-marker-alpha')
+                    marker = page.find(li, 'span', 'list-marker-alpha')
                     if marker:
                         found_items.append(marker.get_text())
                 break
             # Check for orphaned (d) item
             elif current.name == 'p':
-                text = current.get_text().strip()
+                text = page.text(current).strip()
                 if text.startswith('(d)') and 'To the extent that a policy' in text:
                     issues.append("Section 4.120 item (d) not included in list")
             current = current.find_next_sibling()
@@ -1063,7 +1070,7 @@ class ListFormattingTester:
             print(f"  ✅ Section 4.120 list complete with all 4 items")
             return True
 
-    def test_ord_65_section_2_formatting(self, soup, file_path):
+    def test_ord_65_section_2_formatting(self, page, file_path):
         """
         Specific test for Ordinance 65-99 Section 2 to ensure "C. The parties agree:"
         is properly extracted from nested list structure.
@@ -1078,8 +1085,8 @@ class ListFormattingTester:
 
         # Find Section 2 heading
         section = None
-        for h3 in soup.find_all('h3'):
-            if 'Section 2' in h3.get_text() and 'Operating Procedures' in h3.get_text():
+        for h3 in page.find_all('h3'):
+            if 'Section 2' in page.text(h3) and 'Operating Procedures' in page.text(h3):
                 section = h3
                 break
 
@@ -1090,8 +1097,8 @@ class ListFormattingTester:
 
         # Find the paragraph containing "C. The parties agree:"
         c_paragraph = None
-        for p in soup.find_all('p'):
-            strong = p.find('strong')
+        for p in page.find_all('p'):
+            strong = page.find(p, 'strong')
             if strong and 'C. The parties agree:' in strong.get_text():
                 c_paragraph = p
                 break
@@ -1112,8 +1119,8 @@ class ListFormattingTester:
             # Check that C is at the same level as "B. Lake Oswego agrees to:"
             # Find B header
             b_paragraph = None
-            for p in soup.find_all('p'):
-                strong = p.find('strong')
+            for p in page.find_all('p'):
+                strong = page.find(p, 'strong')
                 if strong and 'B. Lake Oswego agrees to:' in strong.get_text():
                     b_paragraph = p
                     break
@@ -1144,36 +1151,36 @@ class ListFormattingTester:
             print(f"  ✅ Ord 65-99 Section 2 'C. The parties agree:' correctly positioned")
             return True
 
+def default_files():
+    """The pages tested when none are given: known problem files, then a sample of the others."""
+    # Test all known problem files
+    test_files = [
+        'book/ordinances/1989-Ord-54-89C-Land-Development.html',
+        'book/ordinances/1998-Ord-59-97A-Land-Development-Amendment.html',
+        'book/ordinances/2003-Ord-73-2003A-Conditional-Use-Provisions.html',
+    ]
+    files = [file_path for file_path in test_files if Path(file_path).exists()]
+
+    # Also test a sample of other files
+    book_dir = Path('book')
+    if book_dir.exists():
+        for subdir in ['ordinances', 'resolutions', 'interpretations']:
+            subpath = book_dir / subdir
+            if subpath.exists():
+                # Test first 2 files in each directory
+                for file in list(subpath.glob('*.html'))[:2]:
+                    files.append(str(file))
+
+    return files
+
 def main():
     """Run list formatting tests."""
     tester = ListFormattingTester()
 
-    if len(sys.argv) > 1:
-        # Test specific files
-        files = sys.argv[1:]
-        for file_path in files:
-            tester.test_file(file_path)
-    else:
-        # Test all known problem files
-        test_files = [
-            'book/ordinances/1989-Ord-54-89C-Land-Development.html',
-            'book/ordinances/1998-Ord-59-97A-Land-Development-Amendment.html',
-            'book/ordinances/2003-Ord-73-2003A-Conditional-Use-Provisions.html',
-        ]
-
-        for file_path in test_files:
-            if Path(file_path).exists():
-                tester.test_file(file_path)
-
-        # Also test a sample of other files
-        book_dir = Path('book')
-        if book_dir.exists():
-            for subdir in ['ordinances', 'resolutions', 'interpretations']:
-                subpath = book_dir / subdir
-                if subpath.exists():
-                    # Test first 2 files in each directory
-                    for file in list(subpath.glob('*.html'))[:2]:
-                        tester.test_file(str(file))
+    # Test specific files, or the default set
+    files = sys.argv[1:] or default_files()
+    for file_path in files:
+        tester.test_file(file_path)
 
     success = tester.print_summary()
     sys.exit(0 if success else 1)
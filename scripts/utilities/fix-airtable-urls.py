@@ -2,21 +2,28 @@
 """
 Fix Airtable URLs after repository reorganization.
 Updates mdURL and fileURL fields to reflect the new source-documents/ structure.
+
+Updates are sent 10 records per request, several requests at a time within
+Airtable's rate limit. Progress is journaled to logs/fix-airtable-urls.journal.jsonl,
+so if some updates fail, re-running the script resends only those.
 """
 
 import os
 import sys
 from pathlib import Path
 from dotenv import load_dotenv
-from pyairtable import Api
 
 # Load environment variables
 load_dotenv()
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from utils.airtable_client import AirtableClient, AirtableError, UpdateJournal
+
 # Initialize Airtable API
-api = Api(os.environ['AIRTABLE_API_KEY'])
-base = api.base(os.environ['AIRTABLE_BASE_ID'])
-table = base.table(os.environ.get('AIRTABLE_TABLE_NAME', 'Governing_Metadata'))
+client = AirtableClient.from_env()
+table = client.table(os.environ.get('AIRTABLE_TABLE_NAME', 'Governing_Metadata'))
+
+JOURNAL_FILE = Path('logs/fix-airtable-urls.journal.jsonl')
 
 def fix_url(url):
     """Fix a single URL by adding source-documents/ to the path."""
@@ -51,32 +58,18 @@ def fix_url(url):
     
     return fixed_url
 
-def main(dry_run=False):
-    """Main function to update all Airtable records."""
-    if dry_run:
-        print("🔍 DRY RUN MODE - No changes will be made")
-    print("🔧 Fixing Airtable URLs after repository reorganization")
-    print("=" * 60)
-    
-    # Fetch all records
-    print("\n📊 Fetching records from Airtable...")
-    try:
-        records = table.all()
-        print(f"✅ Found {len(records)} records")
-    except Exception as e:
-        print(f"❌ Error fetching records: {e}")
-        sys.exit(1)
-    
-    # Track statistics
-    updated_count = 0
+def plan_updates(records):
+    """Work out the URL updates for every record, printing each change."""
+    updates = []
+    names = {}
     already_correct = 0
-    errors = []
     
     print("\n🔄 Processing records...")
     for record in records:
         record_id = record['id']
         fields = record.get('fields', {})
         display_name = fields.get('display_name', 'Unknown')
+        names[record_id] = display_name
         
         # Get current URLs
         md_url = fields.get('mdURL', '')
@@ -93,32 +86,83 @@ def main(dry_run=False):
             continue
         
         # Prepare update
-        updates = {}
+        changes = {}
         if new_md_url != md_url:
-            updates['mdURL'] = new_md_url
+            changes['mdURL'] = new_md_url
             print(f"  📝 {display_name}")
             print(f"     Old MD: {md_url}")
             print(f"     New MD: {new_md_url}")
         
         if new_file_url != file_url:
-            updates['fileURL'] = new_file_url
+            changes['fileURL'] = new_file_url
             if new_md_url == md_url:  # Only print if we didn't already
                 print(f"  📝 {display_name}")
             print(f"     Old PDF: {file_url}")
             print(f"     New PDF: {new_file_url}")
         
-        # Update record in Airtable (skip if dry run)
-        if dry_run:
-            updated_count += 1
-            print(f"     🔍 Would update (dry run)")
+        updates.append({'id': record_id, 'fields': changes})
+    
+    return updates, names, already_correct
+
+def apply_updates(updates, names, journal):
+    """Send the updates in batches, journaling each batch that succeeds. Returns the errors."""
+    errors = []
+    applied = 0
+    for batch, error in table.batch_update(updates):
+        ids = [update['id'] for update in batch]
+        if error:
+            errors.extend((names.get(record_id, record_id), str(error)) for record_id in ids)
+            print(f"  ❌ Error updating {len(batch)} record(s): {error}")
         else:
-            try:
-                table.update(record_id, updates)
-                updated_count += 1
-                print(f"     ✅ Updated successfully")
-            except Exception as e:
-                errors.append((display_name, str(e)))
-                print(f"     ❌ Error updating: {e}")
+            journal.record_done(ids)
+            applied += len(batch)
+            print(f"  ✅ Updated {applied}/{len(updates)} records")
+    return errors
+
+def main(dry_run=False):
+    """Main function to update all Airtable records."""
+    if dry_run:
+        print("🔍 DRY RUN MODE - No changes will be made")
+    print("🔧 Fixing Airtable URLs after repository reorganization")
+    print("=" * 60)
+    
+    journal = UpdateJournal(JOURNAL_FILE)
+    already_correct = 0
+    
+    if journal.exists() and not dry_run:
+        # A previous run failed part-way: resend only what didn't go through
+        journaled_table, updates = journal.pending()
+        if journaled_table != table.name:
+            print(f"❌ {JOURNAL_FILE} is for table {journaled_table}, not {table.name}")
+            sys.exit(1)
+        print(f"\n♻️  Resuming from {JOURNAL_FILE}: {len(updates)} update(s) still pending")
+        names = {update['id']: update['id'] for update in updates}
+    else:
+        # Fetch all records
+        print("\n📊 Fetching records from Airtable...")
+        try:
+            records = table.all()
+            print(f"✅ Found {len(records)} records")
+        except AirtableError as e:
+            print(f"❌ Error fetching records: {e}")
+            sys.exit(1)
+        updates, names, already_correct = plan_updates(records)
+    
+    # Update records in Airtable (skip if dry run)
+    errors = []
+    if dry_run:
+        for update in updates:
+            print(f"  🔍 Would update (dry run): {names[update['id']]}")
+    elif updates:
+        print(f"\n☁️  Sending {len(updates)} update(s) in batches...")
+        if not journal.exists():
+            journal.start(table.name, updates)
+        errors = apply_updates(updates, names, journal)
+        if not errors:
+            journal.finish()
+    elif journal.exists():
+        journal.finish()
+    updated_count = len(updates) - len(errors)
     
     # Print summary
     print("\n" + "=" * 60)
@@ -131,11 +175,13 @@ def main(dry_run=False):
         print(f"❌ Errors: {len(errors)} records")
         for name, error in errors:
             print(f"   - {name}: {error}")
+        print(f"\n   Progress saved to {JOURNAL_FILE} - run again to retry only the failed updates")
+        sys.exit(1)
     
     print("\n✨ URL fix complete!")
     
     # Verify by checking one example
-    if updated_count > 0:
+    if updated_count > 0 and not dry_run:
         print("\n🔍 Verification - fetching first updated record...")
         try:
             # Get fresh data for verification
@@ -148,7 +194,7 @@ def main(dry_run=False):
                     print("  ✅ URLs successfully updated with source-documents/ path")
                 else:
                     print("  ⚠️  URL doesn't contain source-documents/ - may need manual review")
-        except Exception as e:
+        except AirtableError as e:
             print(f"  Could not verify: {e}")
 
 if __name__ == '__main__':
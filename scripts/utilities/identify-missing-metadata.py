@@ -2,41 +2,64 @@
 """
 Script to identify which Ordinances and Resolutions records 
 are missing from the Public Metadata table
+
+Both tables are read in-process through the shared Airtable client (every
+page, fetched concurrently) and saved as snapshots in .build-cache/airtable/.
+A snapshot younger than --max-age hours is reused instead of refetching, and
+--offline audits the last snapshots without credentials or network.
+
+Usage:
+    python3 scripts/utilities/identify-missing-metadata.py
+    python3 scripts/utilities/identify-missing-metadata.py --refresh    # Ignore snapshots
+    python3 scripts/utilities/identify-missing-metadata.py --offline    # Snapshots only
 """
 
-import subprocess
-import json
+import os
 import sys
+import argparse
+from pathlib import Path
 
-def run_mcp_command(command):
-    """Run an MCP command and return the parsed JSON output"""
-    try:
-        result = subprocess.run(
-            ["mcp", "call"] + command.split(),
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        return json.loads(result.stdout)
-    except subprocess.CalledProcessError as e:
-        print(f"Error running command: {e}")
-        print(f"Error output: {e.stderr}")
-        return None
-    except json.JSONDecodeError:
-        print(f"Could not parse JSON from command output")
-        return None
-
-def get_all_ordinances_resolutions():
-    """Get all records from Ordinances and Resolutions table"""
-    print("Fetching all Ordinances and Resolutions records...")
-    result = run_mcp_command("daily-tasks council_ordinances_list maxRecords:200")
-    
-    if not result:
-        print("Failed to fetch ordinances and resolutions")
-        return []
-    
-    records = []
-    for record in result:
+from dotenv import load_dotenv
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from utils.airtable_client import AirtableClient, AirtableError, TableSnapshot
+
+# Load environment variables
+load_dotenv()
+
+DOCUMENTS_TABLE = os.environ.get('AIRTABLE_DOCUMENTS_TABLE', 'Governing')
+METADATA_TABLE = os.environ.get('AIRTABLE_TABLE_NAME', 'Governing_Metadata')
+DEFAULT_MAX_AGE = 24  # hours
+
+
+def load_tables(names, offline=False, refresh=False, max_age=DEFAULT_MAX_AGE):
+    """
+    Raw records for each table, from a recent snapshot when there is one and
+    otherwise fetched from Airtable (all stale tables at once).
+    """
+    snapshots = {name: TableSnapshot(name) for name in names}
+    tables = {}
+    for name, snapshot in snapshots.items():
+        saved = None if refresh else snapshot.load(None if offline else max_age * 3600)
+        if saved is not None:
+            print(f"Using {name} snapshot from {saved['fetched_at']} ({len(saved['records'])} records)")
+            tables[name] = saved['records']
+        elif offline:
+            raise AirtableError(f"No snapshot of {name} in {snapshot.path} - run once without --offline")
+
+    stale = [name for name in names if name not in tables]
+    if stale:
+        client = AirtableClient.from_env()
+        print(f"Fetching {', '.join(stale)} from Airtable...")
+        tables.update(client.run_concurrently(
+            {name: (lambda name=name: snapshots[name].fetch(client.table(name))) for name in stale}))
+    return tables
+
+
+def get_all_ordinances_resolutions(records):
+    """Summarise the records of the Ordinances and Resolutions table"""
+    documents = []
+    for record in records:
         rec_id = record.get('id', '')
         fields = record.get('fields', {})
         
@@ -46,7 +69,7 @@ def get_all_ordinances_resolutions():
         digitized = fields.get('Digitized', False)
         year = fields.get('Year', '')
         
-        records.append({
+        documents.append({
             'id': rec_id,
             'name': doc_name,
             'type': doc_type,
@@ -55,38 +78,52 @@ def get_all_ordinances_resolutions():
             'fields': fields  # Keep all fields for reference
         })
     
-    return records
+    return documents
 
-def get_public_metadata_records():
-    """Get all existing Public Metadata records"""
-    print("Fetching all Public Metadata records...")
-    result = run_mcp_command("daily-tasks council_public_metadata_list maxRecords:200")
-    
-    if not result:
-        print("Failed to fetch public metadata")
-        return []
-    
+def get_public_metadata_records(records):
+    """IDs of the documents the Public Metadata records link to"""
     linked_doc_ids = []
-    for record in result:
+    for record in records:
         fields = record.get('fields', {})
-        # The Document field contains linked record IDs
-        doc_links = fields.get('Document', [])
+        # The link field contains linked record IDs (governing_docs since the
+        # tables were renamed, Document before)
+        doc_links = fields.get('governing_docs') or fields.get('Document', [])
         if doc_links:
             linked_doc_ids.extend(doc_links)
     
     return linked_doc_ids
 
 def main():
+    parser = argparse.ArgumentParser(description='Identify digitized documents with no Public Metadata record')
+    parser.add_argument('--offline', action='store_true',
+                        help='Use the saved snapshots only, however old (no credentials needed)')
+    parser.add_argument('--refresh', action='store_true',
+                        help='Fetch both tables even if the snapshots are recent')
+    parser.add_argument('--max-age', type=float, default=DEFAULT_MAX_AGE,
+                        help=f'Hours a snapshot stays fresh (default: {DEFAULT_MAX_AGE})')
+    parser.add_argument('--documents-table', default=DOCUMENTS_TABLE,
+                        help=f'Ordinances and Resolutions table (default: {DOCUMENTS_TABLE})')
+    parser.add_argument('--metadata-table', default=METADATA_TABLE,
+                        help=f'Public Metadata table (default: {METADATA_TABLE})')
+    args = parser.parse_args()
+
     print("=" * 60)
     print("IDENTIFYING MISSING PUBLIC METADATA ENTRIES")
     print("=" * 60)
     
+    try:
+        tables = load_tables([args.documents_table, args.metadata_table],
+                             offline=args.offline, refresh=args.refresh, max_age=args.max_age)
+    except AirtableError as e:
+        print(f"❌ Error fetching from Airtable: {e}")
+        return 1
+
     # Get all ordinances/resolutions
-    all_docs = get_all_ordinances_resolutions()
+    all_docs = get_all_ordinances_resolutions(tables[args.documents_table])
     print(f"\nFound {len(all_docs)} total Ordinances and Resolutions records")
     
     # Get existing public metadata links
-    existing_metadata_links = get_public_metadata_records()
+    existing_metadata_links = get_public_metadata_records(tables[args.metadata_table])
     existing_ids = set(existing_metadata_links)
     print(f"Found {len(existing_ids)} documents with Public Metadata entries")
     
@@ -104,7 +141,7 @@ def main():
     # Group by type
     by_type = {}
     for doc in missing_docs:
-        doc_type = doc.get('type', 'Unknown')
+        doc_type = doc.get('type') or 'Unknown'
         if doc_type not in by_type:
             by_type[doc_type] = []
         by_type[doc_type].append(doc)
@@ -113,10 +150,10 @@ def main():
     for doc_type, docs in sorted(by_type.items()):
         print(f"\n{doc_type.upper()}S ({len(docs)} missing):")
         print("-" * 40)
-        for doc in sorted(docs, key=lambda x: x.get('year', 0)):
+        for doc in sorted(docs, key=lambda x: str(x.get('year') or '')):
             print(f"  ID: {doc['id']}")
             print(f"     Name: {doc['name']}")
-            print(f"     Year: {doc.get('year', 'N/A')}")
+            print(f"     Year: {doc.get('year') or 'N/A'}")
             print()
     
     # Generate commands to create missing entries
@@ -137,6 +174,7 @@ def main():
     
     print(f"\n\nCommands saved to: missing_metadata_commands.txt")
     print(f"Total missing entries to create: {len(missing_docs)}")
+    return 0
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
@@ -4,13 +4,16 @@ Watch for changes in Ordinances/ directory and automatically sync to src/ordinan
 """
 
 import os
-import shutil
+import sys
 import time
 import subprocess
 from pathlib import Path
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from utils.build_cache import copy_if_changed
+
 class OrdinanceHandler(FileSystemEventHandler):
     def __init__(self):
         self.last_sync = {}
@@ -43,7 +46,8 @@ class OrdinanceHandler(FileSystemEventHandler):
         dest_path = dest_dir / dest_name
         
         try:
-            shutil.copy2(source_path, dest_path)
+            if not copy_if_changed(source_path, dest_path):
+                return
             print(f"✅ Synced {source_path.name} -> {dest_name}")
             
             # Trigger mdBook rebuild (if mdbook serve is running, it should auto-rebuild)
@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+"""
+Shared Airtable client for the City of Rivergrove sync scripts.
+
+Every script that talks to Airtable goes through one AirtableClient so that:
+1. All requests share a token bucket (Airtable allows 5 requests per second
+   per base), even when tables are fetched concurrently
+2. 429 and 5xx responses and network errors are retried with jittered
+   exponential backoff (honouring Retry-After)
+3. Failures raise AirtableError instead of quietly returning no records, so a
+   sync never overwrites good metadata with an empty result
+
+Tables are used like pyairtable's:
+    client = AirtableClient.from_env()
+    table = client.table('Governing_Metadata')
+    records = table.all(formula="{status} = 'Active'")
+    table.update(record_id, {'mdURL': url})
+    for batch, error in table.batch_update([{'id': record_id, 'fields': {...}}, ...]):
+        ...   # 10 records per request, several requests in flight
+
+TableSnapshot saves a table's raw records under .build-cache/airtable/, so an
+audit can reuse a recent fetch or run entirely offline.
+
+Environment:
+    AIRTABLE_API_KEY   API token (required)
+    AIRTABLE_BASE_ID   Base ID (required)
+    AIRTABLE_API_URL   API root (default: https://api.airtable.com) - point it
+                       at a local stand-in server to run without the network
+"""
+
+import os
+import json
+import time
+from pathlib import Path
+import random
+import threading
+import urllib.error
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from utils.build_cache import DEFAULT_CACHE_DIR, atomic_write_text
+
+DEFAULT_API_URL = 'https://api.airtable.com'
+REQUESTS_PER_SECOND = 5
+PAGE_SIZE = 100
+MAX_URL_LENGTH = 16000  # Airtable rejects longer GET URLs; use listRecords instead
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+MAX_BATCH = 10      # Records per create/update request (Airtable's limit)
+BATCH_WORKERS = 4   # Batch requests in flight, so round trips overlap under the rate limit
+SNAPSHOT_DIR = DEFAULT_CACHE_DIR / 'airtable'
+
+
+class AirtableError(Exception):
+    """An Airtable request failed for good (after retries, or not retryable)."""
+
+
+class TokenBucket:
+    """Thread-safe token bucket: at most `rate` requests per second on average."""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity or rate
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a request may be sent."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+class AirtableClient:
+    """Rate-limited, retrying client for one Airtable base."""
+
+    def __init__(self, api_key: str, base_id: str, api_url: Optional[str] = None,
+                 rate: float = REQUESTS_PER_SECOND, max_retries: int = 5, timeout: float = 30):
+        self.api_key = api_key
+        self.base_id = base_id
+        self.api_url = (api_url or DEFAULT_API_URL).rstrip('/')
+        # No bursts: a full bucket would send `rate` requests at once and then
+        # one more within the same second, which Airtable answers with a 429
+        # and a 30 second penalty
+        self.bucket = TokenBucket(rate, capacity=1)
+        self.max_retries = max_retries
+        self.timeout = timeout
+
+    @classmethod
+    def from_env(cls, **kwargs) -> 'AirtableClient':
+        missing = [name for name in ('AIRTABLE_API_KEY', 'AIRTABLE_BASE_ID') if not os.environ.get(name)]
+        if missing:
+            raise AirtableError(f"Missing environment variable(s): {', '.join(missing)}")
+        return cls(os.environ['AIRTABLE_API_KEY'], os.environ['AIRTABLE_BASE_ID'],
+                   os.environ.get('AIRTABLE_API_URL'), **kwargs)
+
+    def table(self, name: str) -> 'AirtableTable':
+        return AirtableTable(self, name)
+
+    def table_url(self, table: str, suffix: str = '') -> str:
+        return f"{self.api_url}/v0/{self.base_id}/{urllib.parse.quote(table, safe='')}{suffix}"
+
+    def backoff(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """Seconds to wait before retry number `attempt` (0-based)."""
+        if retry_after:
+            try:
+                return float(retry_after)
+            except ValueError:
+                pass
+        # Full jitter, so concurrent fetches don't retry in lockstep
+        return random.uniform(0.5, 1.0) * min(30.0, 0.5 * 2 ** attempt)
+
+    def request(self, method: str, url: str, body: Optional[Dict] = None) -> Dict:
+        """Send one request, retrying rate limits, server errors and network failures."""
+        data = json.dumps(body).encode('utf-8') if body is not None else None
+        headers = {'Authorization': f"Bearer {self.api_key}"}
+        if data is not None:
+            headers['Content-Type'] = 'application/json'
+
+        for attempt in range(self.max_retries + 1):
+            self.bucket.acquire()
+            request = urllib.request.Request(url, data=data, headers=headers, method=method)
+            retry_after = None
+            try:
+                with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                    return json.loads(response.read().decode('utf-8') or '{}')
+            except urllib.error.HTTPError as e:
+                detail = e.read().decode('utf-8', errors='replace')[:500]
+                if e.code not in RETRY_STATUSES:
+                    raise AirtableError(f"{method} {url} failed with HTTP {e.code}: {detail}") from e
+                error = f"HTTP {e.code}: {detail}"
+                retry_after = e.headers.get('Retry-After')
+            except (urllib.error.URLError, TimeoutError, ConnectionError) as e:
+                error = str(getattr(e, 'reason', e))
+
+            if attempt == self.max_retries:
+                raise AirtableError(f"{method} {url} failed after {attempt + 1} attempts: {error}")
+            time.sleep(self.backoff(attempt, retry_after))
+
+    def list_records(self, table: str, formula: Optional[str] = None,
+                     fields: Optional[List[str]] = None, max_records: Optional[int] = None) -> List[Dict]:
+        """Every record in a table (following pagination), optionally filtered."""
+        params = [('pageSize', str(PAGE_SIZE))]
+        if formula:
+            params.append(('filterByFormula', formula))
+        for field in fields or []:
+            params.append(('fields[]', field))
+        if max_records:
+            params.append(('maxRecords', str(max_records)))
+
+        records = []
+        offset = None
+        while True:
+            page_params = params + ([('offset', offset)] if offset else [])
+            url = f"{self.table_url(table)}?{urllib.parse.urlencode(page_params)}"
+            if len(url) > MAX_URL_LENGTH:
+                body = {key: int(value) if key in ('pageSize', 'maxRecords') else value
+                        for key, value in page_params if key != 'fields[]'}
+                if fields:
+                    body['fields'] = fields
+                page = self.request('POST', self.table_url(table, '/listRecords'), body)
+            else:
+                page = self.request('GET', url)
+            records.extend(page.get('records', []))
+            offset = page.get('offset')
+            if not offset:
+                return records
+
+    def update_record(self, table: str, record_id: str, fields: Dict) -> Dict:
+        return self.request('PATCH', self.table_url(table, f"/{record_id}"), {'fields': fields})
+
+    def update_records(self, table: str, records: List[Dict]) -> List[Dict]:
+        """Update up to MAX_BATCH records ({'id': ..., 'fields': {...}}) in one request."""
+        return self.request('PATCH', self.table_url(table), {'records': records}).get('records', [])
+
+    def batch_update(self, table: str, records: Iterable[Dict],
+                     workers: int = BATCH_WORKERS) -> Iterator[Tuple[List[Dict], Optional[AirtableError]]]:
+        """
+        Update any number of records, MAX_BATCH per request, with up to
+        `workers` requests in flight (all still paced by the token bucket).
+        Yields (batch, error) as each batch finishes; error is None on success.
+        """
+        records = list(records)
+        batches = [records[i:i + MAX_BATCH] for i in range(0, len(records), MAX_BATCH)]
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(batches)))) as executor:
+            futures = {executor.submit(self.update_records, table, batch): batch for batch in batches}
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                    yield futures[future], None
+                except AirtableError as e:
+                    yield futures[future], e
+
+    def run_concurrently(self, jobs: Dict[str, Callable]) -> Dict:
+        """
+        Run several fetches at once (they still share this client's rate limit).
+        Returns name -> result; the first failure is re-raised.
+        """
+        with ThreadPoolExecutor(max_workers=len(jobs) or 1) as executor:
+            futures = {name: executor.submit(job) for name, job in jobs.items()}
+            return {name: future.result() for name, future in futures.items()}
+
+
+class AirtableTable:
+    """pyairtable-style handle for one table."""
+
+    def __init__(self, client: AirtableClient, name: str):
+        self.client = client
+        self.name = name
+
+    def all(self, formula: Optional[str] = None, fields: Optional[List[str]] = None,
+            max_records: Optional[int] = None) -> List[Dict]:
+        return self.client.list_records(self.name, formula, fields, max_records)
+
+    def update(self, record_id: str, fields: Dict) -> Dict:
+        return self.client.update_record(self.name, record_id, fields)
+
+    def batch_update(self, records: Iterable[Dict], workers: int = BATCH_WORKERS):
+        return self.client.batch_update(self.name, records, workers)
+
+
+class TableSnapshot:
+    """A table's raw records saved locally, with the time they were fetched."""
+
+    def __init__(self, name: str, snapshot_dir=None):
+        self.name = name
+        self.path = Path(snapshot_dir or SNAPSHOT_DIR) / f"{name}.json"
+
+    def load(self, max_age: Optional[float] = None) -> Optional[Dict]:
+        """{'table', 'fetched_at', 'records'}, or None if missing or older than max_age seconds."""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                snapshot = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if max_age is not None and self.age(snapshot) > max_age:
+            return None
+        return snapshot
+
+    @staticmethod
+    def age(snapshot: Dict) -> float:
+        """Seconds since the snapshot was fetched."""
+        fetched = datetime.fromisoformat(snapshot['fetched_at'])
+        return (datetime.now(timezone.utc) - fetched).total_seconds()
+
+    def fetch(self, table: 'AirtableTable') -> List[Dict]:
+        """Fetch every record of the table and save them as the new snapshot."""
+        records = table.all()
+        snapshot = {'table': self.name, 'fetched_at': datetime.now(timezone.utc).isoformat(), 'records': records}
+        atomic_write_text(self.path, json.dumps(snapshot, ensure_ascii=False))
+        return records
+
+
+class UpdateJournal:
+    """
+    Append-only record of a bulk update, so a run that fails part-way can be
+    resumed without refetching or resending the updates that went through.
+
+    The journal holds the planned updates followed by the IDs of each batch
+    that succeeded; it is deleted once everything has been applied.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+
+    def exists(self) -> bool:
+        return self.path.exists()
+
+    def start(self, table: str, updates: List[Dict]):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps({'table': table, 'planned': updates}, ensure_ascii=False) + '\n')
+
+    def pending(self) -> Tuple[str, List[Dict]]:
+        """(table, updates not yet applied) from an existing journal."""
+        with open(self.path, 'r', encoding='utf-8') as f:
+            raw_lines = f.readlines()
+        lines = []
+        for index, line in enumerate(raw_lines):
+            if not line.strip():
+                continue
+            try:
+                lines.append(json.loads(line))
+            except json.JSONDecodeError:
+                if index < len(raw_lines) - 1 or not lines:
+                    raise
+                # A run killed mid-append leaves a partial last line - a batch
+                # that was never recorded, so it is resent. Drop it so the next
+                # record_done() starts on a fresh line.
+                with open(self.path, 'w', encoding='utf-8') as f:
+                    f.writelines(raw_lines[:index])
+        done = {record_id for line in lines[1:] for record_id in line.get('done', [])}
+        return lines[0]['table'], [update for update in lines[0]['planned'] if update['id'] not in done]
+
+    def record_done(self, record_ids: List[str]):
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps({'done': record_ids}) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+
+    def finish(self):
+        self.path.unlink(missing_ok=True)
@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+"""
+Content-hash build cache for the City of Rivergrove build pipeline.
+
+Every document-level stage (sync, footnotes, auto-link, cross-references and the
+HTML postprocessors) is a pure function of:
+1. The document content going into the stage
+2. The stage's own script(s) and any config they read
+3. Stage-wide inputs such as the cross-reference document map
+
+The cache keys each document's output on a hash of all three, so a stage only
+re-runs its transform on documents whose inputs actually changed and restores
+the cached output for everything else.
+
+Layout (repository root, git-ignored):
+    .build-cache/<stage>.json          manifest: path -> {key, output}
+    .build-cache/objects/ab/abcd...    stage outputs, stored by content hash
+
+Each stage has its own manifest so stages running in parallel never write the
+same file. Set RIVERGROVE_BUILD_CACHE=0 to bypass the cache entirely.
+
+write_if_changed() / copy_if_changed() are how every script writes into src/
+and book/: atomic (temp file + rename), and a file whose content is already
+right is not touched.
+
+Usage:
+    cache = BuildCache('footnotes', [__file__])
+    processed = cache.get(path, content)
+    if processed is None:
+        processed = process_footnotes(content)
+        cache.put(path, content, processed)
+    ...
+    cache.save()
+"""
+
+import os
+import sys
+import json
+import shutil
+import hashlib
+import tempfile
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+DEFAULT_CACHE_DIR = REPO_ROOT / '.build-cache'
+
+# Bump when the cache layout changes to invalidate every existing entry
+CACHE_VERSION = '1'
+
+
+def hash_text(text: str) -> str:
+    """SHA-256 of a string."""
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def hash_file(path) -> str:
+    """SHA-256 of a file's bytes, or of the empty string if it doesn't exist."""
+    try:
+        return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+    except OSError:
+        return hashlib.sha256(b'').hexdigest()
+
+
+def cache_enabled() -> bool:
+    return os.environ.get('RIVERGROVE_BUILD_CACHE', '1') != '0'
+
+
+def _file_mode(path: Path) -> int:
+    """The mode to give a rewritten file: its current mode, or the umask default."""
+    try:
+        return path.stat().st_mode & 0o7777
+    except OSError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+def atomic_write_text(path: Path, content: str):
+    """Write a file via a temp file + rename so readers never see partial data."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    mode = _file_mode(path)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(content)
+        # mkstemp creates the file 0600; keep the mode a plain write would give
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def write_if_changed(path, content: str) -> bool:
+    """
+    Atomically write content to path unless the file already holds exactly
+    that. Returns True if the file was written.
+
+    Every script that writes into src/ or book/ goes through this (or
+    copy_if_changed): an unchanged file keeps its mtime, so `mdbook serve`
+    and the dev-server watchers don't rebuild for a no-op run.
+    """
+    path = Path(path)
+    try:
+        if path.read_bytes() == content.encode('utf-8'):
+            return False
+    except OSError:
+        pass
+    atomic_write_text(path, content)
+    return True
+
+
+def copy_if_changed(source, dest) -> bool:
+    """Copy a file (with its metadata) unless dest already has the same bytes. Returns True if copied."""
+    source, dest = Path(source), Path(dest)
+    data = source.read_bytes()
+    try:
+        if dest.read_bytes() == data:
+            return False
+    except OSError:
+        pass
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=dest.parent, prefix=f".{dest.name}.")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        shutil.copystat(source, tmp_path)
+        os.replace(tmp_path, dest)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+    return True
+
+
+class BuildCache:
+    """Per-stage manifest of document input hashes and cached outputs."""
+
+    def __init__(self, stage: str, dependencies: Iterable = (), cache_dir=None, settings: Iterable[str] = ()):
+        """
+        Args:
+            stage: Stage name, used as the manifest filename
+            dependencies: Files the stage's output depends on besides the document
+                itself - the stage script, shared modules and config files
+            cache_dir: Cache location (default: <repo>/.build-cache)
+            settings: Values outside any file that change the output, e.g. the
+                HTML parser backend chosen by RIVERGROVE_HTML_PARSER
+        """
+        self.stage = stage
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+        self.objects_dir = self.cache_dir / 'objects'
+        self.manifest_file = self.cache_dir / f"{stage}.json"
+        self.enabled = cache_enabled()
+
+        fingerprint = [CACHE_VERSION, stage]
+        for dependency in sorted(str(Path(d).resolve()) for d in dependencies):
+            fingerprint.append(hash_file(dependency))
+        fingerprint.extend(settings)
+        self.fingerprint = hash_text('\n'.join(fingerprint))
+
+        self.entries: Dict[str, Dict] = self._load_manifest() if self.enabled else {}
+        self.dirty = False
+        self.hits = 0
+        self.misses = 0
+
+    def _load_manifest(self) -> Dict[str, Dict]:
+        if not self.manifest_file.exists():
+            return {}
+        try:
+            with open(self.manifest_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return data.get('entries', {})
+        except (OSError, ValueError):
+            # A corrupt manifest only costs a rebuild
+            return {}
+
+    def _entry_name(self, path) -> str:
+        """Manifest key for a document: its path relative to the repository root."""
+        resolved = Path(path).resolve()
+        try:
+            return str(resolved.relative_to(REPO_ROOT))
+        except ValueError:
+            return str(resolved)
+
+    def _object_path(self, digest: str) -> Path:
+        return self.objects_dir / digest[:2] / digest
+
+    def input_key(self, content: str, extra: str = '') -> str:
+        """Hash of everything a document's output depends on."""
+        return hash_text(f"{self.fingerprint}\0{hash_text(extra)}\0{content}")
+
+    def get(self, path, content: str, extra: str = '') -> Optional[str]:
+        """
+        Return the cached output for a document, or None if it must be reprocessed.
+
+        Args:
+            path: The document's path (identifies the manifest entry)
+            content: The document content going into this stage
+            extra: Stage-wide input that affects every document (e.g. a document map)
+        """
+        if not self.enabled:
+            return None
+
+        entry = self.entries.get(self._entry_name(path))
+        if entry and entry.get('key') == self.input_key(content, extra):
+            try:
+                output = self._object_path(entry['output']).read_text(encoding='utf-8')
+                self.hits += 1
+                return output
+            except OSError:
+                pass
+
+        self.misses += 1
+        return None
+
+    def put(self, path, content: str, output: str, extra: str = ''):
+        """Record a freshly processed document's output."""
+        if not self.enabled:
+            return
+
+        output_hash = hash_text(output)
+        object_path = self._object_path(output_hash)
+        if not object_path.exists():
+            atomic_write_text(object_path, output)
+
+        self.entries[self._entry_name(path)] = {
+            'key': self.input_key(content, extra),
+            'output': output_hash,
+        }
+        self.dirty = True
+
+    def save(self):
+        """Write the manifest if anything changed, dropping entries for deleted files."""
+        if not self.enabled or not self.dirty:
+            return
+
+        self.entries = {
+            name: entry for name, entry in self.entries.items()
+            if (REPO_ROOT / name).exists()
+        }
+        data = {
+            'stage': self.stage,
+            'fingerprint': self.fingerprint,
+            'entries': self.entries,
+        }
+        atomic_write_text(self.manifest_file, json.dumps(data, indent=2, sort_keys=True))
+        self.dirty = False
+
+    def summary(self) -> str:
+        """One-line hit/miss report for script output."""
+        if not self.enabled:
+            return "build cache disabled"
+        return f"{self.hits} cached, {self.misses} processed"
+
+
+def collect_garbage(cache_dir=None) -> int:
+    """Delete cached outputs no manifest refers to. Returns the number removed."""
+    cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+    referenced = set()
+    for manifest in cache_dir.glob('*.json'):
+        try:
+            with open(manifest, 'r', encoding='utf-8') as f:
+                entries = json.load(f).get('entries', {})
+        except (OSError, ValueError):
+            continue
+        referenced.update(entry.get('output') for entry in entries.values())
+
+    removed = 0
+    for object_file in (cache_dir / 'objects').glob('*/*'):
+        if object_file.name not in referenced:
+            object_file.unlink()
+            removed += 1
+    return removed
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Inspect or clean the build cache')
+    parser.add_argument('--stats', action='store_true', help='Show entries per stage')
+    parser.add_argument('--gc', action='store_true', help='Remove unreferenced cached outputs')
+    parser.add_argument('--clear', action='store_true', help='Delete the whole cache')
+    args = parser.parse_args()
+
+    if args.clear:
+        shutil.rmtree(DEFAULT_CACHE_DIR, ignore_errors=True)
+        print(f"🗑️  Cleared {DEFAULT_CACHE_DIR}")
+        return 0
+
+    if args.gc:
+        removed = collect_garbage()
+        print(f"🧹 Removed {removed} unreferenced cached output(s)")
+
+    if args.stats or not args.gc:
+        manifests = sorted(DEFAULT_CACHE_DIR.glob('*.json'))
+        if not manifests:
+            print("Build cache is empty")
+        for manifest in manifests:
+            with open(manifest, 'r', encoding='utf-8') as f:
+                entries = json.load(f).get('entries', {})
+            print(f"  {manifest.stem}: {len(entries)} document(s)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
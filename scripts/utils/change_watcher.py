@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Debounced file change collection for the development watchers.
+
+Editors and mdBook both touch files in bursts (an atomic save is a create +
+rename; a rebuild rewrites every page). SettlingHandler gathers the paths from
+a burst and hands them over as one batch once nothing has changed for
+`settle` seconds, so each burst is processed exactly once.
+
+Usage:
+    handler = SettlingHandler(on_batch, settle=0.3, suffixes=('.md',))
+    observer = Observer()
+    observer.schedule(handler, 'source-documents', recursive=True)
+    observer.start()
+"""
+
+import threading
+from pathlib import Path
+
+from watchdog.events import FileSystemEventHandler
+
+# Opened/closed events are ignored: reading a file must never look like a change
+CHANGE_EVENTS = {'created', 'modified', 'moved', 'deleted'}
+
+
+class SettlingHandler(FileSystemEventHandler):
+    """Collect changed paths and pass them to callback once the burst settles."""
+
+    def __init__(self, callback, settle=0.3, suffixes=None, ignore_names=()):
+        """
+        Args:
+            callback: Called with a sorted list of changed Paths (on a timer thread)
+            settle: Seconds without events before a batch is handed over
+            suffixes: Only report files with these suffixes (default: all files)
+            ignore_names: File names to never report (e.g. print.html)
+        """
+        super().__init__()
+        self.callback = callback
+        self.settle = settle
+        self.suffixes = set(suffixes) if suffixes else None
+        self.ignore_names = set(ignore_names)
+        self.pending = set()
+        self.lock = threading.Lock()
+        self.timer = None
+
+    def wanted(self, path):
+        path = Path(path)
+        if path.name in self.ignore_names or path.name.startswith('.'):
+            return False
+        return self.suffixes is None or path.suffix in self.suffixes
+
+    def on_any_event(self, event):
+        if event.is_directory or event.event_type not in CHANGE_EVENTS:
+            return
+
+        paths = [event.src_path]
+        if event.event_type == 'moved':
+            paths.append(event.dest_path)
+        paths = [Path(p) for p in paths if self.wanted(p)]
+        if not paths:
+            return
+
+        with self.lock:
+            self.pending.update(paths)
+            if self.timer:
+                self.timer.cancel()
+            self.timer = threading.Timer(self.settle, self.flush)
+            self.timer.daemon = True
+            self.timer.start()
+
+    def flush(self):
+        with self.lock:
+            paths, self.pending = sorted(self.pending), set()
+            self.timer = None
+        if paths:
+            self.callback(paths)
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Tokenizer for the {{...}} directives in source documents.
+
+Source documents mark form fields and a few layout details inline:
+    {{filled:}}  {{filled:text}}  {{signature}}  {{br}}
+    {{table-footnote:text}}  {{page:X}}  {{image:file|alt=text|caption=text}}
+
+DIRECTIVE_PATTERN finds every one of them in a single scan, and render()
+replaces each with what its handler returns - one linear pass per document
+instead of a regex pass per directive per line:
+
+    html = render(content, {'br': lambda value, heading, context: '<br>' if value is None else None})
+
+A handler is called as handler(value, heading, context): value is the text
+after the colon (None if there was no colon), heading says whether the
+directive sits on a Markdown heading line, and context is the keyword
+arguments given to render(). Returning None leaves the directive as written.
+
+Validators use MARKER_PATTERN, which finds the pieces of a directive
+(openings and closing brackets) so unclosed or malformed ones can be reported.
+"""
+
+import re
+from typing import Callable, Dict, Optional
+
+Handler = Callable[[Optional[str], bool, Dict], Optional[str]]
+
+DIRECTIVE_NAMES = ('filled', 'signature', 'br', 'table-footnote', 'page', 'image')
+DIRECTIVE_PATTERN = re.compile(
+    r'\{\{(?P<name>' + '|'.join(re.escape(name) for name in DIRECTIVE_NAMES) + r')(?::(?P<value>[^}\n]*))?\}\}')
+
+# `{{` (noting a `filled` directive and its colon) or `}}`; a `{` before
+# `{{filled` is skipped so the opening is found where the name starts
+MARKER_PATTERN = re.compile(r'\{\{(?!\{)(?P<filled>filled(?P<colon>:)?)?|\}\}')
+
+
+def render(content: str, handlers: Dict[str, Handler], **context) -> str:
+    """Replace every directive that has a handler, in one pass over content."""
+    line_start = -1
+    heading = False
+    parts = []
+    position = 0
+
+    for match in DIRECTIVE_PATTERN.finditer(content):
+        handler = handlers.get(match.group('name'))
+        if handler is None:
+            continue
+
+        start = match.start()
+        start_of_line = content.rfind('\n', 0, start) + 1
+        if start_of_line != line_start:
+            # Only the text before the first directive decides: a line that
+            # starts with a directive can't be a heading
+            line_start = start_of_line
+            heading = content[line_start:start].lstrip().startswith('#')
+
+        replacement = handler(match.group('value'), heading, context)
+        if replacement is None:
+            continue
+        parts.append(content[position:start])
+        parts.append(replacement)
+        position = match.end()
+
+    if not parts:
+        return content
+    parts.append(content[position:])
+    return ''.join(parts)
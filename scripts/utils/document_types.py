@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Page classification for the HTML postprocessors.
+
+identify_document_type() sorts a book/ page into the document types whose
+formatting rules enhanced-custom-processor.py applies. PageScope classifies a
+page once so postprocessors can dispatch document-specific fixes only to the
+pages they were written for:
+
+    scope = PageScope('book/ordinances/1989-Ord-54-89C-Land-Development.html')
+    scope.doc_type                                          # 'land-development'
+    scope.includes('1989-Ord-54-89C-Land-Development.html')  # True
+    scope.includes('ord-65-99')                             # False
+
+mdBook's print.html holds every document, so every fix applies to it.
+"""
+
+from pathlib import Path
+
+# Pages that combine every document, so every document's fixes apply to them
+COMBINED_PAGES = {'print.html'}
+
+
+def identify_document_type(filepath) -> str:
+    """Identify document type from filename"""
+    filename = Path(filepath).name.lower()
+
+    if 'sign' in filename or '81-2011' in filename:
+        return 'sign'
+    elif 'fee' in filename or '259' in filename or '300' in filename:
+        return 'fee'
+    elif 'wqra' in filename or '70-2001' in filename:
+        return 'wqra'
+    elif 'land-development' in filename or '54-89' in filename or '59-97' in filename:
+        return 'land-development'
+    elif '65-99' in filename or 'sewer-services' in filename:
+        return 'ord-65-99'
+    else:
+        return 'standard'
+
+
+class PageScope:
+    """What a book/ page is, worked out once: its file name and document type."""
+
+    def __init__(self, filepath):
+        self.name = Path(filepath).name
+        self.doc_type = identify_document_type(filepath)
+        self.combined = self.name in COMBINED_PAGES
+
+    def includes(self, target: str) -> bool:
+        """Whether a fix registered for target (a page file name or document type) applies to this page."""
+        return self.combined or target in (self.name, self.doc_type)
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Shared BeautifulSoup parser factory for the City of Rivergrove build scripts.
+
+All page-level HTML parsing goes through parse_html() so the parser backend is
+chosen in one place:
+1. RIVERGROVE_HTML_PARSER environment variable (lxml, html.parser, html5lib)
+2. Otherwise lxml when it is installed - it parses our pages noticeably faster
+3. Otherwise Python's built-in html.parser
+
+Scripts that write HTML back to book/ pass for_output=True. Those default to
+html.parser regardless of what is installed: lxml repairs malformed markup
+differently (e.g. <a> wrapping block elements in the TOC pages) and drops the
+newline after the doctype, so its output is not byte-identical.
+scripts/tests/check-parser-parity.py checks that the validators report the
+same findings under both backends; it does not cover postprocessing output.
+
+Small fragment parses (e.g. BeautifulSoup('<span>...</span>', 'html.parser').span)
+don't need the factory - they are cheap and rely on html.parser not adding
+<html>/<body> wrappers.
+"""
+
+import os
+import importlib.util
+from typing import List, Optional
+
+from bs4 import BeautifulSoup
+
+PARSER_ENV = 'RIVERGROVE_HTML_PARSER'
+SUPPORTED_BACKENDS = ['lxml', 'html.parser', 'html5lib']
+
+# Backend for scripts whose serialized output is written back to book/
+OUTPUT_BACKEND = 'html.parser'
+
+_BACKEND_MODULES = {'lxml': 'lxml', 'html.parser': 'html', 'html5lib': 'html5lib'}
+
+
+def backend_available(backend: str) -> bool:
+    """Whether a bs4 tree builder can be used in this environment."""
+    module = _BACKEND_MODULES.get(backend)
+    return module is not None and importlib.util.find_spec(module) is not None
+
+
+def available_backends() -> List[str]:
+    return [backend for backend in SUPPORTED_BACKENDS if backend_available(backend)]
+
+
+def get_backend(for_output: bool = False) -> str:
+    """
+    Resolve the parser backend.
+
+    Args:
+        for_output: True when the parsed tree is serialized back to disk
+    """
+    requested = os.environ.get(PARSER_ENV, '').strip()
+    if requested:
+        if requested not in SUPPORTED_BACKENDS:
+            raise ValueError(f"{PARSER_ENV}={requested!r} is not one of {', '.join(SUPPORTED_BACKENDS)}")
+        if backend_available(requested):
+            return requested
+        # Requested backend isn't installed - fall back rather than fail the build
+        return 'html.parser'
+
+    if for_output:
+        return OUTPUT_BACKEND
+    return 'lxml' if backend_available('lxml') else 'html.parser'
+
+
+def parse_html(markup: str, for_output: bool = False, backend: Optional[str] = None) -> BeautifulSoup:
+    """
+    Parse a full HTML page.
+
+    Args:
+        markup: The page HTML
+        for_output: True when the tree will be serialized back to disk
+        backend: Explicit backend, overriding the environment and defaults
+    """
+    return BeautifulSoup(markup, backend or get_backend(for_output))
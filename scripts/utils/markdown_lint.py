@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Read-once, cached lint engine for the Markdown validation scripts.
+
+validate-no-html.py, validate-form-fields.py and check-list-nesting.py each
+declare a RuleSet: a name, the script that defines it, and a check(content)
+function in that script returning JSON-serialisable issues. lint_files()
+reads every file once and runs each rule set over the same buffer:
+
+    results, failures = lint_files(paths, [no_html.RULES, form_fields.RULES])
+    results[path]['no-html']     # that rule set's issues for the file
+    failures[path]               # why a file couldn't be read
+
+Results are cached per rule set with BuildCache (.build-cache/lint-<name>.json),
+keyed by the file's content and the rule script, so a rerun only lints the
+files that changed - or every file, after a rule script changes. Files that
+do need linting run in a process pool once there are enough of them to pay
+for starting the workers.
+"""
+
+import json
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from utils.build_cache import BuildCache
+from utils.script_loader import SCRIPTS_DIR, load_script
+
+FILES_PER_WORKER = 100  # Fewer files than this per worker and the pool costs more than it saves
+
+
+class RuleSet:
+    """A named set of checks, defined by a function in a validation script."""
+
+    def __init__(self, name: str, script: str, check: Callable, applies: Optional[Callable] = None,
+                 deps: Sequence[str] = ()):
+        """
+        Args:
+            name: Rule set name - the key in lint_files() results
+            script: The defining script, relative to scripts/; its content versions the cached results
+            check: Module-level function in that script: check(content) -> issues
+            applies: Which files a directory walk lints with this rule set (default: every file)
+            deps: Other modules the checks use, relative to scripts/; they version the cache too
+        """
+        self.name = name
+        self.script = script
+        self.check = check
+        self.applies = applies or (lambda path: True)
+        self.deps = list(deps)
+
+    def cache(self) -> BuildCache:
+        return BuildCache(f"lint-{self.name}", [SCRIPTS_DIR / self.script, __file__] +
+                          [SCRIPTS_DIR / dep for dep in self.deps])
+
+
+# Worker processes load the rule scripts themselves: functions from
+# load_script() modules can't be pickled, and spawned workers start empty
+_worker_checks: Dict[str, Callable] = {}
+
+
+def _load_checks(specs):
+    for name, script, check in specs:
+        _worker_checks[name] = getattr(load_script(script), check)
+
+
+def _run_checks(content, names):
+    return {name: _worker_checks[name](content) for name in names}
+
+
+def lint_files(paths: Iterable, rule_sets: List[RuleSet], jobs: int = 1,
+               filtered: bool = False) -> Tuple[Dict, Dict]:
+    """
+    Lint files with every rule set (with filtered=True, only the rule sets
+    whose applies() accepts the file). Returns (results, failures):
+    path -> {rule set name: issues} in the order given, and path -> read error.
+    """
+    caches = {rule_set.name: rule_set.cache() for rule_set in rule_sets}
+    results = {}
+    failures = {}
+    pending = []  # (path, content, rule set names still to run)
+
+    for path in paths:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                content = f.read()
+        except (OSError, ValueError) as e:
+            failures[path] = str(e)
+            continue
+
+        results[path] = {}
+        missing = []
+        for rule_set in rule_sets:
+            if filtered and not rule_set.applies(path):
+                continue
+            cached = caches[rule_set.name].get(path, content)
+            if cached is not None:
+                results[path][rule_set.name] = json.loads(cached)
+            else:
+                missing.append(rule_set.name)
+        if missing:
+            pending.append((path, content, missing))
+
+    workers = max(1, min(jobs, len(pending) // FILES_PER_WORKER))
+    if workers > 1:
+        specs = [(rule_set.name, rule_set.script, rule_set.check.__name__) for rule_set in rule_sets]
+        with ProcessPoolExecutor(max_workers=workers, initializer=_load_checks, initargs=(specs,)) as executor:
+            fresh = list(executor.map(_run_checks, [content for _, content, _ in pending],
+                                      [names for _, _, names in pending],
+                                      chunksize=max(1, len(pending) // (workers * 4))))
+    else:
+        checks = {rule_set.name: rule_set.check for rule_set in rule_sets}
+        fresh = ({name: checks[name](content) for name in names} for _, content, names in pending)
+
+    for (path, content, _), issues in zip(pending, fresh):
+        for name, found in issues.items():
+            # Round-trip through JSON so fresh and cached results look the same
+            output = json.dumps(found, ensure_ascii=False)
+            caches[name].put(path, content, output)
+            results[path][name] = json.loads(output)
+
+    for cache in caches.values():
+        cache.save()
+    return results, failures
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Per-record store behind the aggregated Airtable metadata JSON.
+
+book/airtable-metadata.json is what the site, generate-summary-with-airtable.py
+and TitleResolver read, but rewriting it means loading and re-serialising every
+record. The sync keeps its records in a small SQLite database instead, so a
+single-document update is one row upsert, and the JSON is exported from it.
+Each record is stored already rendered at its exported indentation, so an
+export only joins strings instead of re-serialising every record:
+
+    store = MetadataStore.for_export('book/airtable-metadata.json')
+    store.upsert('documents', '1999-Ord-65-99-Sewer-Services', record)
+    store.export()   # rewrites the JSON only if the store changed since the last export
+
+The JSON stays the source of truth: if it changes behind the store's back (a
+`cp src/airtable-metadata.json book/`, a git checkout), the store re-imports
+it before the next read. If the JSON is deleted, the store keeps the last
+export and writes it back on the next export. The database lives in
+.build-cache/metadata/; with RIVERGROVE_BUILD_CACHE=0 it is kept in memory
+and loaded from the JSON each run.
+"""
+
+import json
+import sqlite3
+from pathlib import Path
+from typing import Dict, Optional
+
+from utils.build_cache import DEFAULT_CACHE_DIR, cache_enabled, hash_text, write_if_changed
+
+SECTIONS = ('documents', 'unmatched_records')
+INDENT = '  '  # json.dump(..., indent=2), as the cache has always been written
+MAX_UPDATE_LOG = 50  # incremental_updates entries kept in the exported metadata
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS records (
+    section TEXT NOT NULL,
+    key TEXT NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (section, key)
+);
+CREATE TABLE IF NOT EXISTS metadata (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS updates (id INTEGER PRIMARY KEY, filename TEXT, updated_at TEXT);
+CREATE TABLE IF NOT EXISTS state (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+"""
+
+
+class MetadataStore:
+    """SQLite rows for each cached record, exported on demand to one JSON file."""
+
+    def __init__(self, db_path, export_file):
+        self.export_file = Path(export_file)
+        if db_path != ':memory:':
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        # The sync may run on a worker thread (--include-meetings); only one
+        # thread uses a store at a time
+        self.db = sqlite3.connect(str(db_path), check_same_thread=False)
+        self.db.executescript(SCHEMA)
+        self.sync_with_export()
+
+    @classmethod
+    def for_export(cls, export_file, cache_dir=None) -> 'MetadataStore':
+        """The store behind export_file (one database per export path)."""
+        if not cache_enabled():
+            return cls(':memory:', export_file)
+        export_file = Path(export_file)
+        name = f"{export_file.stem}-{hash_text(str(export_file.resolve()))[:8]}.sqlite"
+        return cls(Path(cache_dir or DEFAULT_CACHE_DIR) / 'metadata' / name, export_file)
+
+    # ---- keeping the store and the JSON in step ------------------------------
+
+    def _state(self, key: str) -> Optional[str]:
+        row = self.db.execute("SELECT value FROM state WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_state(self, key: str, value):
+        self.db.execute("INSERT INTO state (key, value) VALUES (?, ?) "
+                        "ON CONFLICT (key) DO UPDATE SET value = excluded.value", (key, str(value)))
+
+    def _export_signature(self) -> Optional[str]:
+        try:
+            stat = self.export_file.stat()
+        except OSError:
+            return None
+        return f"{stat.st_mtime_ns}:{stat.st_size}"
+
+    def sync_with_export(self):
+        """Re-import the JSON if it changed since the store last wrote it."""
+        signature = self._export_signature()
+        if signature is not None and signature != self._state('exported'):
+            self.import_file(self.export_file)
+            self._set_state('exported', signature)
+            self._set_state('exported_revision', self.revision)
+            self.db.commit()
+
+    def import_file(self, path: Path):
+        with open(path, 'r', encoding='utf-8') as f:
+            self.replace(json.load(f))
+
+    @property
+    def revision(self) -> int:
+        return int(self._state('revision') or 0)
+
+    def _changed(self):
+        self._set_state('revision', self.revision + 1)
+        self.db.commit()
+
+    # ---- records ---------------------------------------------------------------
+
+    @staticmethod
+    def render(value, level: int = 2) -> str:
+        """json.dumps(value, indent=2) as it appears nested `level` deep in the export."""
+        return json.dumps(value, indent=2, ensure_ascii=False).replace('\n', '\n' + INDENT * level)
+
+    def get(self, section: str, key: str) -> Optional[Dict]:
+        row = self.db.execute("SELECT data FROM records WHERE section = ? AND key = ?",
+                              (section, key)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def upsert(self, section: str, key: str, record: Dict):
+        """Insert or replace one record; an existing key keeps its position in the export."""
+        self.db.execute("INSERT INTO records (section, key, data) VALUES (?, ?, ?) "
+                        "ON CONFLICT (section, key) DO UPDATE SET data = excluded.data",
+                        (section, key, self.render(record)))
+        self._changed()
+
+    def count(self, section: str = 'documents') -> int:
+        return self.db.execute("SELECT COUNT(*) FROM records WHERE section = ?", (section,)).fetchone()[0]
+
+    def records(self, section: str = 'documents') -> Dict[str, Dict]:
+        rows = self.db.execute("SELECT key, data FROM records WHERE section = ? ORDER BY rowid", (section,))
+        return {key: json.loads(data) for key, data in rows}
+
+    def metadata(self) -> Dict:
+        metadata = {key: json.loads(value)
+                    for key, value in self.db.execute("SELECT key, value FROM metadata ORDER BY rowid")}
+        updates = [{'filename': filename, 'updated_at': updated_at} for filename, updated_at in
+                   self.db.execute("SELECT filename, updated_at FROM updates ORDER BY id")]
+        if updates:
+            metadata['incremental_updates'] = updates
+        return metadata
+
+    def update_metadata(self, **values):
+        self.db.executemany("INSERT INTO metadata (key, value) VALUES (?, ?) "
+                            "ON CONFLICT (key) DO UPDATE SET value = excluded.value",
+                            [(key, json.dumps(value, ensure_ascii=False)) for key, value in values.items()])
+        self._changed()
+
+    def log_update(self, filename: str, updated_at: str):
+        """Record a single-document update, keeping the last MAX_UPDATE_LOG."""
+        self.db.execute("INSERT INTO updates (filename, updated_at) VALUES (?, ?)", (filename, updated_at))
+        self.db.execute("DELETE FROM updates WHERE id NOT IN "
+                        "(SELECT id FROM updates ORDER BY id DESC LIMIT ?)", (MAX_UPDATE_LOG,))
+        self._changed()
+
+    def replace(self, data: Dict):
+        """Replace everything with a whole cache in the exported format (as a full sync produces)."""
+        with self.db:
+            self.db.execute("DELETE FROM records")
+            self.db.execute("DELETE FROM metadata")
+            self.db.execute("DELETE FROM updates")
+            metadata = dict(data.get('metadata', {}))
+            for update in metadata.pop('incremental_updates', []):
+                self.db.execute("INSERT INTO updates (filename, updated_at) VALUES (?, ?)",
+                                (update.get('filename'), update.get('updated_at')))
+            self.db.executemany("INSERT INTO metadata (key, value) VALUES (?, ?)",
+                                [(key, json.dumps(value, ensure_ascii=False)) for key, value in metadata.items()])
+            for section in SECTIONS:
+                if section in data:
+                    self.db.executemany("INSERT INTO records (section, key, data) VALUES (?, ?, ?)",
+                                        [(section, key, self.render(record))
+                                         for key, record in data[section].items()])
+            if 'unmatched_records' not in data:
+                self._set_state('no_unmatched', 1)
+            else:
+                self.db.execute("DELETE FROM state WHERE key = 'no_unmatched'")
+        self._changed()
+
+    def sections(self):
+        """The sections the cache has (old caches have no unmatched_records)."""
+        return SECTIONS if self._state('no_unmatched') is None else SECTIONS[:1]
+
+    def snapshot(self) -> Dict:
+        """The whole cache, in the exported format."""
+        data = {'metadata': self.metadata()}
+        for section in self.sections():
+            data[section] = self.records(section)
+        return data
+
+    def rendered(self) -> str:
+        """The export text: json.dumps(self.snapshot(), indent=2), built from the stored fragments."""
+        parts = [f"{INDENT}\"metadata\": {self.render(self.metadata(), 1)}"]
+        for section in self.sections():
+            rows = self.db.execute("SELECT key, data FROM records WHERE section = ? ORDER BY rowid", (section,))
+            entries = [f"{INDENT * 2}{json.dumps(key, ensure_ascii=False)}: {data}" for key, data in rows]
+            body = "{\n" + ",\n".join(entries) + f"\n{INDENT}}}" if entries else "{}"
+            parts.append(f"{INDENT}{json.dumps(section)}: {body}")
+        return "{\n" + ",\n".join(parts) + "\n}"
+
+    # ---- export ------------------------------------------------------------------
+
+    def export(self, force: bool = False) -> bool:
+        """Write the aggregated JSON if the store changed since the last export. Returns True if written."""
+        if not force and self._state('exported_revision') == str(self.revision) \
+                and self._export_signature() == self._state('exported'):
+            return False
+        written = write_if_changed(self.export_file, self.rendered())
+        self._set_state('exported', self._export_signature())
+        self._set_state('exported_revision', self.revision)
+        self.db.commit()
+        return written
+
+    def close(self):
+        self.db.close()
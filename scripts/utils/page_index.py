@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Reusable element index over a parsed book/ page for read-only checks.
+
+validate-list-formatting.py, check-styles-health.py and test-list-formatting.py
+ask the same questions of every page - all the <p>, <li> and <ul>/<ol>, the
+list marker spans, the first marker inside an item - and each soup.find_all()
+walks the whole tree again. PageIndex walks the tree once and answers those
+lookups from the index:
+
+    page = PageIndex(parse_html(html))
+    page.find_all('ul', 'alpha-list')                  # soup.find_all('ul', class_='alpha-list')
+    page.find(li, 'span', ['list-marker-alpha', ...])  # li.find('span', class_=[...])
+    page.text(li)                                      # li.get_text(), computed once
+
+Results are in document order, exactly as bs4 returns them. The index is only
+valid while the tree is unchanged, so postprocessors (which rewrite the tree)
+don't use it.
+"""
+
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from typing import Dict, List, Optional, Sequence, Union
+
+from bs4 import BeautifulSoup, Tag
+
+Names = Optional[Union[str, Sequence[str]]]
+
+
+def _as_tuple(value: Names):
+    if value is None:
+        return None
+    return (value,) if isinstance(value, str) else tuple(value)
+
+
+class PageIndex:
+    """Tags of one parsed page, indexed by name and class in document order."""
+
+    def __init__(self, soup: BeautifulSoup):
+        self.soup = soup
+        self.tags: List[Tag] = soup.find_all(True)
+        self._start: Dict[int, int] = {}  # id(tag) -> position in document order
+        self._end: Dict[int, int] = {}    # id(tag) -> position after its last descendant
+        self._by_name = defaultdict(list)
+        self._by_class = defaultdict(list)
+        self._queries = {}
+        self._texts = {}
+
+        # Preorder positions make every subtree a contiguous range, so
+        # "descendants of X" is a slice of any lookup result
+        open_tags = []
+        for position, tag in enumerate(self.tags):
+            self._start[id(tag)] = position
+            while open_tags and open_tags[-1] is not tag.parent:
+                self._end[id(open_tags.pop())] = position
+            open_tags.append(tag)
+            self._by_name[tag.name].append(tag)
+            for css_class in dict.fromkeys(tag.get('class') or ()):
+                self._by_class[css_class].append(tag)
+        for tag in open_tags:
+            self._end[id(tag)] = len(self.tags)
+
+    def _lookup(self, name: Names, class_: Names):
+        """(tags, positions) matching name and class_, cached per query."""
+        key = (_as_tuple(name), _as_tuple(class_))
+        if key not in self._queries:
+            names, classes = key
+            if classes is not None:
+                found = [tag for css_class in classes for tag in self._by_class.get(css_class, ())]
+                if names is not None:
+                    found = [tag for tag in found if tag.name in names]
+            elif names is not None:
+                found = [tag for tag_name in names for tag in self._by_name.get(tag_name, ())]
+            else:
+                found = self.tags
+            if (names is not None and len(names) > 1) or (classes is not None and len(classes) > 1):
+                # Several lists merged: dedupe and restore document order
+                found = sorted({id(tag): tag for tag in found}.values(), key=lambda tag: self._start[id(tag)])
+            self._queries[key] = (found, [self._start[id(tag)] for tag in found])
+        return self._queries[key]
+
+    def find_all(self, name: Names = None, class_: Names = None, within: Optional[Tag] = None) -> List[Tag]:
+        """Like soup.find_all(name, class_=class_), or within.find_all(...) for descendants of a tag."""
+        found, positions = self._lookup(name, class_)
+        if within is None:
+            return found
+        low = bisect_right(positions, self._start[id(within)])
+        high = bisect_left(positions, self._end[id(within)], low)
+        return found[low:high]
+
+    def find(self, within: Tag, name: Names = None, class_: Names = None) -> Optional[Tag]:
+        """Like within.find(name, class_=class_): the first matching descendant, or None."""
+        found, positions = self._lookup(name, class_)
+        index = bisect_right(positions, self._start[id(within)])
+        if index < len(found) and positions[index] < self._end[id(within)]:
+            return found[index]
+        return None
+
+    def text(self, element) -> str:
+        """element.get_text(), computed once per element."""
+        key = id(element)
+        if key not in self._texts:
+            self._texts[key] = element.get_text()
+        return self._texts[key]
@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+"""
+Import helper for the pipeline's hyphenated scripts.
+
+Most build steps are standalone executables with hyphenated names
+(e.g. scripts/postprocessing/unified-list-processor.py), which a normal import
+statement can't load. Runners that fuse several steps into one process use
+load_script() to reuse those scripts' functions directly.
+"""
+
+import importlib.util
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+
+
+def load_script(relative_path):
+    """
+    Import a script as a module.
+
+    Args:
+        relative_path: Path relative to scripts/, e.g. 'preprocessing/sync-ordinances.py'
+    """
+    path = SCRIPTS_DIR / relative_path
+    spec = importlib.util.spec_from_file_location(path.stem.replace('-', '_'), path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
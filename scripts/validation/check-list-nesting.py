@@ -5,11 +5,15 @@ Ensures proper indentation for nested list items in markdown files.
 Specifically checks for roman numerals that should be nested under numeric items.
 """
 
+import os
 import re
 import sys
 from pathlib import Path
 from typing import List, Tuple
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from utils.markdown_lint import RuleSet, lint_files
+
 # ANSI color codes
 RED = '\033[0;31m'
 GREEN = '\033[0;32m'
@@ -17,15 +21,17 @@ YELLOW = '\033[1;33m'
 BLUE = '\033[0;34m'
 NC = '\033[0m'  # No Color
 
-def check_file_nesting(filepath: Path) -> List[Tuple[int, str, str]]:
+NUMBERED_ITEM = re.compile(r'^\d+\.\s')
+ROMAN_ITEM = re.compile(r'^\([ivxlcdm]+\)', re.IGNORECASE)
+LETTERED_ITEM = re.compile(r'^\([a-z]\)', re.IGNORECASE)
+
+def check_nesting(content: str) -> List[Tuple[int, str, str]]:
     """
-    Check a markdown file for improper list nesting.
+    Check markdown content for improper list nesting.
     Returns a list of (line_number, issue, line_content) tuples.
     """
     issues = []
-
-    with open(filepath, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
+    lines = content.split('\n')
 
     in_numbered_list = False
     expecting_nested = False
@@ -47,7 +53,7 @@ def check_file_nesting(filepath: Path) -> List[Tuple[int, str, str]]:
             continue
 
         # Check if we're starting a numbered list item
-        if re.match(r'^\d+\.\s', stripped):
+        if NUMBERED_ITEM.match(stripped):
             in_numbered_list = True
             # Check if the line ends with a colon (suggesting nested items follow)
             if stripped.rstrip().endswith(':'):
@@ -56,7 +62,7 @@ def check_file_nesting(filepath: Path) -> List[Tuple[int, str, str]]:
                 expecting_nested = False
 
         # Check for roman numerals that should be nested
-        elif re.match(r'^\([ivxlcdm]+\)', stripped, re.IGNORECASE):
+        elif ROMAN_ITEM.match(stripped):
             # This is a roman numeral list marker
             # Only flag if previous line ended with colon (indicating a list context)
             if in_numbered_list and expecting_nested and not line.startswith('   '):
@@ -75,7 +81,7 @@ def check_file_nesting(filepath: Path) -> List[Tuple[int, str, str]]:
                     ))
 
         # Check for lettered items that should be nested
-        elif re.match(r'^\([a-z]\)', stripped, re.IGNORECASE):
+        elif LETTERED_ITEM.match(stripped):
             # This is a lettered list marker
             # Only flag if previous line ended with colon (indicating a list context)
             if in_numbered_list and expecting_nested and not line.startswith('   '):
@@ -94,7 +100,7 @@ def check_file_nesting(filepath: Path) -> List[Tuple[int, str, str]]:
                     ))
 
         # Reset state if we hit a non-list line
-        elif stripped and not stripped.startswith('(') and not re.match(r'^\d+\.\s', stripped):
+        elif stripped and not stripped.startswith('(') and not NUMBERED_ITEM.match(stripped):
             # Check if it's not a continuation of the previous line
             if not expecting_nested:
                 in_numbered_list = False
@@ -103,22 +109,56 @@ def check_file_nesting(filepath: Path) -> List[Tuple[int, str, str]]:
 
     return issues
 
-def check_all_files(directory: Path, pattern: str = "*.md") -> dict:
+def is_checked_file(filepath: Path) -> bool:
+    """Directory walks skip these directories."""
+    return not any(skip in str(filepath) for skip in ['.git', 'node_modules', 'book/'])
+
+RULES = RuleSet('list-nesting', 'validation/check-list-nesting.py', check_nesting, applies=is_checked_file)
+
+def check_file_nesting(filepath: Path) -> List[Tuple[int, str, str]]:
+    """
+    Check a markdown file for improper list nesting.
+    Returns a list of (line_number, issue, line_content) tuples.
+    """
+    results, failures = lint_files([filepath], [RULES])
+    if filepath in failures:
+        raise OSError(f"Could not read {filepath}: {failures[filepath]}")
+    return results[filepath][RULES.name]
+
+def collect_issues(files: List[Path], results: dict, failures: dict) -> dict:
+    """The files with nesting issues, from lint_files() results."""
+    for filepath in files:
+        if filepath in failures:
+            raise OSError(f"Could not read {filepath}: {failures[filepath]}")
+    return {filepath: results[filepath][RULES.name] for filepath in files if results[filepath][RULES.name]}
+
+def check_all_files(directory: Path, pattern: str = "*.md", jobs: int = 1) -> dict:
     """
     Check all markdown files in a directory for nesting issues.
     """
-    results = {}
-
-    for filepath in directory.rglob(pattern):
-        # Skip certain directories
-        if any(skip in str(filepath) for skip in ['.git', 'node_modules', 'book/']):
-            continue
-
-        issues = check_file_nesting(filepath)
-        if issues:
-            results[filepath] = issues
+    # Skip certain directories
+    files = [filepath for filepath in directory.rglob(pattern) if is_checked_file(filepath)]
+    results, failures = lint_files(files, [RULES], jobs)
+    return collect_issues(files, results, failures)
+
+def print_directory_results(path: Path, results: dict) -> bool:
+    """Print the issues found under a directory. Returns True if there were none."""
+    if results:
+        total_issues = sum(len(issues) for issues in results.values())
+        print(f"{RED}✗{NC} Found {total_issues} nesting issue(s) in {len(results)} file(s):\n")
+
+        for filepath, issues in results.items():
+            rel_path = filepath.relative_to(path) if path != Path('.') else filepath
+            print(f"{YELLOW}{rel_path}{NC}:")
+            for line_num, issue, content in issues[:3]:  # Show first 3 issues per file
+                print(f"  Line {line_num}: {issue}")
+            if len(issues) > 3:
+                print(f"  ... and {len(issues) - 3} more issue(s)")
+            print()
+        return False
 
-    return results
+    print(f"{GREEN}✓{NC} No nesting issues found in {path}")
+    return True
 
 def main():
     """Main function to run the nesting check."""
@@ -131,6 +171,8 @@ def main():
                        help='Attempt to fix nesting issues automatically')
     parser.add_argument('-v', '--verbose', action='store_true',
                        help='Show all files checked, not just those with issues')
+    parser.add_argument('--jobs', '-j', type=int, default=os.cpu_count() or 1,
+                       help='Worker processes for large trees (default: CPU count)')
 
     args = parser.parse_args()
 
@@ -158,21 +200,9 @@ def main():
 
     elif path.is_dir():
         # Check directory
-        results = check_all_files(path)
-
-        if results:
-            total_issues = sum(len(issues) for issues in results.values())
-            print(f"{RED}✗{NC} Found {total_issues} nesting issue(s) in {len(results)} file(s):\n")
-
-            for filepath, issues in results.items():
-                rel_path = filepath.relative_to(path) if path != Path('.') else filepath
-                print(f"{YELLOW}{rel_path}{NC}:")
-                for line_num, issue, content in issues[:3]:  # Show first 3 issues per file
-                    print(f"  Line {line_num}: {issue}")
-                if len(issues) > 3:
-                    print(f"  ... and {len(issues) - 3} more issue(s)")
-                print()
+        results = check_all_files(path, jobs=args.jobs)
 
+        if not print_directory_results(path, results):
             if args.fix:
                 print(f"{BLUE}Fixing nesting issues in all files...{NC}")
                 for filepath in results.keys():
@@ -181,7 +211,6 @@ def main():
 
             return 1
         else:
-            print(f"{GREEN}✓{NC} No nesting issues found in {path}")
             return 0
 
     else:
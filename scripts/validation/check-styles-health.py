@@ -7,10 +7,13 @@ This catches the "disappearing styles" issue early.
 import sys
 import os
 from pathlib import Path
-from bs4 import BeautifulSoup
 import json
 import subprocess
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from utils.html_parser import parse_html
+from utils.page_index import PageIndex
+
 # Colors for output
 RED = '\033[0;31m'
 GREEN = '\033[0;32m'
@@ -69,53 +72,66 @@ def check_source_css_modules():
 
     return True, "CSS source modules are correct"
 
+# Pages whose HTML structure is checked, relative to book/
+SAMPLE_FILES = [
+    'resolutions/1984-Res-72-Municipal-Services.html',
+    'ordinances/1987-Ord-52-Flood.html'
+]
+
+def check_page_structure(page, file_path):
+    """List the HTML structure issues on one indexed page (utils/page_index.py)"""
+    issues = []
+
+    # Check for form field classes
+    form_fields = page.find_all(class_='form-field-filled')
+    if not form_fields:
+        issues.append(f"{file_path}: No form-field-filled classes found")
+
+    # Check for Document Notes structure if expected
+    doc_notes_h2 = page.soup.find('h2', string='Document Notes')
+    if doc_notes_h2:
+        # Should be wrapped in document-note div
+        parent = doc_notes_h2.parent
+        if not parent or 'document-note' not in parent.get('class', []):
+            issues.append(f"{file_path}: Document Notes not wrapped in document-note div")
+
+    # Check for definition-item structure (Section markers)
+    # Look for "Section 1." type text
+    section_markers = page.find_all(class_='definition-marker')
+
+    # If we have section text but no markers, postprocessor hasn't run
+    if not section_markers and page.soup.find(string=lambda text: text and text.strip().startswith('Section ')):
+        issues.append(f"{file_path}: Found 'Section' text but no definition-marker classes")
+
+    return issues
+
+def html_structure_result(issues):
+    """(passed, message) for the HTML structure issues found"""
+    if issues:
+        return False, "HTML structure issues:\n  " + "\n  ".join(issues)
+
+    return True, "HTML structure looks correct"
+
 def check_html_structure(sample_files=None):
     """Check that HTML files have the expected custom classes"""
     book_dir = Path('book')
-    
+
     # Default sample files to check
     if sample_files is None:
-        sample_files = [
-            'resolutions/1984-Res-72-Municipal-Services.html',
-            'ordinances/1987-Ord-52-Flood.html'
-        ]
-    
+        sample_files = SAMPLE_FILES
+
     issues = []
-    
+
     for file_path in sample_files:
         full_path = book_dir / file_path
         if not full_path.exists():
             continue
-            
+
         with open(full_path, 'r', encoding='utf-8') as f:
-            soup = BeautifulSoup(f.read(), 'html.parser')
-        
-        # Check for form field classes
-        form_fields = soup.find_all(class_='form-field-filled')
-        if not form_fields:
-            issues.append(f"{file_path}: No form-field-filled classes found")
-        
-        # Check for Document Notes structure if expected
-        doc_notes_h2 = soup.find('h2', string='Document Notes')
-        if doc_notes_h2:
-            # Should be wrapped in document-note div
-            parent = doc_notes_h2.parent
-            if not parent or 'document-note' not in parent.get('class', []):
-                issues.append(f"{file_path}: Document Notes not wrapped in document-note div")
-        
-        # Check for definition-item structure (Section markers)
-        # Look for "Section 1." type text
-        section_markers = soup.find_all(class_='definition-marker')
-        section_text = soup.find_all(string=lambda text: text and text.strip().startswith('Section '))
-        
-        # If we have section text but no markers, postprocessor hasn't run
-        if section_text and not section_markers:
-            issues.append(f"{file_path}: Found 'Section' text but no definition-marker classes")
-    
-    if issues:
-        return False, "HTML structure issues:\n  " + "\n  ".join(issues)
-    
-    return True, "HTML structure looks correct"
+            page = PageIndex(parse_html(f.read()))
+        issues.extend(check_page_structure(page, file_path))
+
+    return html_structure_result(issues)
 
 def check_server_running():
     """Check if mdbook serve is running (informational only)"""
@@ -133,15 +149,23 @@ def check_server_running():
     except:
         return None, "Could not check server status"
 
-def run_checks(verbose=False, show_details=False):
-    """Run all style health checks"""
+def run_checks(verbose=False, show_details=False, html_issues=None):
+    """
+    Run all style health checks. html_issues are HTML structure issues already
+    found by run-html-checks.py; by default the sample pages are checked here.
+    """
+    if html_issues is None:
+        html_structure = check_html_structure
+    else:
+        html_structure = lambda: html_structure_result(html_issues)
+
     if not show_details:
         # Quiet mode for dev-server - just return status
         all_passed = True
         checks = [
             ("Compiled CSS", check_css_compiled),
             ("CSS Source Modules", check_source_css_modules),
-            ("HTML Structure", check_html_structure),
+            ("HTML Structure", html_structure),
             ("Server Check", check_server_running)
         ]
 
@@ -164,7 +188,7 @@ def run_checks(verbose=False, show_details=False):
     checks = [
         ("Compiled CSS", check_css_compiled),
         ("CSS Source Modules", check_source_css_modules),
-        ("HTML Structure", check_html_structure),
+        ("HTML Structure", html_structure),
         ("Server Check", check_server_running)
     ]
 
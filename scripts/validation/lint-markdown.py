@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Lint Markdown source files with several validators in one pass.
+
+Runs the rule sets of these scripts over each file, reading it once:
+- no-html       validate-no-html.py      (build gate)
+- form-fields   validate-form-fields.py  (build gate)
+- list-nesting  check-list-nesting.py    (opt-in: --rule list-nesting)
+
+Results are cached per file content and rule script (utils/markdown_lint.py),
+so a rebuild only re-lints the documents that changed. Each rule set's report
+is printed exactly as its own script prints it; the standalone scripts still
+work and share the same cache.
+
+Usage:
+    python3 scripts/validation/lint-markdown.py                    # source-documents, build gates
+    python3 scripts/validation/lint-markdown.py source-documents --quiet
+    python3 scripts/validation/lint-markdown.py src --rule form-fields --rule list-nesting
+"""
+
+import os
+import sys
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from utils.markdown_lint import lint_files
+from utils.script_loader import load_script
+
+no_html = load_script('validation/validate-no-html.py')
+form_fields = load_script('validation/validate-form-fields.py')
+list_nesting = load_script('validation/check-list-nesting.py')
+
+RULE_SETS = {rules.RULES.name: rules.RULES for rules in (no_html, form_fields, list_nesting)}
+DEFAULT_RULES = ['no-html', 'form-fields']
+
+
+def report(name, path, files, results, failures, quiet):
+    """Print one rule set's report the way its own script does. Returns True if it passed."""
+    if name == 'no-html':
+        print("🔍 Validating markdown files for HTML content...")
+        print("=" * 50)
+        valid, invalid = no_html.report_directory(files, results, failures)
+        return no_html.print_summary(valid, invalid, quiet)
+
+    if name == 'form-fields':
+        print(f"Validating markdown files in {path}...")
+        validator = form_fields.FormFieldValidator()
+        validator.add_results(files, results, failures)
+        return validator.print_results(len(files), quiet)
+
+    return list_nesting.print_directory_results(path, list_nesting.collect_issues(files, results, failures))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Lint markdown files with several validators in one pass')
+    parser.add_argument('path', nargs='?', default='source-documents',
+                        help='File or directory to lint (default: source-documents)')
+    parser.add_argument('--rule', dest='rules', action='append', choices=list(RULE_SETS),
+                        help=f"Rule set to run (repeatable; default: {', '.join(DEFAULT_RULES)})")
+    parser.add_argument('--quiet', action='store_true', help='Only show errors')
+    parser.add_argument('--jobs', '-j', type=int, default=os.cpu_count() or 1,
+                        help='Worker processes for large trees (default: CPU count)')
+    args = parser.parse_args()
+
+    path = Path(args.path)
+    if not path.exists():
+        print(f"Error: {path} does not exist")
+        return 1
+
+    rule_sets = [RULE_SETS[name] for name in dict.fromkeys(args.rules or DEFAULT_RULES)]
+    if path.is_file():
+        files, filtered = [path], False
+    else:
+        # One walk; each rule set still skips the directories its script skips
+        files, filtered = sorted(path.rglob('*.md')), True
+    results, failures = lint_files(files, rule_sets, args.jobs, filtered=filtered)
+
+    passed = True
+    for index, rule_set in enumerate(rule_sets):
+        if index:
+            print()
+        selected = [filepath for filepath in files if not filtered or rule_set.applies(filepath)]
+        passed = report(rule_set.name, path, selected, results, failures, args.quiet) and passed
+    return 0 if passed else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Single-parse validation runner for the built book/.
+
+Runs the post-build checks with one parse per page:
+- styles           check-styles-health.py       (compiled CSS + HTML structure of its sample pages)
+- list-formatting  validate-list-formatting.py  (ordinances, resolutions, interpretations)
+- list-tests       scripts/tests/test-list-formatting.py (its default pages)
+- tooltips         check-tooltip-styles.py      (CSS and the style guide - no book/ pages)
+
+Every page any check needs is parsed once into a PageIndex
+(utils/page_index.py) - all <p>, <li>, lists and marker spans indexed by name
+and class - and each check runs on that shared index instead of parsing the
+page and walking the tree again. Pages are checked in a process pool, and each
+check's report is printed exactly as its own script prints it. The individual
+scripts still work standalone. build-all.sh Steps 15-16 run the styles and
+list-formatting checks.
+
+Usage:
+    python3 scripts/validation/run-html-checks.py                  # every check
+    python3 scripts/validation/run-html-checks.py --check styles --check list-formatting   # as in build-all.sh
+    python3 scripts/validation/run-html-checks.py --jobs 4
+"""
+
+import io
+import os
+import sys
+import argparse
+from contextlib import redirect_stdout
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from utils.html_parser import parse_html
+from utils.page_index import PageIndex
+from utils.script_loader import load_script
+
+styles = load_script('validation/check-styles-health.py')
+list_formatting = load_script('validation/validate-list-formatting.py')
+list_tests = load_script('tests/test-list-formatting.py')
+tooltips = load_script('validation/check-tooltip-styles.py')
+
+BOOK_DIR = Path('book')
+CHECKS = ['styles', 'list-formatting', 'list-tests', 'tooltips']
+
+
+def plan_pages(checks):
+    """page -> {check: the page's name in that check's report}, for every page a check needs."""
+    pages = {}
+    if 'styles' in checks:
+        for relative_path in styles.SAMPLE_FILES:
+            pages.setdefault(BOOK_DIR / relative_path, {})['styles'] = relative_path
+    if 'list-formatting' in checks:
+        for relative_path in list_formatting.target_files(BOOK_DIR):
+            pages.setdefault(BOOK_DIR / relative_path, {})['list-formatting'] = relative_path
+    if 'list-tests' in checks:
+        for file_path in list_tests.default_files():
+            pages.setdefault(Path(file_path), {})['list-tests'] = file_path
+    return {page: names for page, names in pages.items() if page.exists()}
+
+
+def check_page(filepath, names):
+    """
+    Parse a page once and run each check that wants it on the shared index.
+    Returns (filepath, results, error) - never raises, so one bad page can't
+    take down the pool.
+    """
+    try:
+        with open(filepath, 'r', encoding='utf-8') as f:
+            page = PageIndex(parse_html(f.read()))
+    except Exception as e:
+        # validate-list-formatting.py reports unreadable pages as findings
+        results = {'list-formatting': ([f"Error reading file: {str(e)}"], [])} if 'list-formatting' in names else {}
+        return filepath, results, f"{type(e).__name__}: {e}"
+
+    results = {}
+    try:
+        if 'styles' in names:
+            results['styles'] = styles.check_page_structure(page, names['styles'])
+        if 'list-formatting' in names:
+            try:
+                results['list-formatting'] = list_formatting.validate_page(page, str(filepath))
+            except Exception as e:
+                results['list-formatting'] = ([f"Error reading file: {str(e)}"], [])
+        if 'list-tests' in names:
+            tester = list_tests.ListFormattingTester()
+            log = io.StringIO()
+            with redirect_stdout(log):
+                print(f"\n📋 Testing: {names['list-tests']}")
+                tester.test_page(page, names['list-tests'])
+            results['list-tests'] = (tester.tests_run, tester.tests_passed, tester.failures, log.getvalue())
+    except Exception as e:
+        return filepath, results, f"{type(e).__name__}: {e}"
+    return filepath, results, None
+
+
+def check_pages(pages, jobs=1):
+    """Run check_page on every planned page. Returns (results, errors): page -> {check: result}, page -> error."""
+    results = {}
+    errors = {}
+
+    def finish(result):
+        filepath, page_results, error = result
+        results[filepath] = page_results
+        if error:
+            errors[filepath] = error
+
+    jobs = max(1, min(jobs, len(pages)))
+    if jobs > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            futures = [executor.submit(check_page, filepath, names) for filepath, names in pages.items()]
+            for future in as_completed(futures):
+                finish(future.result())
+    else:
+        for filepath, names in pages.items():
+            finish(check_page(filepath, names))
+    return results, errors
+
+
+def report_styles(pages, results, verbose):
+    issues = [issue for filepath in pages if 'styles' in pages[filepath]
+              for issue in results[filepath].get('styles', [])]
+    return styles.run_checks(verbose=verbose, show_details=True, html_issues=issues) == 0
+
+
+def report_list_formatting(pages, results):
+    print(f"{list_formatting.BLUE}🔍 Validating list formatting in HTML files...{list_formatting.RESET}\n")
+    findings = {}
+    for relative_path in list_formatting.target_files(BOOK_DIR):
+        filepath = BOOK_DIR / relative_path
+        if filepath in pages:
+            findings[relative_path] = results[filepath].get('list-formatting', ([], []))
+    return list_formatting.print_report(findings) == 0
+
+
+def report_list_tests(pages, results):
+    tester = list_tests.ListFormattingTester()
+    for file_path in list_tests.default_files():
+        # A page listed twice gets the same results twice, as when run standalone
+        outcome = results.get(Path(file_path), {}).get('list-tests')
+        if outcome is None:
+            continue
+        tests_run, tests_passed, failures, log = outcome
+        print(log, end='')
+        tester.tests_run += tests_run
+        tester.tests_passed += tests_passed
+        tester.failures.extend(failures)
+    return tester.print_summary()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run the post-build HTML checks with one parse per page')
+    parser.add_argument('--check', dest='checks', action='append', choices=CHECKS,
+                        help='Check to run (repeatable; default: all)')
+    parser.add_argument('--jobs', '-j', type=int, default=os.cpu_count() or 1,
+                        help='Number of worker processes (default: CPU count)')
+    parser.add_argument('--verbose', '-v', action='store_true',
+                        help='Show informational style checks too')
+    args = parser.parse_args()
+
+    if not BOOK_DIR.exists():
+        print("✗ book/ directory not found. Run build first.")
+        return 1
+
+    checks = [check for check in CHECKS if check in (args.checks or CHECKS)]
+    pages = plan_pages(checks)
+    results, errors = check_pages(pages, args.jobs)
+
+    passed = True
+    for filepath, error in errors.items():
+        print(f"  ✗ Error checking {filepath}: {error}")
+        passed = False
+
+    for index, check in enumerate(checks):
+        if index:
+            print()
+        if check == 'styles':
+            passed = report_styles(pages, results, args.verbose) and passed
+        elif check == 'list-formatting':
+            passed = report_list_formatting(pages, results) and passed
+        elif check == 'list-tests':
+            passed = report_list_tests(pages, results) and passed
+        else:
+            passed = tooltips.main() == 0 and passed
+    return 0 if passed else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
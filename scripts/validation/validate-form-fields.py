@@ -10,6 +10,10 @@ import re
 from pathlib import Path
 from typing import List, Tuple, Dict
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from utils.directives import MARKER_PATTERN
+from utils.markdown_lint import RuleSet, lint_files
+
 # ANSI color codes for terminal output
 RED = '\033[0;31m'
 GREEN = '\033[0;32m'
@@ -17,6 +21,85 @@ YELLOW = '\033[1;33m'
 BLUE = '\033[0;34m'
 NC = '\033[0m'  # No Color
 
+def check_form_fields(content: str) -> Dict[str, List[Tuple[int, str]]]:
+    """Lint rule: {'errors': [(line, message)], 'warnings': [...]} for a file's content."""
+    lines = content.split('\n')
+    errors = []
+    warnings = []
+    legacy_warnings = []
+
+    # One scan per line for the pieces of a directive ({{, {{filled, {{filled: and }})
+    for line_num, line in enumerate(lines, 1):
+        has_open = has_close = False
+        filled_open = False     # a {{filled: waiting for its }}
+        filled_colon = filled_missing_colon = False
+        nested = 0
+
+        for marker in MARKER_PATTERN.finditer(line):
+            if marker.group(0) == '}}':
+                has_close = True
+                filled_open = False
+                continue
+            has_open = True
+            if not marker.group('filled'):
+                continue
+            if not marker.group('colon'):
+                filled_missing_colon = True
+                continue
+            filled_colon = True
+            if filled_open:
+                nested += 1
+            filled_open = True
+
+        # Check for unclosed {{filled: tags (no }} after the opening)
+        if filled_open:
+            errors.append((
+                line_num,
+                f"Unclosed {{{{filled:}}}} tag: {line.strip()}"
+            ))
+
+        # Check for orphaned closing brackets
+        if has_close and not has_open:
+            # Check if this might be a closing for a multi-line tag
+            # (for now, we'll warn about these)
+            warnings.append((
+                line_num,
+                f"Orphaned closing brackets '}}': {line.strip()}"
+            ))
+
+        # Check for malformed tags (missing colon)
+        if filled_missing_colon and not filled_colon:
+            errors.append((
+                line_num,
+                f"Malformed tag (missing colon after 'filled'): {line.strip()}"
+            ))
+
+        # Check for nested tags (not supported)
+        for _ in range(nested):
+            warnings.append((
+                line_num,
+                f"Possible nested {{{{filled:}}}} tags detected"
+            ))
+
+        # Check for old underscore patterns that should be migrated
+        if '___' in line and not filled_colon:
+            legacy_warnings.append((
+                line_num,
+                f"Legacy underscore pattern found - consider using {{{{filled:}}}}: {line.strip()[:80]}..."
+            ))
+
+    return {'errors': errors, 'warnings': warnings + legacy_warnings}
+
+
+def is_checked_file(filepath: Path) -> bool:
+    """Directory walks skip these directories."""
+    return not any(skip in str(filepath) for skip in ['.git', 'node_modules', 'book'])
+
+
+RULES = RuleSet('form-fields', 'validation/validate-form-fields.py', check_form_fields, applies=is_checked_file,
+                deps=['utils/directives.py'])
+
+
 class FormFieldValidator:
     def __init__(self):
         self.errors = []
@@ -24,104 +107,33 @@ class FormFieldValidator:
         
     def validate_file(self, filepath: Path) -> bool:
         """Validate a single markdown file for form field issues."""
-        try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                content = f.read()
-                lines = content.split('\n')
-        except Exception as e:
-            self.errors.append((filepath, 0, f"Could not read file: {e}"))
-            return False
-        
-        has_errors = False
-        
-        # Check for unclosed {{filled: tags
-        for line_num, line in enumerate(lines, 1):
-            # Find all {{filled: occurrences
-            if '{{filled:' in line:
-                # Check if each opening has a corresponding closing
-                open_count = line.count('{{filled:')
-                close_count = line.count('}}')
-                
-                # More sophisticated check for unclosed tags
-                remaining = line
-                while '{{filled:' in remaining:
-                    start = remaining.find('{{filled:')
-                    # Look for the closing }} after this opening
-                    after_start = remaining[start:]
-                    
-                    # Find the next }} if it exists
-                    close = after_start.find('}}')
-                    
-                    if close == -1:
-                        # No closing tag found
-                        self.errors.append((
-                            filepath, 
-                            line_num, 
-                            f"Unclosed {{{{filled:}}}} tag: {line.strip()}"
-                        ))
-                        has_errors = True
-                        break
-                    else:
-                        # Move past this complete tag
-                        remaining = remaining[start + close + 2:]
-            
-            # Check for orphaned closing brackets
-            if '}}' in line and '{{' not in line:
-                # Check if this might be a closing for a multi-line tag
-                # (for now, we'll warn about these)
-                self.warnings.append((
-                    filepath,
-                    line_num,
-                    f"Orphaned closing brackets '}}': {line.strip()}"
-                ))
-            
-            # Check for malformed tags (missing colon)
-            if '{{filled' in line and '{{filled:' not in line:
-                self.errors.append((
-                    filepath,
-                    line_num,
-                    f"Malformed tag (missing colon after 'filled'): {line.strip()}"
-                ))
-                has_errors = True
-            
-            # Check for nested tags (not supported)
-            if '{{filled:' in line:
-                # Simple check for nested tags
-                parts = line.split('{{filled:')
-                for i, part in enumerate(parts[1:], 1):
-                    if '{{filled:' in part.split('}}')[0] if '}}' in part else part:
-                        self.warnings.append((
-                            filepath,
-                            line_num,
-                            f"Possible nested {{{{filled:}}}} tags detected"
-                        ))
-        
-        # Check for old underscore patterns that should be migrated
-        for line_num, line in enumerate(lines, 1):
-            if '___' in line and '{{filled:' not in line:
-                self.warnings.append((
-                    filepath,
-                    line_num,
-                    f"Legacy underscore pattern found - consider using {{{{filled:}}}}: {line.strip()[:80]}..."
-                ))
-        
-        return not has_errors
-    
-    def validate_directory(self, directory: Path) -> bool:
-        """Validate all markdown files in a directory."""
+        return self.validate_files([filepath])
+
+    def validate_files(self, filepaths: List[Path], jobs: int = 1) -> bool:
+        """Validate markdown files (linting only those that changed since the last run)."""
+        results, failures = lint_files(filepaths, [RULES], jobs)
+        return self.add_results(filepaths, results, failures)
+
+    def add_results(self, filepaths: List[Path], results: Dict, failures: Dict) -> bool:
+        """Collect the issues for filepaths from lint_files() results. Returns False if any has errors."""
         all_valid = True
-        files_checked = 0
-        
-        for md_file in directory.rglob('*.md'):
-            # Skip certain directories
-            if any(skip in str(md_file) for skip in ['.git', 'node_modules', 'book']):
+        for filepath in filepaths:
+            if filepath in failures:
+                self.errors.append((filepath, 0, f"Could not read file: {failures[filepath]}"))
+                all_valid = False
                 continue
-                
-            files_checked += 1
-            if not self.validate_file(md_file):
+            issues = results[filepath][RULES.name]
+            self.errors.extend((filepath, line_num, message) for line_num, message in issues['errors'])
+            self.warnings.extend((filepath, line_num, message) for line_num, message in issues['warnings'])
+            if issues['errors']:
                 all_valid = False
-        
-        return all_valid, files_checked
+        return all_valid
+    
+    def validate_directory(self, directory: Path, jobs: int = 1) -> bool:
+        """Validate all markdown files in a directory."""
+        # Skip certain directories
+        files = [md_file for md_file in directory.rglob('*.md') if is_checked_file(md_file)]
+        return self.validate_files(files, jobs), len(files)
     
     def print_report(self):
         """Print validation report with colored output."""
@@ -142,6 +154,23 @@ class FormFieldValidator:
         if not self.errors and not self.warnings:
             print(f"{GREEN}✅ All form field tags are valid!{NC}")
     
+    def print_results(self, files_checked: int, quiet: bool = False) -> bool:
+        """Print the report (unless quiet and error-free) and a summary. Returns True if no errors."""
+        if not quiet or self.errors:
+            self.print_report()
+        
+        # Summary
+        print(f"\n📊 Checked {files_checked} file(s)")
+        error_count = self.get_error_count()
+        warning_count = self.get_warning_count()
+        
+        if error_count > 0:
+            print(f"{RED}   {error_count} error(s) found{NC}")
+        if warning_count > 0 and not quiet:
+            print(f"{YELLOW}   {warning_count} warning(s) found{NC}")
+        
+        return error_count == 0
+    
     def get_error_count(self) -> int:
         """Return the number of errors found."""
         return len(self.errors)
@@ -162,6 +191,8 @@ def main():
                        help='Attempt to auto-fix simple issues (adds closing brackets)')
     parser.add_argument('--quiet', action='store_true',
                        help='Only show errors, not warnings')
+    parser.add_argument('--jobs', '-j', type=int, default=os.cpu_count() or 1,
+                       help='Worker processes for large trees (default: CPU count)')
     
     args = parser.parse_args()
     
@@ -174,7 +205,7 @@ def main():
         files_checked = 1
     elif path.is_dir():
         print(f"Validating markdown files in {path}...")
-        is_valid, files_checked = validator.validate_directory(path)
+        is_valid, files_checked = validator.validate_directory(path, args.jobs)
     else:
         print(f"{RED}Error: {path} not found{NC}")
         sys.exit(1)
@@ -208,22 +239,8 @@ def main():
         if fixed_count > 0:
             print(f"\n{GREEN}Fixed {fixed_count} issue(s). Please review the changes.{NC}")
     
-    # Print report
-    if not args.quiet or validator.errors:
-        validator.print_report()
-    
-    # Summary
-    print(f"\n📊 Checked {files_checked} file(s)")
-    error_count = validator.get_error_count()
-    warning_count = validator.get_warning_count()
-    
-    if error_count > 0:
-        print(f"{RED}   {error_count} error(s) found{NC}")
-    if warning_count > 0 and not args.quiet:
-        print(f"{YELLOW}   {warning_count} warning(s) found{NC}")
-    
     # Exit with error code if errors found
-    sys.exit(1 if error_count > 0 else 0)
+    sys.exit(0 if validator.print_results(files_checked, args.quiet) else 1)
 
 
 if __name__ == '__main__':
@@ -6,14 +6,20 @@ Checks for:
 - Numeric lists are properly wrapped in list-marker-numeric spans
 - Lists aren't collapsed into single paragraphs
 - Nested lists maintain proper structure
+
+The checks run on a PageIndex (utils/page_index.py), so run-html-checks.py
+can share one parse per page with the other post-build checks.
 """
 
 import os
 import re
 import sys
 from pathlib import Path
-from bs4 import BeautifulSoup
-from typing import List, Tuple
+from typing import Dict, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from utils.html_parser import parse_html
+from utils.page_index import PageIndex
 
 # ANSI color codes
 GREEN = '\033[0;32m'
@@ -22,7 +28,7 @@ YELLOW = '\033[1;33m'
 BLUE = '\033[0;34m'
 RESET = '\033[0m'
 
-def check_roman_numerals(soup: BeautifulSoup, file_path: str) -> List[str]:
+def check_roman_numerals(page: PageIndex, file_path: str) -> List[str]:
     """Check for improperly formatted roman numerals."""
     errors = []
 
@@ -30,15 +36,15 @@ def check_roman_numerals(soup: BeautifulSoup, file_path: str) -> List[str]:
     roman_pattern = r'\([ivxlcdm]+\)'
 
     # Check paragraphs that might contain collapsed lists
-    for p in soup.find_all('p'):
-        text = p.get_text()
+    for p in page.find_all('p'):
+        text = page.text(p)
         # Look for multiple roman numerals in a single paragraph (indicates collapsed list)
         matches = re.findall(roman_pattern, text, re.IGNORECASE)
         if len(matches) > 1:
             errors.append(f"Multiple roman numerals in single paragraph (likely collapsed list): {text[:100]}...")
 
         # Check if roman numerals are not in proper list format
-        if matches and not p.find('span', class_='list-marker-roman'):
+        if matches and not page.find(p, 'span', 'list-marker-roman'):
             for match in matches:
                 # Check if this is actually in a list item
                 parent = p.parent
@@ -47,7 +53,7 @@ def check_roman_numerals(soup: BeautifulSoup, file_path: str) -> List[str]:
 
     return errors
 
-def check_numeric_lists(soup: BeautifulSoup, file_path: str) -> List[str]:
+def check_numeric_lists(page: PageIndex, file_path: str) -> List[str]:
     """Check for improperly formatted numeric lists."""
     errors = []
 
@@ -55,14 +61,14 @@ def check_numeric_lists(soup: BeautifulSoup, file_path: str) -> List[str]:
     numeric_pattern = r'\((\d+)\)'
 
     # Check paragraphs for collapsed numeric lists
-    for p in soup.find_all('p'):
-        text = p.get_text()
+    for p in page.find_all('p'):
+        text = page.text(p)
         matches = re.findall(numeric_pattern, text)
         if len(matches) > 1:
             errors.append(f"Multiple numeric markers in single paragraph (likely collapsed list): {text[:100]}...")
 
         # Check if numeric markers are properly formatted
-        if matches and not p.find('span', class_='list-marker-numeric'):
+        if matches and not page.find(p, 'span', 'list-marker-numeric'):
             for match in matches:
                 parent = p.parent
                 if not (parent and parent.name == 'li'):
@@ -70,22 +76,22 @@ def check_numeric_lists(soup: BeautifulSoup, file_path: str) -> List[str]:
 
     return errors
 
-def check_list_structure(soup: BeautifulSoup, file_path: str) -> List[str]:
+def check_list_structure(page: PageIndex, file_path: str) -> List[str]:
     """Check for proper list structure and nesting."""
     errors = []
 
     # Check for lists with proper class attributes
-    lists = soup.find_all(['ul', 'ol'])
+    lists = page.find_all(['ul', 'ol'])
     for lst in lists:
         # Check if numeric/roman lists have proper classes
-        if lst.find('span', class_='list-marker-roman') and 'roman-list' not in lst.get('class', []):
+        if page.find(lst, 'span', 'list-marker-roman') and 'roman-list' not in lst.get('class', []):
             errors.append("List contains roman numerals but missing 'roman-list' class")
-        if lst.find('span', class_='list-marker-numeric') and 'numeric-list' not in lst.get('class', []):
+        if page.find(lst, 'span', 'list-marker-numeric') and 'numeric-list' not in lst.get('class', []):
             errors.append("List contains numeric markers but missing 'numeric-list' class")
 
     # Check for orphaned list markers (not in lists)
     orphaned_markers = []
-    for span in soup.find_all('span', class_=['list-marker-roman', 'list-marker-numeric']):
+    for span in page.find_all('span', ['list-marker-roman', 'list-marker-numeric']):
         # Check if this marker is actually in a list
         parent = span.parent
         in_list = False
@@ -96,16 +102,17 @@ def check_list_structure(soup: BeautifulSoup, file_path: str) -> List[str]:
             parent = parent.parent
 
         if not in_list:
-            marker_text = span.get_text()
+            marker_text = page.text(span)
             orphaned_markers.append(f"Orphaned list marker '{marker_text}' not in proper list structure")
 
     errors.extend(orphaned_markers)
 
     return errors
 
-def check_specific_known_issues(soup: BeautifulSoup, file_path: str) -> List[str]:
+def check_specific_known_issues(page: PageIndex, file_path: str) -> List[str]:
     """Check for specific known problematic sections."""
     errors = []
+    soup = page.soup
 
     # Check Section 4.3-3 in Ord 52 specifically (known problem area)
     if '1987-Ord-52-Flood' in file_path:
@@ -133,51 +140,41 @@ def check_specific_known_issues(soup: BeautifulSoup, file_path: str) -> List[str
 
     return errors
 
-def validate_file(file_path: str) -> Tuple[List[str], List[str]]:
-    """Validate a single HTML file for list formatting issues."""
+def validate_page(page: PageIndex, file_path: str) -> Tuple[List[str], List[str]]:
+    """Run every list formatting check on an indexed page. Returns (errors, warnings)."""
     errors = []
     warnings = []
 
+    # Run all checks
+    errors.extend(check_roman_numerals(page, file_path))
+    errors.extend(check_numeric_lists(page, file_path))
+    errors.extend(check_list_structure(page, file_path))
+    errors.extend(check_specific_known_issues(page, file_path))
+
+    # Warnings for potential issues
+    # Check if file has any lists at all (might indicate processing didn't run)
+    lists = page.find_all(['ul', 'ol'])
+    if not lists and ('ordinances' in file_path or 'resolutions' in file_path):
+        # Check if there are patterns that should be lists
+        text = page.text(page.soup)
+        if re.search(r'\(\d+\)|\([ivxlcdm]+\)', text, re.IGNORECASE):
+            warnings.append("File contains list patterns but no actual list elements - postprocessing may have failed")
+
+    return errors, warnings
+
+def validate_file(file_path: str) -> Tuple[List[str], List[str]]:
+    """Validate a single HTML file for list formatting issues."""
     try:
         with open(file_path, 'r', encoding='utf-8') as f:
             content = f.read()
 
-        soup = BeautifulSoup(content, 'html.parser')
-
-        # Run all checks
-        errors.extend(check_roman_numerals(soup, file_path))
-        errors.extend(check_numeric_lists(soup, file_path))
-        errors.extend(check_list_structure(soup, file_path))
-        errors.extend(check_specific_known_issues(soup, file_path))
-
-        # Warnings for potential issues
-        # Check if file has any lists at all (might indicate processing didn't run)
-        lists = soup.find_all(['ul', 'ol'])
-        if not lists and ('ordinances' in file_path or 'resolutions' in file_path):
-            # Check if there are patterns that should be lists
-            text = soup.get_text()
-            if re.search(r'\(\d+\)|\([ivxlcdm]+\)', text, re.IGNORECASE):
-                warnings.append("File contains list patterns but no actual list elements - postprocessing may have failed")
+        return validate_page(PageIndex(parse_html(content)), file_path)
 
     except Exception as e:
-        errors.append(f"Error reading file: {str(e)}")
-
-    return errors, warnings
-
-def main():
-    """Main validation function."""
-    book_dir = Path('book')
-
-    if not book_dir.exists():
-        print(f"{RED}✗ book/ directory not found. Run build first.{RESET}")
-        sys.exit(1)
-
-    print(f"{BLUE}🔍 Validating list formatting in HTML files...{RESET}\n")
-
-    total_errors = []
-    total_warnings = []
-    files_checked = 0
+        return [f"Error reading file: {str(e)}"], []
 
+def target_files(book_dir: Path) -> List[str]:
+    """Pages to check, relative to book_dir (known problem files first)."""
     # Check specific files that commonly have lists
     target_files = [
         'ordinances/1987-Ord-52-Flood.html',
@@ -193,16 +190,13 @@ def main():
             if str(relative_path) not in target_files:
                 target_files.append(str(relative_path))
 
-    for relative_path in target_files:
-        file_path = book_dir / relative_path
-        if file_path.exists():
-            files_checked += 1
-            errors, warnings = validate_file(str(file_path))
+    return target_files
 
-            if errors:
-                total_errors.append((str(relative_path), errors))
-            if warnings:
-                total_warnings.append((str(relative_path), warnings))
+def print_report(results: Dict[str, Tuple[List[str], List[str]]]) -> int:
+    """Print findings for the checked pages (relative path -> (errors, warnings)); returns the exit code."""
+    total_errors = [(file_path, errors) for file_path, (errors, _) in results.items() if errors]
+    total_warnings = [(file_path, warnings) for file_path, (_, warnings) in results.items() if warnings]
+    files_checked = len(results)
 
     # Print results
     print(f"📊 Checked {files_checked} file(s)\n")
@@ -237,5 +231,23 @@ def main():
         print(f"{YELLOW}⚠️  List formatting validation passed with warnings{RESET}")
         return 0
 
+def main():
+    """Main validation function."""
+    book_dir = Path('book')
+
+    if not book_dir.exists():
+        print(f"{RED}✗ book/ directory not found. Run build first.{RESET}")
+        sys.exit(1)
+
+    print(f"{BLUE}🔍 Validating list formatting in HTML files...{RESET}\n")
+
+    results = {}
+    for relative_path in target_files(book_dir):
+        file_path = book_dir / relative_path
+        if file_path.exists():
+            results[relative_path] = validate_file(str(file_path))
+
+    return print_report(results)
+
 if __name__ == '__main__':
     sys.exit(main())
\ No newline at end of file
@@ -11,10 +11,14 @@ Exceptions:
 - <br> tags might be needed in some cases (but should be rare)
 """
 
+import os
 import sys
 import re
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from utils.markdown_lint import RuleSet, lint_files
 
 # HTML tags that should NEVER appear in our markdown files
 FORBIDDEN_TAGS = [
@@ -61,49 +65,83 @@ def find_html_tags(content: str, filename: str) -> List[Tuple[int, str, str]]:
     
     return issues
 
-def validate_file(filepath: Path) -> bool:
-    """Validate a single markdown file.
-    
-    Returns True if valid, False if HTML found.
-    """
-    try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-    except Exception as e:
-        print(f"Error reading {filepath}: {e}")
+def check_no_html(content: str) -> List[Tuple[int, str, str]]:
+    """Lint rule: the HTML tags in a file's content."""
+    return find_html_tags(content, '')
+
+def is_source_file(filepath: Path) -> bool:
+    """Generated directories aren't checked in directory walks."""
+    return '/src/' not in str(filepath) and '/book/' not in str(filepath)
+
+RULES = RuleSet('no-html', 'validation/validate-no-html.py', check_no_html, applies=is_source_file)
+
+def report_file(filepath: Path, results: Dict, failures: Dict) -> bool:
+    """Print a file's issues from lint_files() results. Returns True if valid, False if HTML found."""
+    if filepath in failures:
+        print(f"Error reading {filepath}: {failures[filepath]}")
         return False
-    
-    issues = find_html_tags(content, str(filepath))
-    
+
+    issues = results[filepath][RULES.name]
     if issues:
         print(f"\n❌ {filepath}")
         for line_num, tag, line_content in issues:
             print(f"   Line {line_num}: <{tag}> tag found")
             print(f"   {line_content[:80]}...")
         return False
-    
+
     return True
 
-def validate_directory(directory: Path) -> Tuple[int, int]:
-    """Validate all markdown files in a directory.
+def validate_file(filepath: Path) -> bool:
+    """Validate a single markdown file.
     
-    Returns (valid_count, invalid_count).
+    Returns True if valid, False if HTML found.
     """
+    results, failures = lint_files([filepath], [RULES])
+    return report_file(filepath, results, failures)
+
+def report_directory(files: List[Path], results: Dict, failures: Dict) -> Tuple[int, int]:
+    """Print the issues for a directory's files. Returns (valid_count, invalid_count)."""
     valid = 0
     invalid = 0
     
-    for filepath in directory.rglob('*.md'):
-        # Skip generated directories
-        if '/src/' in str(filepath) or '/book/' in str(filepath):
-            continue
-            
-        if validate_file(filepath):
+    for filepath in files:
+        if report_file(filepath, results, failures):
             valid += 1
         else:
             invalid += 1
     
     return valid, invalid
 
+def validate_directory(directory: Path, jobs: int = 1) -> Tuple[int, int]:
+    """Validate all markdown files in a directory.
+    
+    Returns (valid_count, invalid_count).
+    """
+    # Skip generated directories
+    files = [filepath for filepath in directory.rglob('*.md') if is_source_file(filepath)]
+    results, failures = lint_files(files, [RULES], jobs)
+    return report_directory(files, results, failures)
+
+def print_summary(valid: int, invalid: int, quiet: bool = False) -> bool:
+    """Print the directory results. Returns True if every file is clean."""
+    print("\n" + "=" * 50)
+    print(f"📊 Results:")
+    print(f"   ✅ Valid files: {valid}")
+    print(f"   ❌ Files with HTML: {invalid}")
+    
+    if invalid > 0:
+        print("\n⚠️  HTML tags found in source files!")
+        print("   This could bypass our processing pipeline.")
+        print("   Consider using markdown syntax instead:")
+        print("   • Use **text** for bold, not <strong>")
+        print("   • Use *text* for italic, not <em>")
+        print("   • Use [text](url) for links, not <a>")
+        print("   • Use markdown lists, not <ul>/<ol>")
+        return False
+    if not quiet:
+        print("\n✅ All files are clean - no HTML found!")
+    return True
+
 def main():
     """Main validation function."""
     import argparse
@@ -113,6 +151,8 @@ def main():
                       help='File or directory to validate')
     parser.add_argument('--quiet', action='store_true',
                       help='Only show errors')
+    parser.add_argument('--jobs', '-j', type=int, default=os.cpu_count() or 1,
+                      help='Worker processes for large trees (default: CPU count)')
     
     args = parser.parse_args()
     
@@ -137,26 +177,8 @@ def main():
             print(f"Error: {path} is not a markdown file")
             sys.exit(1)
     else:
-        valid, invalid = validate_directory(path)
-        
-        print("\n" + "=" * 50)
-        print(f"📊 Results:")
-        print(f"   ✅ Valid files: {valid}")
-        print(f"   ❌ Files with HTML: {invalid}")
-        
-        if invalid > 0:
-            print("\n⚠️  HTML tags found in source files!")
-            print("   This could bypass our processing pipeline.")
-            print("   Consider using markdown syntax instead:")
-            print("   • Use **text** for bold, not <strong>")
-            print("   • Use *text* for italic, not <em>")
-            print("   • Use [text](url) for links, not <a>")
-            print("   • Use markdown lists, not <ul>/<ol>")
-            sys.exit(1)
-        else:
-            if not args.quiet:
-                print("\n✅ All files are clean - no HTML found!")
-            sys.exit(0)
+        valid, invalid = validate_directory(path, args.jobs)
+        sys.exit(0 if print_summary(valid, invalid, args.quiet) else 1)
 
 if __name__ == '__main__':
     main()
\ No newline at end of file